@@ -1,10 +1,8 @@
 # Email verification fixed - Flask-Mail 0.9.1 syntax
 import os
-import time  # ← ADD THIS IMPORT
-import uuid
-from datetime import date, datetime, timedelta
-from math import ceil
-from werkzeug.utils import secure_filename
+import click
+import hashlib
+from datetime import date, datetime
 from werkzeug.security import generate_password_hash, check_password_hash
 from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify, make_response
 from flask_sqlalchemy import SQLAlchemy
@@ -12,11 +10,29 @@ from flask_login import LoginManager, login_user, logout_user, login_required, c
 from flask_migrate import Migrate
 from itsdangerous import URLSafeTimedSerializer, SignatureExpired, BadSignature
 from sqlalchemy import or_, text
+from sqlalchemy.orm import joinedload, selectinload
 from dotenv import load_dotenv
 from functools import wraps
 
 
-from models import db, User, Property, Booking, Billing, Message, Policy, HelpSupport, PropertyImage, Review
+from models import db, User, Property, Booking, Billing, Message, Policy, HelpSupport, PropertyImage, Review, PropertyViewStat, reconcile_property_aggregates, backfill_property_amenities, rebuild_platform_stats, subtract_platform_stats, subtract_bookings
+from listings import (
+    parse_listing_filters, get_page_args, paginate_listing, listing_projection,
+    keyset_listing_page, DEFAULT_PER_PAGE, MAX_PER_PAGE
+)
+from facets import facet_cache, get_facet_counts
+from search import init_search_index, index_property, remove_property_from_index, rebuild_search_index, search_properties
+from conditional import listing_stamps, property_stamps, page_etag, not_modified, with_validators
+from storage import IMMUTABLE_CACHE_CONTROL, init_storage, push_local_uploads
+from assets import asset_url, build_manifest, is_immutable_static
+from compression import init_compression, benchmark as benchmark_compression
+from stats import snapshot_admin_stats, benchmark_admin_stats
+from dashboard import WIDGETS, dashboard_cache, invalidate_widgets, landlord_bookings, landlord_bills
+from uploads import REFERENCE_COLUMNS, UploadRequest, upload_error, save_upload, deduplicate_uploads
+from filegc import file_collector, release_upload, sweep_orphans, DEFAULT_SWEEP_MIN_AGE
+from images import backfill_image_variants, image_src, image_srcset, process_property_image, process_user_image
+from reviews import get_review_args, paginate_reviews
+from viewcounter import view_counter, rebuild_view_rollups, DEFAULT_FLUSH_INTERVAL
 
 # Load environment variables
 load_dotenv()
@@ -70,9 +86,22 @@ print(f"✅ [DATABASE] Final database URL configured")
 
 # File upload configuration
 app.config['MAX_IMAGE_COUNT'] = 10
-app.config['MAX_CONTENT_LENGTH'] = 5 * 1024 * 1024  # 5MB
+app.config['MAX_UPLOAD_SIZE'] = 5 * 1024 * 1024  # 5MB per file
+# Whole request: a full set of images plus the regular form fields
+app.config['MAX_CONTENT_LENGTH'] = app.config['MAX_IMAGE_COUNT'] * app.config['MAX_UPLOAD_SIZE'] + 1024 * 1024
 app.config['UPLOAD_FOLDER'] = os.path.join(BASE_DIR, 'static', 'uploads')
+# Oldest full rebuild of the admin stats snapshot (seconds) before pages rebuild it
+app.config['STATS_MAX_STALENESS'] = int(os.environ.get('STATS_MAX_STALENESS', 900))
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg'}
+# Stream uploaded files to disk (size, magic bytes and hash checked per chunk)
+app.request_class = UploadRequest
+# Local disk or S3-compatible bucket, from STORAGE_BACKEND
+upload_storage = init_storage(app)
+# gzip/brotli for dynamic responses; precompressed files for static/dist
+init_compression(app)
+
+# Responsive image helpers for templates (srcset from recorded variants)
+app.jinja_env.globals.update(image_src=image_src, image_srcset=image_srcset, asset_url=asset_url)
 
 
 
@@ -341,10 +370,7 @@ def debug_registration():
                 license_file = request.files.get('permit')
                 if license_file and license_file.filename:
                     if allowed_file(license_file):
-                        original_filename = secure_filename(license_file.filename)
-                        filename = f"{datetime.now().strftime('%Y%m%d%H%M%S')}_{original_filename}"
-                        save_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                        license_file.save(save_path)
+                        filename = save_upload(license_file, app.config['UPLOAD_FOLDER'])
                         debug_steps.append("✅ Step 6: License file saved")
                     else:
                         debug_steps.append("❌ Invalid license file")
@@ -489,19 +515,10 @@ def verify_token(token, expiration=86400):
         return None
 
 def allowed_file(file):
-    """Check if file is allowed"""
-    if not hasattr(file, 'filename'):
-        return False
-    filename = file.filename
-    if not filename or '.' not in filename:
-        return False
-    ext = filename.rsplit('.', 1)[1].lower()
-    if ext not in ALLOWED_EXTENSIONS:
-        return False
-    file.seek(0, os.SEEK_END)
-    size = file.tell()
-    file.seek(0)
-    if size > app.config['MAX_CONTENT_LENGTH']:
+    """Check if file is allowed (PNG/JPEG content, under MAX_UPLOAD_SIZE)"""
+    error = upload_error(file)
+    if error:
+        print(f"⚠️ [UPLOAD] Rejected {getattr(file, 'filename', None)!r}: {error}")
         return False
     return True
 
@@ -598,7 +615,12 @@ def add_security_headers(response):
         response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
         response.headers['Pragma'] = 'no-cache'
         response.headers['Expires'] = '0'
-    else:
+    elif (request.endpoint == 'static' and response.status_code < 400
+          and is_immutable_static(request.view_args.get('filename', ''))):
+        # Fingerprinted assets and content-addressed uploads never change
+        response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    elif 'Cache-Control' not in response.headers:
+        # Views that set their own policy (e.g. per-user pages with ETags) keep it
         response.headers['Cache-Control'] = 'public, max-age=300'
     
     return response
@@ -661,6 +683,18 @@ def health_check():
             "database": "disconnected",
             "error": str(e)
         }), 500
+@app.route('/admin/cache-stats')
+@login_required
+def admin_cache_stats():
+    """Hit ratio, size and limits of the in-process caches (this worker only)"""
+    if current_user.role != 'admin':
+        return jsonify({'error': 'Admins only'}), 403
+    return jsonify({
+        'pid': os.getpid(),
+        'dashboard': dashboard_cache.stats(),
+        'facets': facet_cache.stats(),
+    })
+
 @app.route('/')
 def home():
     """Home page - redirect based on login status"""
@@ -732,9 +766,7 @@ def register():
                         flash("Invalid license file. Use PNG, JPG, or JPEG under 5MB.", "danger")
                         return redirect(url_for('register'))
                     
-                    original_filename = secure_filename(license_file.filename)
-                    filename = f"license_{int(time.time())}_{original_filename}"
-                    license_file.save(os.path.join(app.config['UPLOAD_FOLDER'], filename))
+                    filename = save_upload(license_file, app.config['UPLOAD_FOLDER'])
 
             # 🚨 TEMPORARY FIX: AUTO-VERIFY ALL USERS (Remove this later!)
             new_user = User(
@@ -752,6 +784,7 @@ def register():
             db.session.add(new_user)
             db.session.commit()
             print(f"✅ [REGISTRATION] User created (AUTO-VERIFIED): {email}")
+            process_user_image(app, new_user, 'license_image')
 
             flash("🎉 Registration successful! You can login immediately.", "success")
             return redirect(url_for('login'))
@@ -1172,6 +1205,7 @@ def dashboard():
             'properties': [],
             'pending_bookings': [],
             'tenant_bills': [],
+            'upcoming_bills': [],
             'chart_image': None,
             'policies': [],
             'messages': [],
@@ -1192,61 +1226,29 @@ def dashboard():
             'pending_bookings_count': 0,
             'total_bills': 0,
             'paid_bills': 0,
-            'unpaid_bills': 0
+            'unpaid_bills': 0,
+            'stats_as_of': None,
+            'view_period': 'week',
+            'view_labels': [],
+            'view_stats': []
         }
 
         if user.role == 'admin':
             print("🔍 [DASHBOARD] Loading admin dashboard...")
             
             try:
-                # Admin data with booking counts
-                total_bookings = Booking.query.count() or 0
-                approved_bookings = Booking.query.filter_by(status='approved').count() or 0
-                pending_bookings_count = Booking.query.filter_by(status='pending').count() or 0
-                
-                total_bills = Billing.query.count() or 0
-                paid_bills = Billing.query.filter_by(status='paid').count() or 0
-                unpaid_bills = Billing.query.filter_by(status='unpaid').count() or 0
-
+                # Counts and commission totals from the platform_stat snapshot
+                safe_data.update(snapshot_admin_stats(app.config['STATS_MAX_STALENESS']))
                 safe_data.update({
-                    'total_users': User.query.count() or 0,
-                    'total_landlords': User.query.filter_by(role='landlord').count() or 0,
-                    'total_tenants': User.query.filter_by(role='tenant').count() or 0,
-                    'total_properties': Property.query.count() or 0,
-                    'pending_verifications': User.query.filter_by(
-                        role='landlord', 
-                        is_approved_by_admin=False
-                    ).count() or 0,
-                    'pending_tickets': HelpSupport.query.filter_by(status='pending').count() or 0,
                     'recent_tickets': HelpSupport.query.order_by(
                         HelpSupport.timestamp.desc()
                     ).limit(5).all() or [],
                     'recent_users': User.query.order_by(
                         User.created_at.desc()
                     ).limit(5).all() or [],
-                    # ADD BOOKING COUNTS:
-                    'total_bookings': total_bookings,
-                    'approved_bookings': approved_bookings,
-                    'pending_bookings_count': pending_bookings_count,
-                    'total_bills': total_bills,
-                    'paid_bills': paid_bills,
-                    'unpaid_bills': unpaid_bills
                 })
                 
-                # Calculate commissions
-                paid_bills_list = Billing.query.filter_by(status='paid').all() or []
-                safe_data['total_commission'] = sum(
-                    getattr(bill, 'admin_commission', 0) or 0 
-                    for bill in paid_bills_list
-                )
-                
-                unpaid_bills_list = Billing.query.filter_by(status='unpaid').all() or []
-                safe_data['pending_commission'] = sum(
-                    getattr(bill, 'amount', 0) * 0.05 
-                    for bill in unpaid_bills_list
-                )
-                
-                print(f"✅ [DASHBOARD-ADMIN] Bookings - Total: {total_bookings}, Approved: {approved_bookings}, Pending: {pending_bookings_count}")
+                print(f"✅ [DASHBOARD-ADMIN] Bookings - Total: {safe_data['total_bookings']}, Approved: {safe_data['approved_bookings']}, Pending: {safe_data['pending_bookings_count']}")
                 
                 return render_template('admin_dashboard.html', **safe_data)
                 
@@ -1264,169 +1266,26 @@ def dashboard():
             if request.method == 'POST':
                 file = request.files.get('trend_image')
                 if file and file.filename != "":
+                    if not allowed_file(file):
+                        flash("Invalid file type or size exceeds 5MB!", "danger")
+                        return redirect(url_for('dashboard'))
                     try:
-                        import time
-                        filename = f"{int(time.time())}_{secure_filename(file.filename)}"
-                        upload_path = os.path.join('static/uploads', filename)
-                        file.save(upload_path)
-                        user.trend_image = filename
+                        old_trend_image = user.trend_image
+                        user.trend_image = save_upload(file, app.config['UPLOAD_FOLDER'])
                         db.session.commit()
+                        release_upload(old_trend_image)
                         flash("Trend image uploaded successfully!", "success")
                     except Exception as e:
                         print(f"❌ [DASHBOARD] Upload error: {e}")
                         flash("Error uploading trend image.", "danger")
                     return redirect(url_for('dashboard'))
 
-            try:
-                # Landlord data - SIMPLIFIED AND FIXED
-                properties = Property.query.filter_by(landlord_id=user.id).all() or []
-                
-                # FIXED: Get all bookings for landlord's properties
-                property_ids = [prop.id for prop in properties]
-                
-                # Total bookings count
-                total_bookings = Booking.query.filter(Booking.property_id.in_(property_ids)).count() if property_ids else 0
-                
-                # Approved bookings count
-                approved_bookings = Booking.query.filter(
-                    Booking.property_id.in_(property_ids),
-                    Booking.status == 'approved'
-                ).count() if property_ids else 0
-                
-                # Pending bookings count
-                pending_bookings_count = Booking.query.filter(
-                    Booking.property_id.in_(property_ids), 
-                    Booking.status == 'pending'
-                ).count() if property_ids else 0
-                
-                # Get pending bookings for display
-                pending_bookings_list = []
-                for prop in properties:
-                    prop_pending = Booking.query.filter_by(
-                        property_id=prop.id,
-                        status='pending'
-                    ).all()
-                    pending_bookings_list.extend(prop_pending)
-
-                # Get bills count
-                total_bills = Billing.query.filter(Billing.property_id.in_(property_ids)).count() if property_ids else 0
-                paid_bills = Billing.query.filter(
-                    Billing.property_id.in_(property_ids),
-                    Billing.status == 'paid'
-                ).count() if property_ids else 0
-                unpaid_bills = Billing.query.filter(
-                    Billing.property_id.in_(property_ids),
-                    Billing.status == 'unpaid'
-                ).count() if property_ids else 0
-
-                # Get tenant bills for display
-                tenant_bills = []
-                for prop in properties:
-                    try:
-                        bills = Billing.query.filter_by(property_id=prop.id).all()
-                        tenant_bills.extend(bills)
-                    except Exception as e:
-                        print(f"⚠️ [DASHBOARD] Error getting bills for property {prop.id}: {e}")
-                        continue
-
-                # Get policies
-                relevant_policies = Policy.query.filter(
-                    (Policy.applicable_role == user.role) | 
-                    (Policy.applicable_role == 'all')
-                ).all() or []
-
-                # Get recent messages
-                messages = get_recent_messages(user.id, limit=3) or []
-
-                safe_data.update({
-                    'properties': properties,
-                    'pending_bookings': pending_bookings_list,
-                    'tenant_bills': tenant_bills,
-                    'chart_image': getattr(user, 'trend_image', None),
-                    'policies': relevant_policies,
-                    'messages': messages,
-                    # ADD COUNTS FOR LANDLORD:
-                    'total_bookings': total_bookings,
-                    'approved_bookings': approved_bookings,
-                    'pending_bookings_count': pending_bookings_count,
-                    'total_bills': total_bills,
-                    'paid_bills': paid_bills,
-                    'unpaid_bills': unpaid_bills
-                })
-                
-                print(f"✅ [DASHBOARD-LANDLORD] Properties: {len(properties)}, Bookings - Total: {total_bookings}, Approved: {approved_bookings}, Pending: {pending_bookings_count}")
-                
-            except Exception as e:
-                print(f"❌ [DASHBOARD] Error loading landlord data: {e}")
-                import traceback
-                traceback.print_exc()
-                flash("Error loading dashboard data. Showing limited view.", "warning")
-
+            # Only the shell: the browser fetches each widget from dashboard_widget
+            safe_data['view_period'] = request.args.get('views', 'week')
             return render_template('dashboard.html', **safe_data)
 
         elif user.role == 'tenant':
             print("🔍 [DASHBOARD] Loading tenant dashboard...")
-            
-            try:
-                # Tenant data - SIMPLIFIED
-                bookings = Booking.query.filter_by(tenant_id=user.id).all() or []
-                pending_bookings_list = [b for b in bookings if getattr(b, 'status', None) == 'pending']
-                
-                # Count bookings
-                total_bookings = len(bookings)
-                approved_bookings = len([b for b in bookings if b.status == 'approved'])
-                pending_bookings_count = len(pending_bookings_list)
-                
-                # Bills data
-                tenant_bills = Billing.query.filter_by(tenant_id=user.id).all() or []
-                total_bills = len(tenant_bills)
-                paid_bills = len([b for b in tenant_bills if b.status == 'paid'])
-                unpaid_bills = len([b for b in tenant_bills if b.status == 'unpaid'])
-
-                # Get chart image
-                chart_image = None
-                try:
-                    approved_booking = next((b for b in bookings if b.status == 'approved'), None)
-                    if approved_booking and hasattr(approved_booking, 'property_obj'):
-                        landlord = approved_booking.property_obj.owner
-                        chart_image = getattr(landlord, 'trend_image', None)
-                except Exception as e:
-                    print(f"⚠️ [DASHBOARD] Error getting chart image: {e}")
-
-                # Get policies
-                relevant_policies = Policy.query.filter(
-                    (Policy.applicable_role == user.role) | 
-                    (Policy.applicable_role == 'all')
-                ).all() or []
-
-                # Get recent messages
-                messages = get_recent_messages(user.id, limit=3) or []
-
-                safe_data.update({
-                    'bookings': bookings,
-                    'properties': [],
-                    'pending_bookings': pending_bookings_list,
-                    'tenant_bills': tenant_bills,
-                    'chart_image': chart_image,
-                    'policies': relevant_policies,
-                    'messages': messages,
-                    # ADD COUNTS FOR TENANT:
-                    'total_bookings': total_bookings,
-                    'approved_bookings': approved_bookings,
-                    'pending_bookings_count': pending_bookings_count,
-                    'total_bills': total_bills,
-                    'paid_bills': paid_bills,
-                    'unpaid_bills': unpaid_bills
-                })
-                
-                print(f"✅ [DASHBOARD-TENANT] Bookings - Total: {total_bookings}, Approved: {approved_bookings}, Pending: {pending_bookings_count}")
-                
-            except Exception as e:
-                print(f"❌ [DASHBOARD] Error loading tenant data: {e}")
-                import traceback
-                traceback.print_exc()
-                flash("Error loading dashboard data. Showing limited view.", "warning")
-
             return render_template('dashboard.html', **safe_data)
 
         else:
@@ -1440,6 +1299,46 @@ def dashboard():
         traceback.print_exc()
         flash("An error occurred while loading the dashboard. Please try again.", "danger")
         return redirect(url_for('login'))
+
+def widget_error(name, message, status):
+    """JSON error for a widget request; never cached, so Retry asks the server again"""
+    response = jsonify({'widget': name, 'error': message})
+    response.status_code = status
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+
+@app.route('/dashboard/widgets/<name>')
+@login_required
+def dashboard_widget(name):
+    """One dashboard widget as JSON: {'widget', 'html'}; failures stay local to it"""
+    widget = WIDGETS.get(name)
+    if widget is None or current_user.role not in widget.roles:
+        return widget_error(name, 'Unknown widget', 404)
+
+    key = widget.cache_key(current_user.id, request.args)
+    cached_widget = dashboard_cache.get(key)
+    if cached_widget is None:
+        try:
+            context = widget.build(current_user, request.args)
+            html = render_template(widget.template, user=current_user, **context)
+        except Exception as e:
+            db.session.rollback()
+            print(f"❌ [DASHBOARD] Widget {name} failed: {e}")
+            return widget_error(name, 'Could not load this section', 500)
+        cached_widget = (html, hashlib.sha1(html.encode('utf-8')).hexdigest())
+        dashboard_cache.set(key, cached_widget)
+    html, etag = cached_widget
+
+    cached = not_modified(etag)
+    if cached is not None:
+        response = cached
+    else:
+        response = with_validators(jsonify({'widget': name, 'html': html}), etag)
+    if widget.max_age:
+        response.cache_control.no_cache = None
+        response.cache_control.max_age = widget.max_age
+    return response
 # @app.route('/check-resend-config')
 # def check_resend_config():
 #     """Check Resend configuration"""
@@ -1521,14 +1420,12 @@ def profile():
         if hasattr(user, 'bio'):
             user.bio = request.form.get('bio')
 
+        old_profile_pic = None
         file = request.files.get('profile_pic')
         if file and file.filename != '':
             if allowed_file(file):
-                filename = secure_filename(file.filename)
-                unique_filename = f"{datetime.now().strftime('%Y%m%d%H%M%S')}_{filename}"
-                file_path = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
-                file.save(file_path)
-                user.profile_pic = unique_filename
+                old_profile_pic = user.profile_pic
+                user.profile_pic = save_upload(file, app.config['UPLOAD_FOLDER'])
             else:
                 flash("Invalid file type or file too large. Please use PNG, JPG, or JPEG files under 5MB.", "danger")
 
@@ -1542,6 +1439,9 @@ def profile():
                 flash("Your email is already verified.", "info")
 
         db.session.commit()
+        if old_profile_pic is not None and old_profile_pic != user.profile_pic:
+            release_upload(old_profile_pic)
+            process_user_image(app, user, 'profile_pic')
         flash("Profile updated successfully!", "success")
         return redirect(url_for('profile'))
 
@@ -1773,184 +1673,228 @@ def test_db_connection():
 @app.route('/properties')
 @login_required
 def viewproperties():
-    """View all properties"""
+    """View properties with server-side filters and pagination"""
     user = User.query.get(session.get('user_id'))
     if not user:
         flash("User not found.", "danger")
         return redirect(url_for('login'))
 
-    if user.role == 'landlord':
-        properties = Property.query.filter_by(landlord_id=user.id).all()
-    else:
-        properties = Property.query.all()
+    # Answer 304 when no property, booking or review changed since the client's copy
+    stamps = listing_stamps()
+    etag = page_etag(stamps, user_id=user.id)
+    cached = not_modified(etag)
+    if cached is not None:
+        return cached
+
+    filters = parse_listing_filters(request.args)
+    page, per_page = get_page_args(request.args)
+    landlord_id = user.id if user.role == 'landlord' else None
+    pagination = paginate_listing(filters, page, per_page, landlord_id=landlord_id)
+
+    # Booking stats for the whole page come from one grouped query
+    stats = listing_projection([prop.id for prop in pagination.items], user_id=user.id)
+    facets = get_facet_counts(filters, landlord_id=landlord_id, stamps=stamps)
 
     property_data = []
-    for prop in properties:
+    for prop in pagination.items:
+        prop_stats = stats[prop.id]
         total_slots = prop.slots if prop.slots is not None else 10
-        approved_bookings_count = sum(1 for booking in prop.bookings if booking.status == 'approved')
-        slots_left = max(0, total_slots - approved_bookings_count)
-        user_has_booked = any(b.tenant_id == user.id for b in prop.bookings)
-        
+        slots_left = max(0, total_slots - (prop.approved_booking_count or 0))
+
         property_data.append({
             'property': prop,
             'slots_left': slots_left,
             'total_slots': total_slots,
-            'user_has_booked': user_has_booked
+            'total_bookings': prop_stats['total_bookings'],
+            'user_has_booked': prop_stats['user_has_booked'],
+            'user_booking_status': prop_stats['user_booking_status']
+        })
+
+    # Query args without the page number, for building pagination links
+    page_args = request.args.to_dict(flat=False)
+    page_args.pop('page', None)
+
+    response = make_response(render_template(
+        'viewproperties.html',
+        properties=property_data,
+        pagination=pagination,
+        filters=filters,
+        facets=facets,
+        page_args=page_args,
+        user=user
+    ))
+    return with_validators(response, etag)
+
+@app.route('/api/properties')
+@login_required
+def api_properties():
+    """Listing cards as JSON, keyset-paginated for infinite scroll"""
+    filters = parse_listing_filters(request.args)
+    limit = max(1, min(request.args.get('limit', DEFAULT_PER_PAGE, type=int) or DEFAULT_PER_PAGE, MAX_PER_PAGE))
+    landlord_id = current_user.id if current_user.role == 'landlord' else None
+
+    try:
+        rows, next_cursor = keyset_listing_page(
+            filters, limit, cursor=request.args.get('cursor'), landlord_id=landlord_id
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    stats = listing_projection([row.id for row in rows], user_id=current_user.id)
+
+    items = []
+    for row in rows:
+        total_slots = row.slots if row.slots is not None else 10
+        items.append({
+            'id': row.id,
+            'title': row.title,
+            'price': row.price,
+            'location': row.location,
+            'property_type': row.property_type,
+            'gender_preference': row.gender_preference,
+            'status': row.status,
+            'image': image_src(row.image) if row.image else None,
+            'url': url_for('property_detail', property_id=row.id),
+            'total_slots': total_slots,
+            'slots_left': max(0, total_slots - (row.approved_booking_count or 0)),
+            'average_rating': round(row.rating_sum / row.review_count, 1) if row.review_count else 0,
+            'review_count': row.review_count,
+            'total_bookings': stats[row.id]['total_bookings'],
+            'user_has_booked': stats[row.id]['user_has_booked'],
+            'user_booking_status': stats[row.id]['user_booking_status'],
+            'is_owner': row.landlord_id == current_user.id
         })
 
-    return render_template('viewproperties.html', properties=property_data, user=user)
+    return jsonify({
+        'items': items,
+        'count': len(items),
+        'next_cursor': next_cursor,
+        'has_more': next_cursor is not None
+    })
+
+@app.route('/api/facets')
+@login_required
+def api_facets():
+    """Filter panel facet counts for the current listing filters"""
+    filters = parse_listing_filters(request.args)
+    landlord_id = current_user.id if current_user.role == 'landlord' else None
+    return jsonify(get_facet_counts(filters, landlord_id=landlord_id))
+
+@app.route('/api/search')
+@login_required
+def api_search():
+    """Ranked full-text property search as JSON"""
+    q = request.args.get('q', '').strip()
+    limit = max(1, min(request.args.get('limit', 20, type=int) or 20, 50))
+
+    if not q:
+        return jsonify({'query': q, 'count': 0, 'results': []})
+
+    results = []
+    for prop, rank in search_properties(q, limit=limit):
+        results.append({
+            'id': prop.id,
+            'title': prop.title,
+            'location': prop.location,
+            'price': prop.price,
+            'property_type': prop.property_type,
+            'image': image_src(prop.image) if prop.image else None,
+            'url': url_for('property_detail', property_id=prop.id),
+            'rank': round(rank, 4) if rank is not None else None
+        })
+
+    return jsonify({'query': q, 'count': len(results), 'results': results})
 
 @app.route('/property_detail/<int:property_id>', methods=['GET'])
 def property_detail(property_id):
-    """Property detail page - FIXED VERSION"""
+    """Property detail page.
+
+    Built from a fixed number of queries: the property with its owner and
+    amenities, its images, one page of reviews with their tenants and, for
+    tenants, their own bookings and review. Slot and rating stats, including
+    the star histogram, come from the aggregate columns on the property.
+    With the login user lookup that is at most seven queries for tenants,
+    five for other users and four for visitors (tests/test_query_budget.py).
+    """
+    property = Property.query.options(
+        joinedload(Property.owner),
+        selectinload(Property.amenity_items)
+    ).filter_by(id=property_id).first_or_404()
+    
+    # Buffered in memory; the background flush writes it back
+    view_counter.record(property.id)
+    
+    # Answer 304 when neither the property nor its bookings, reviews, images
+    # or owner changed since the client's copy
+    user_id = current_user.id if current_user.is_authenticated else None
+    etag = page_etag(property_stamps(property), user_id=user_id)
+    cached = not_modified(etag)
+    if cached is not None:
+        return cached
+    
     try:
-        print(f"🔍 [PROPERTY_DETAIL] Loading property ID: {property_id}")
+        images = PropertyImage.query.filter_by(property_id=property.id).order_by(
+            PropertyImage.is_primary.desc(), PropertyImage.id
+        ).all()
         
-        property = Property.query.get_or_404(property_id)
-        print(f"✅ [PROPERTY_DETAIL] Property found: {property.title}")
+        review_sort, review_page = get_review_args(request.args)
+        review_pagination = paginate_reviews(property, sort=review_sort, page=review_page)
         
-        # Initialize safe defaults
+        # Tenant-specific data: their bookings and review on this property
         user_booking = []
         user_review = None
         can_review = False
-        reviews = []
-        avg_rating = 0
-        review_count = 0
-        
-        # Check if user is authenticated using current_user (Flask-Login)
         if current_user.is_authenticated and current_user.role == 'tenant':
-            user_id = current_user.id
-            print(f"👤 [PROPERTY_DETAIL] Loading tenant data for user: {user_id}")
-            
-            # Get user bookings safely
-            try:
-                user_booking = Booking.query.filter_by(
-                    property_id=property.id,
-                    tenant_id=user_id
-                ).all()
-                print(f"📅 [PROPERTY_DETAIL] User bookings: {len(user_booking)}")
-            except Exception as e:
-                print(f"⚠️ [PROPERTY_DETAIL] Error getting user bookings: {e}")
-                user_booking = []
-            
-            # Get user review safely
-            try:
-                user_review = Review.query.filter_by(
-                    property_id=property_id,
-                    tenant_id=user_id
-                ).first()
-                print(f"⭐ [PROPERTY_DETAIL] User review found: {user_review is not None}")
-            except Exception as e:
-                print(f"⚠️ [PROPERTY_DETAIL] Error getting user review: {e}")
-                user_review = None
-            
-            # Check if user can review
-            try:
-                has_approved_booking = Booking.query.filter(
-                    Booking.property_id == property_id,
-                    Booking.tenant_id == user_id,
-                    Booking.status == 'approved'
-                ).first() is not None
-                
-                can_review = has_approved_booking and not user_review
-                print(f"📝 [PROPERTY_DETAIL] Can review: {can_review}")
-            except Exception as e:
-                print(f"⚠️ [PROPERTY_DETAIL] Error checking review eligibility: {e}")
-                can_review = False
-
-        # Calculate slots safely
-        try:
-            # Use capacity field instead of slots
-            total_slots = property.capacity if hasattr(property, 'capacity') and property.capacity else 1
-            
-            # Count approved bookings
-            approved_bookings_count = Booking.query.filter_by(
-                property_id=property_id,
-                status='approved'
-            ).count()
-            
-            slots_left = max(0, total_slots - approved_bookings_count)
-            print(f"🎯 [PROPERTY_DETAIL] Slots: {slots_left}/{total_slots} available")
-        except Exception as e:
-            print(f"⚠️ [PROPERTY_DETAIL] Error calculating slots: {e}")
-            total_slots = 1
-            slots_left = 1
-
-        # Get reviews safely
-        try:
-            reviews = Review.query.filter_by(property_id=property_id).all()
-            review_count = len(reviews)
-            
-            if reviews:
-                avg_rating = sum(review.rating for review in reviews) / len(reviews)
-            print(f"⭐ [PROPERTY_DETAIL] Reviews: {review_count}, Avg rating: {avg_rating:.1f}")
-        except Exception as e:
-            print(f"⚠️ [PROPERTY_DETAIL] Error getting reviews: {e}")
-            reviews = []
-            review_count = 0
-            avg_rating = 0
-
-        # Handle images safely - SIMPLIFIED APPROACH
-        image_urls = []
-        try:
-            # Method 1: Check if property has images relationship
-            if hasattr(property, 'images') and property.images:
-                for img in property.images:
-                    if hasattr(img, 'image_url') and img.image_url:
-                        # Construct full URL path
-                        image_url = f"/static/uploads/{img.image_url}"
-                        image_urls.append(image_url)
-                        print(f"🖼️ [PROPERTY_DETAIL] Added image: {img.image_url}")
-            
-            # Method 2: If no images from relationship, check for single image field
-            if not image_urls and hasattr(property, 'image') and property.image:
-                image_url = f"/static/uploads/{property.image}"
-                image_urls.append(image_url)
-                print(f"🖼️ [PROPERTY_DETAIL] Using main image: {property.image}")
-            
-            # Method 3: Fallback to placeholder
-            if not image_urls:
-                placeholder_url = "/static/images/placeholder-property.jpg"
-                image_urls.append(placeholder_url)
-                print("🖼️ [PROPERTY_DETAIL] Using placeholder image")
-                    
-            print(f"🖼️ [PROPERTY_DETAIL] Total images: {len(image_urls)}")
-                    
-        except Exception as e:
-            print(f"❌ [PROPERTY_DETAIL] Error processing images: {e}")
-            # Fallback to placeholder
-            image_urls = ["/static/images/placeholder-property.jpg"]
-
-        # Get owner safely
-        owner = None
-        try:
-            owner = property.owner
-            print(f"👤 [PROPERTY_DETAIL] Owner: {owner.name if owner else 'Not found'}")
-        except Exception as e:
-            print(f"⚠️ [PROPERTY_DETAIL] Error getting owner: {e}")
-            # Create a dummy owner object to prevent template errors
-            class DummyOwner:
-                name = "Property Owner"
-                email = "contact@example.com"
-                phone = "Not available"
-            owner = DummyOwner()
-
-        print("✅ [PROPERTY_DETAIL] All data loaded successfully")
+            user_booking = Booking.query.filter_by(
+                property_id=property.id,
+                tenant_id=current_user.id
+            ).all()
+            user_review = Review.query.filter_by(
+                property_id=property.id,
+                tenant_id=current_user.id
+            ).first()
+            has_approved_booking = any(b.status == 'approved' for b in user_booking)
+            can_review = has_approved_booking and not user_review
+        
+        # Slot and rating stats from the stored aggregates
+        total_slots = property.slots or 1
+        slots_left = property.available_slots
+        
+        # Main image first, then the gallery, then a placeholder
+        variants_by_file = {img.filename: img.variants for img in images}
+        filenames = [property.image] if property.image else []
+        filenames.extend(img.filename for img in images if img.filename != property.image)
+        gallery_images = []
+        for filename in filenames:
+            variants = variants_by_file.get(filename)
+            gallery_images.append({
+                'src': image_src(filename, variants, 'full'),
+                'thumb': image_src(filename, variants, 'thumb'),
+                'srcset': image_srcset(variants),
+                'webp_srcset': image_srcset(variants, 'webp')
+            })
+        if not gallery_images:
+            placeholder = "/static/images/placeholder-property.jpg"
+            gallery_images.append({'src': placeholder, 'thumb': placeholder, 'srcset': '', 'webp_srcset': ''})
         
-        return render_template(
+        response = make_response(render_template(
             'property_detail.html',
             property=property,
             user_booking=user_booking,
             slots_left=slots_left,
             total_slots=total_slots,
-            image_urls=image_urls,
-            reviews=reviews,
+            gallery_images=gallery_images,
+            reviews=review_pagination.items,
+            review_pagination=review_pagination,
+            review_sort=review_sort,
+            rating_histogram=property.rating_histogram,
             user_review=user_review,
             can_review=can_review,
-            avg_rating=round(avg_rating, 1) if avg_rating > 0 else 0,
-            review_count=review_count,
-            owner=owner
-        )
+            avg_rating=property.average_rating,
+            review_count=property.review_count,
+            owner=property.owner
+        ))
+        return with_validators(response, etag)
         
     except Exception as e:
         print(f"❌ [PROPERTY_DETAIL] CRITICAL ERROR: {str(e)}")
@@ -2077,18 +2021,16 @@ def add_property():
                         flash(f"File not allowed or too large: {file.filename}. Please use PNG, JPG, or JPEG files under 5MB.", "danger")
                         continue
 
-                    original_filename = secure_filename(file.filename)
-                    unique_filename = f"{datetime.now().strftime('%Y%m%d%H%M%S')}_{original_filename}"
-                    upload_path = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
-                    
                     try:
-                        file.save(upload_path)
-                        image_filenames.append(unique_filename)
-                        print(f"✅ [ADD_PROPERTY] File saved: {unique_filename}")
+                        stored_filename = save_upload(file, app.config['UPLOAD_FOLDER'])
+                        if stored_filename in image_filenames:
+                            continue  # Same photo picked twice
+                        image_filenames.append(stored_filename)
+                        print(f"✅ [ADD_PROPERTY] File saved: {stored_filename}")
                         
                         # Set first image as main image
-                        if idx == 0:
-                            main_image = unique_filename
+                        if main_image is None:
+                            main_image = stored_filename
                     except Exception as e:
                         print(f"❌ [ADD_PROPERTY] Error saving file {file.filename}: {e}")
                         flash(f"Error saving file {file.filename}", "danger")
@@ -2106,31 +2048,39 @@ def add_property():
                 bathrooms=bathrooms,
                 slots=slots,
                 image=main_image,  # This should be the filename string, not an object
-                landlord_id=user.id,
-                amenities=','.join(amenities) if amenities else None
+                landlord_id=user.id
             )
+            new_property.set_amenities(amenities)
 
             db.session.add(new_property)
             db.session.flush()  # This gets the ID without committing
             print(f"✅ [ADD_PROPERTY] Property created with ID: {new_property.id}")
 
-            # Add additional images as PropertyImage records
+            # Record every image, the main one flagged primary, so each gets resized variants
+            new_images = []
             for fname in image_filenames:
-                if fname != main_image:  # Don't duplicate the main image
-                    try:
-                        prop_image = PropertyImage(
-                            property_id=new_property.id, 
-                            filename=fname
-                        )
-                        db.session.add(prop_image)
-                        print(f"🖼️ [ADD_PROPERTY] Added property image: {fname}")
-                    except Exception as e:
-                        print(f"❌ [ADD_PROPERTY] Error adding property image {fname}: {e}")
+                try:
+                    prop_image = PropertyImage(
+                        property_id=new_property.id, 
+                        filename=fname,
+                        is_primary=fname == main_image
+                    )
+                    db.session.add(prop_image)
+                    new_images.append(prop_image)
+                    print(f"🖼️ [ADD_PROPERTY] Added property image: {fname}")
+                except Exception as e:
+                    print(f"❌ [ADD_PROPERTY] Error adding property image {fname}: {e}")
+
+            index_property(new_property)
 
             # Commit everything
             db.session.commit()
             print("✅ [ADD_PROPERTY] Database committed successfully")
             
+            # Resized variants are built in the background
+            for prop_image in new_images:
+                process_property_image(app, prop_image)
+            
             flash("Property added successfully!", "success")
             return redirect(url_for('viewproperties'))
             
@@ -2170,31 +2120,39 @@ def edit_property(property_id):
             property_obj.gender_preference = request.form.get('gender_preference')
             property_obj.status = request.form.get('status', 'available')
             
+            new_images = []
             if 'images' in request.files:
                 files = request.files.getlist('images')
                 
-                existing_count = PropertyImage.query.filter_by(property_id=property_id).count()
+                attached = {img.filename for img in PropertyImage.query.filter_by(property_id=property_id)}
+                existing_count = len(attached)
                 if existing_count + len(files) > app.config['MAX_IMAGE_COUNT']:
                     flash(f"Maximum {app.config['MAX_IMAGE_COUNT']} images allowed per property.", "danger")
                     return redirect(url_for('edit_property', property_id=property_id))
                 
                 for idx, file in enumerate(files):
                     if file and file.filename != '' and allowed_file(file):
-                        filename = secure_filename(file.filename)
-                        unique_filename = f"{uuid.uuid4()}_{filename}"
-                        file_path = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
-                        file.save(file_path)
+                        unique_filename = save_upload(file, app.config['UPLOAD_FOLDER'])
+                        if unique_filename in attached:
+                            continue  # Already one of this property's photos
+                        attached.add(unique_filename)
                         
-                        if idx == 0 and not property_obj.image:
+                        is_primary = idx == 0 and not property_obj.image
+                        if is_primary:
                             property_obj.image = unique_filename
                         
                         new_image = PropertyImage(
                             property_id=property_id,
-                            filename=unique_filename
+                            filename=unique_filename,
+                            is_primary=is_primary
                         )
                         db.session.add(new_image)
+                        new_images.append(new_image)
             
+            index_property(property_obj)
             db.session.commit()
+            for new_image in new_images:
+                process_property_image(app, new_image)
             flash('Property updated successfully!', 'success')
             return redirect(url_for('viewproperties'))
             
@@ -2235,13 +2193,6 @@ def delete_image():
         if not property_obj or property_obj.landlord_id != user_id:
             return jsonify({'success': False, 'message': 'Unauthorized'}), 403
         
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], image.filename)
-        if os.path.exists(file_path):
-            try:
-                os.remove(file_path)
-            except Exception as e:
-                print(f"Error deleting file: {e}")
-        
         if property_obj.image == image.filename:
             remaining_images = PropertyImage.query.filter(
                 PropertyImage.property_id == property_obj.id,
@@ -2250,11 +2201,14 @@ def delete_image():
             
             if remaining_images:
                 property_obj.image = remaining_images.filename
+                remaining_images.is_primary = True
             else:
                 property_obj.image = None
         
+        filename, variants = image.filename, image.variants
         db.session.delete(image)
         db.session.commit()
+        release_upload(filename, variants)
         
         return jsonify({'success': True, 'message': 'Image deleted successfully'})
         
@@ -2280,32 +2234,36 @@ def delete_property(property_id):
     try:
         # Delete related records first
         property_images = PropertyImage.query.filter_by(property_id=property_id).all()
+        released = {img.filename: img.variants for img in property_images}
+        if property_obj.image:
+            released.setdefault(property_obj.image, None)
         for img in property_images:
-            file_path = os.path.join(app.config['UPLOAD_FOLDER'], img.filename)
-            if os.path.exists(file_path):
-                try:
-                    os.remove(file_path)
-                except Exception as e:
-                    print(f"Error deleting image file {img.filename}: {e}")
             db.session.delete(img)
         
-        # Delete main image
-        if property_obj.image:
-            main_image_path = os.path.join(app.config['UPLOAD_FOLDER'], property_obj.image)
-            if os.path.exists(main_image_path):
-                try:
-                    os.remove(main_image_path)
-                except Exception as e:
-                    print(f"Error deleting main image: {e}")
-        
+        # Bulk deletes skip the dashboard cache events: collect whose widgets change
+        affected_users = {user.id}
+        for model in (Booking, Billing):
+            affected_users.update(
+                tenant_id for (tenant_id,) in db.session.query(model.tenant_id).filter_by(property_id=property_id).distinct()
+            )
+
         # Delete related bookings, bills, and reviews
+        subtract_platform_stats(Booking, Booking.property_id == property_id)
+        subtract_platform_stats(Billing, Billing.property_id == property_id)
         Booking.query.filter_by(property_id=property_id).delete()
         Billing.query.filter_by(property_id=property_id).delete()
         Review.query.filter_by(property_id=property_id).delete()
+        PropertyViewStat.query.filter_by(property_id=property_id).delete()
         
         # Delete the property
+        remove_property_from_index(property_id)
         db.session.delete(property_obj)
         db.session.commit()
+        invalidate_widgets(affected_users)
+        
+        # Image files go once no other property or user references them
+        for filename, variants in released.items():
+            release_upload(filename, variants)
         
         # Count remaining properties for this landlord
         count_after = Property.query.filter_by(landlord_id=user.id).count()
@@ -2328,6 +2286,9 @@ def delete_user_by_email(email):
         user = User.query.filter_by(email=email).first()
         if user:
             # Delete related records first
+            subtract_platform_stats(Booking, Booking.tenant_id == user.id)
+            subtract_platform_stats(Billing, Billing.tenant_id == user.id)
+            subtract_bookings(Booking.tenant_id == user.id)
             Booking.query.filter_by(tenant_id=user.id).delete()
             Billing.query.filter_by(tenant_id=user.id).delete()
             
@@ -2486,44 +2447,25 @@ def pending_bookings():
         return redirect(url_for('dashboard'))
     
     try:
-        # FIXED: Get pending bookings with proper relationship access
-        # Get all properties owned by this landlord
-        properties = Property.query.filter_by(landlord_id=user.id).all()
-        property_ids = [prop.id for prop in properties]
-        
-        # Get pending bookings for these properties
-        if property_ids:
-            bookings = Booking.query\
-                .join(Property)\
-                .join(User, Booking.tenant_id == User.id)\
-                .filter(
-                    Booking.property_id.in_(property_ids),
-                    Booking.status == 'pending'
-                )\
-                .order_by(Booking.created_at.desc())\
-                .all()
-        else:
-            bookings = []
-        
-        # Debug output
-        print(f"🎯 [PENDING_BOOKINGS] Landlord: {user.email}")
-        print(f"🎯 [PENDING_BOOKINGS] Properties: {len(properties)}")
-        print(f"🎯 [PENDING_BOOKINGS] Found {len(bookings)} pending bookings")
-        
-        for booking in bookings:
-            print(f"   - Booking {booking.id}: {booking.property.title} by {booking.tenant.name}")
+        page, per_page = get_page_args(request.args)
+        pagination = landlord_bookings(user.id, status='pending').paginate(
+            page=page, per_page=per_page, max_per_page=MAX_PER_PAGE, error_out=False
+        )
+        bookings = pagination.items
+
+        print(f"🎯 [PENDING_BOOKINGS] Landlord: {user.email}, {pagination.total} pending, page {pagination.page}")
         
         if not bookings:
             flash("No pending bookings found.", "info")
             
-        return render_template('pending_bookings.html', bookings=bookings, user=user)
+        return render_template('pending_bookings.html', bookings=bookings, pagination=pagination, user=user)
         
     except Exception as e:
         print(f"❌ [PENDING_BOOKINGS] Error: {e}")
         import traceback
         traceback.print_exc()
         flash("Error loading pending bookings.", "danger")
-        return render_template('pending_bookings.html', bookings=[], user=user)
+        return render_template('pending_bookings.html', bookings=[], pagination=None, user=user)
     
 @app.route('/debug-landlord-bookings')
 @login_required
@@ -2631,6 +2573,7 @@ def cancel_booking(booking_id):
     
     try:
         # Delete associated billing records first
+        subtract_platform_stats(Billing, Billing.booking_reference == booking.reference_number)
         Billing.query.filter_by(booking_reference=booking.reference_number).delete()
         
         # Delete the booking
@@ -2803,9 +2746,12 @@ def billing():
     current_year = date.today().year
 
     if user.role == 'landlord':
-        bills = Billing.query.join(Property).filter(Property.landlord_id == user.id).all()
+        query = landlord_bills(user.id)
     else:
-        bills = Billing.query.filter_by(tenant_id=user.id).all()
+        query = Billing.query.filter_by(tenant_id=user.id).order_by(Billing.created_at.desc(), Billing.id.desc())
+    page, per_page = get_page_args(request.args)
+    pagination = query.paginate(page=page, per_page=per_page, max_per_page=MAX_PER_PAGE, error_out=False)
+    bills = pagination.items
 
     for bill in bills:
         if bill.status.lower() == 'unpaid' and bill.due_date:
@@ -2823,7 +2769,7 @@ def billing():
 
     db.session.commit()
 
-    return render_template('billing.html', bills=bills, user=user, current_year=current_year)
+    return render_template('billing.html', bills=bills, pagination=pagination, user=user, current_year=current_year)
 
 @app.route('/confirm_payment/<int:bill_id>', methods=['POST'])
 @login_required
@@ -2965,19 +2911,14 @@ def admin_commissions():
         return redirect(url_for('dashboard'))
 
     paid_bills = Billing.query.filter_by(status='paid').all()
-    total_commission = sum(bill.admin_commission or 0 for bill in paid_bills)
-    
-    unpaid_bills = Billing.query.filter_by(status='unpaid').all()
-    pending_commission = sum(bill.amount * 0.05 for bill in unpaid_bills)
-    
-    properties_count = Property.query.count()
-    tenants_count = User.query.filter_by(role='tenant').count()
+    stats = snapshot_admin_stats(app.config['STATS_MAX_STALENESS'])
 
     return render_template('admin_commissions.html', 
-                        total_commission=total_commission,
-                        pending_commission=pending_commission,
-                        properties_count=properties_count,
-                        tenants_count=tenants_count,
+                        total_commission=stats['total_commission'],
+                        pending_commission=stats['pending_commission'],
+                        properties_count=stats['total_properties'],
+                        tenants_count=stats['total_tenants'],
+                        stats_as_of=stats['stats_as_of'],
                         bills=paid_bills,
                         user=user)
 
@@ -3033,8 +2974,8 @@ def add_review(property_id):
     rating = request.form.get('rating')
     comment = request.form.get('comment', '').strip()
     
-    if not rating:
-        flash("Please provide a rating.", "danger")
+    if not rating or not rating.isdigit() or not 1 <= int(rating) <= 5:
+        flash("Please provide a rating from 1 to 5.", "danger")
         return redirect(url_for('property_detail', property_id=property_id))
     
     new_review = Review(
@@ -3062,7 +3003,11 @@ def edit_review(review_id):
         return redirect(url_for('property_detail', property_id=review.property_id))
     
     if request.method == 'POST':
-        review.rating = int(request.form.get('rating'))
+        rating = request.form.get('rating', '')
+        if not rating.isdigit() or not 1 <= int(rating) <= 5:
+            flash("Please provide a rating from 1 to 5.", "danger")
+            return redirect(url_for('edit_review', review_id=review.id))
+        review.rating = int(rating)
         review.comment = request.form.get('comment', '').strip()
         db.session.commit()
         flash("Review updated successfully!", "success")
@@ -3346,8 +3291,11 @@ def upload_trend():
         flash(f"Maximum {app.config['MAX_IMAGE_COUNT']} images allowed!", "danger")
         return redirect(url_for('dashboard'))
 
-    filename = secure_filename(file.filename)
-    file.save(os.path.join(app.config['UPLOAD_FOLDER'], filename))
+    user = User.query.get(session['user_id'])
+    old_trend_image = user.trend_image
+    user.trend_image = save_upload(file, app.config['UPLOAD_FOLDER'])
+    db.session.commit()
+    release_upload(old_trend_image)
     flash("Trend image uploaded successfully!", "success")
 
     return redirect(url_for('dashboard'))
@@ -3369,6 +3317,113 @@ def buy_property(property_id):
     flash(f"Property {property.title} has been booked!", "success")
     return redirect(url_for('dashboard'))
 
+# ========== CLI COMMANDS ==========
+
+@app.cli.command('reconcile-aggregates')
+def reconcile_aggregates_command():
+    """Rebuild the denormalized property counters from bookings and reviews"""
+    updated = reconcile_property_aggregates()
+    print(f"✅ Reconciled booking/review aggregates for {updated} properties")
+
+@app.cli.command('rebuild-search-index')
+def rebuild_search_index_command():
+    """Rebuild the full-text property search index"""
+    backend = init_search_index()
+    if backend == 'sqlite':
+        print(f"✅ Indexed {rebuild_search_index()} properties in property_fts")
+    elif backend == 'postgresql':
+        print("ℹ️  PostgreSQL search_vector is a generated column - nothing to rebuild")
+    else:
+        print("⚠️  No full-text backend available - search uses ILIKE")
+
+@app.cli.command('flush-view-counts')
+def flush_view_counts_command():
+    """Write buffered property views back to the database"""
+    print(f"✅ Flushed {view_counter.flush_all()} buffered views")
+
+@app.cli.command('rollup-view-stats')
+def rollup_view_stats_command():
+    """Recompute weekly and monthly view rollups from the daily rows"""
+    view_counter.flush_all()
+    print(f"✅ Rebuilt {rebuild_view_rollups()} weekly/monthly view rollups")
+
+@app.cli.command('dedupe-uploads')
+def dedupe_uploads_command():
+    """Move existing uploads to content-addressed names, dropping duplicate copies"""
+    renamed, removed = deduplicate_uploads(app.config['UPLOAD_FOLDER'])
+    print(f"✅ Renamed {renamed} uploads, removed {removed} duplicate copies")
+    print("💡 Run 'flask build-image-variants' to rebuild their resized variants")
+
+@app.cli.command('build-image-variants')
+def build_image_variants_command():
+    """Build resized variants for images uploaded before the pipeline"""
+    processed = backfill_image_variants(app.config['UPLOAD_FOLDER'])
+    print(f"✅ Built variants for {processed} images")
+
+@app.cli.command('build-assets')
+def build_assets_command():
+    """Write fingerprinted static files and their manifest (static/dist)"""
+    manifest = build_manifest(app.static_folder)
+    print(f"✅ Fingerprinted {len(manifest)} static files")
+
+@app.cli.command('bench-compression')
+@click.argument('paths', nargs=-1)
+@click.option('--email', help='Log the benchmark client in as this user')
+@click.option('--repeats', default=20, show_default=True)
+def bench_compression_command(paths, email, repeats):
+    """Bytes and CPU per request for PATHS with identity, gzip and brotli"""
+    client = app.test_client()
+    if email:
+        user = User.query.filter_by(email=email).first()
+        if not user:
+            print(f"❌ No user {email}")
+            return
+        with client.session_transaction() as sess:
+            sess.update({'_user_id': str(user.id), '_fresh': True, 'user_id': user.id,
+                         'user_role': user.role, 'user_name': user.name})
+    print(f"{'path':<32} {'encoding':<9} {'bytes':>9} {'cpu ms/req':>11}")
+    for path, encoding, size, cpu_ms in benchmark_compression(client, paths or ['/'], repeats):
+        print(f"{path:<32} {encoding:<9} {size:>9} {cpu_ms:>11.2f}")
+
+@app.cli.command('sweep-uploads')
+@click.option('--min-age', default=DEFAULT_SWEEP_MIN_AGE, show_default=True, help='Seconds a file must exist before it can be swept')
+@click.option('--dry-run', is_flag=True, help='Only count the orphaned files')
+def sweep_uploads_command(min_age, dry_run):
+    """Delete upload files that no database row references"""
+    file_collector.drain()
+    swept = sweep_orphans(app.config['UPLOAD_FOLDER'], min_age=min_age, dry_run=dry_run)
+    print(f"✅ {'Found' if dry_run else 'Swept'} {swept} orphaned upload files")
+
+@app.cli.command('bench-admin-stats')
+@click.option('--repeats', default=5, show_default=True)
+def bench_admin_stats_command(repeats):
+    """Time the admin dashboard figures: per-row queries vs grouped aggregates"""
+    counts = {model.__name__: model.query.count() for model in (User, Property, Booking, Billing)}
+    print("📊 Rows: " + ", ".join(f"{name} {count}" for name, count in counts.items()))
+    result = benchmark_admin_stats(repeats)
+    print(f"⏱️  per-row: {result['per_row'] * 1000:.1f} ms, grouped: {result['grouped'] * 1000:.1f} ms"
+          f" ({'same figures' if result['match'] else 'FIGURES DIFFER'})")
+
+@app.cli.command('rebuild-platform-stats')
+def rebuild_platform_stats_command():
+    """Recompute the admin stats snapshot from the source tables (schedule from cron)"""
+    written = rebuild_platform_stats()
+    print(f"✅ Rebuilt platform stats snapshot ({written} rows)")
+
+@app.cli.command('push-uploads')
+def push_uploads_command():
+    """Copy local uploads and their variants to the configured storage backend"""
+    names = set()
+    for column in REFERENCE_COLUMNS:
+        names.update(name for (name,) in db.session.query(column).filter(column.isnot(None)).distinct())
+    for image in PropertyImage.query.filter(PropertyImage.variants.isnot(None)):
+        names.update(entry[fmt] for entry in image.variants.values() for fmt in ('webp', 'jpeg') if fmt in entry)
+    for user in User.query.filter(User.image_variants.isnot(None)):
+        for record in user.image_variants.values():
+            names.update(entry[fmt] for entry in record.values() for fmt in ('webp', 'jpeg') if fmt in entry)
+    queued = push_local_uploads(upload_storage, app.config['UPLOAD_FOLDER'], sorted(names))
+    print(f"✅ Queued {queued} files for the {upload_storage.name} backend")
+
 # ========== DATABASE INITIALIZATION ==========
 
 # Ensure required directories exist
@@ -3380,6 +3435,13 @@ with app.app_context():
         db.create_all()
         print("✅ Database tables created successfully")
         
+        linked = backfill_property_amenities()
+        if linked:
+            print(f"🧩 Linked amenities for {linked} existing properties")
+        
+        search_backend = init_search_index()
+        print(f"🔎 Full-text search backend: {search_backend or 'ILIKE fallback'}")
+        
         # Create admin account from environment variables
         admin_email = os.environ.get('ADMIN_EMAIL')
         admin_password = os.environ.get('ADMIN_PASSWORD')
@@ -3410,11 +3472,17 @@ with app.app_context():
         import traceback
         traceback.print_exc()
 
+# Periodically write buffered property views back as one UPDATE per property
+view_counter.start(app, interval=int(os.environ.get('VIEW_FLUSH_INTERVAL', DEFAULT_FLUSH_INTERVAL)))
+
+# Delete released upload files off the request path; sweep orphans if configured
+file_collector.start(app, sweep_interval=int(os.environ.get('UPLOAD_SWEEP_INTERVAL', 0)) or None)
+
 # Before running the app
-if os.environ.get('RENDER'):
+if os.environ.get('RENDER') and upload_storage.name == 'local':
     # Render uses ephemeral storage - uploads won't persist!
     print("⚠️ WARNING: Uploads will be lost on restart!")
-    print("💡 Consider using Cloudinary or AWS S3 for production")
+    print("💡 Set STORAGE_BACKEND=s3 (see storage.py) for production")
 
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 # ========== APPLICATION ENTRY POINT ==========
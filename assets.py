@@ -0,0 +1,243 @@
+"""Fingerprinted static assets.
+
+`python assets.py` (or `flask build-assets`) copies every file under static/
+(except uploads) to static/dist/ with a content hash in its name and writes
+static/dist/manifest.json mapping logical names to those copies:
+
+    {"css/style.css": "dist/css/style.3f2a9c1b7e.css"}
+
+CSS and JS files are minified on the way, and text files get .br/.gz
+siblings for compression.serve_precompressed. Page styles and scripts live in
+static/css and static/js (base.css/base.js plus one pair per large page)
+rather than inline in the templates, so browsers cache them across pages.
+
+Templates link assets with asset_url('css/style.css'). Since a fingerprinted
+name changes whenever its bytes do, those responses - and content-addressed
+uploads - are served with a one-year immutable Cache-Control. Without a
+manifest (e.g. in development) asset_url falls back to the plain file.
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+
+from flask import current_app, url_for
+
+from compression import precompress_static
+
+
+DIST_DIR = 'dist'
+MANIFEST_NAME = 'manifest.json'
+HASH_LENGTH = 10
+
+# Folders under static/ that are not build inputs
+SKIP_DIRS = {DIST_DIR, 'uploads'}
+
+# Uploads named by their sha256 (see uploads.py), originals and variants
+_CONTENT_ADDRESSED_UPLOAD = re.compile(r'^uploads/(variants/)?[0-9a-f]{64}(__\w+)?\.\w+$')
+
+_manifest_cache = {}  # static folder -> (manifest mtime, manifest, fingerprinted paths)
+
+
+# Strings are kept verbatim; comments dropped; whitespace runs collapsed
+_CSS_TOKENS = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|(/\*.*?\*/)|(\s+)', re.S)
+_CSS_TIGHT = set('{};,>')
+
+
+def minify_css(source):
+    """Drop comments and redundant whitespace, leaving strings untouched"""
+    def replace(match):
+        string, comment, space = match.groups()
+        if string:
+            return string
+        if comment:
+            return ''
+        before = match.string[match.start() - 1:match.start()]
+        after = match.string[match.end():match.end() + 1]
+        if not before or not after or before in _CSS_TIGHT or after in _CSS_TIGHT:
+            return ''
+        return ' '
+    # Comments go first so whitespace around them collapses in the second pass
+    source = _CSS_TOKENS.sub(lambda m: '' if m.group(2) else m.group(0), source)
+    return _CSS_TOKENS.sub(replace, source).strip() + '\n'
+
+
+# Characters after which a / starts a regex literal rather than a division
+_JS_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+
+
+def _skip_js_string(line, i, quote):
+    """Index just past the string literal opening at i (end of line if unterminated)"""
+    i += 1
+    while i < len(line):
+        if line[i] == '\\':
+            i += 2
+        elif line[i] == quote:
+            return i + 1
+        else:
+            i += 1
+    return i
+
+
+def _skip_js_regex(line, i):
+    """Index just past the regex literal opening at i"""
+    i += 1
+    in_class = False
+    while i < len(line):
+        ch = line[i]
+        if ch == '\\':
+            i += 2
+            continue
+        if ch == '[':
+            in_class = True
+        elif ch == ']':
+            in_class = False
+        elif ch == '/' and not in_class:
+            return i + 1
+        i += 1
+    return i
+
+
+def _scan_js_line(line, stack, in_comment):
+    """Advance the lexer state over one line of JavaScript.
+
+    stack holds the open template literals ('`') and the ${ } code inside
+    them ('{'). Returns whether the line ends inside a /* */ comment.
+    """
+    i, prev = 0, ''
+    while i < len(line):
+        ch = line[i]
+        if in_comment:
+            end = line.find('*/', i)
+            if end < 0:
+                return True
+            in_comment, i = False, end + 2
+            continue
+        if stack and stack[-1] == '`':
+            if ch == '\\':
+                i += 2
+                continue
+            if ch == '`':
+                stack.pop()
+            elif line.startswith('${', i):
+                stack.append('{')
+                i += 2
+                continue
+            i += 1
+            continue
+        if ch in '\'"':
+            i, prev = _skip_js_string(line, i, ch), ch
+            continue
+        if line.startswith('//', i):
+            return False
+        if line.startswith('/*', i):
+            in_comment, i = True, i + 2
+            continue
+        if ch == '/' and (not prev or prev in _JS_REGEX_PRECEDERS):
+            i, prev = _skip_js_regex(line, i), '/'
+            continue
+        if ch == '`':
+            stack.append('`')
+        elif ch == '{' and stack:
+            stack.append('{')
+        elif ch == '}' and stack:
+            stack.pop()
+        if not ch.isspace():
+            prev = ch
+        i += 1
+    return in_comment
+
+
+def minify_js(source):
+    """Strip indentation, blank lines and whole-line // comments.
+
+    Line breaks are kept, so automatic semicolon insertion behaves exactly
+    as in the source. Lines inside template literals are part of the string
+    and are left untouched.
+    """
+    lines = []
+    stack, in_comment = [], False
+    for line in source.splitlines():
+        starts_in_template = bool(stack) and stack[-1] == '`'
+        in_comment = _scan_js_line(line, stack, in_comment)
+        ends_in_template = bool(stack) and stack[-1] == '`'
+        if not starts_in_template:
+            line = line.lstrip()
+            if not line or line.startswith('//'):
+                continue
+        if not ends_in_template:
+            line = line.rstrip()
+        lines.append(line)
+    return '\n'.join(lines) + '\n'
+
+
+MINIFIERS = {'.css': minify_css, '.js': minify_js}
+
+
+def build_manifest(static_folder):
+    """Write fingerprinted copies and the manifest; returns the manifest"""
+    dist = os.path.join(static_folder, DIST_DIR)
+    if os.path.isdir(dist):
+        shutil.rmtree(dist)
+
+    manifest = {}
+    for root, dirs, files in os.walk(static_folder):
+        if root == static_folder:
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in sorted(files):
+            source = os.path.join(root, name)
+            logical = os.path.relpath(source, static_folder).replace(os.sep, '/')
+            stem, ext = os.path.splitext(logical)
+            with open(source, 'rb') as f:
+                content = f.read()
+            if ext in MINIFIERS:
+                content = MINIFIERS[ext](content.decode('utf-8')).encode('utf-8')
+            digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+            fingerprinted = f"{DIST_DIR}/{stem}.{digest}{ext}"
+            target = os.path.join(static_folder, fingerprinted)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, 'wb') as f:
+                f.write(content)
+            manifest[logical] = fingerprinted
+
+    with open(os.path.join(dist, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    precompress_static(dist)
+    return manifest
+
+
+def load_manifest(static_folder):
+    """(manifest, set of fingerprinted paths), re-read when the file changes"""
+    path = os.path.join(static_folder, DIST_DIR, MANIFEST_NAME)
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return {}, frozenset()
+    cached = _manifest_cache.get(static_folder)
+    if cached and cached[0] == mtime:
+        return cached[1], cached[2]
+    with open(path) as f:
+        manifest = json.load(f)
+    _manifest_cache[static_folder] = (mtime, manifest, frozenset(manifest.values()))
+    return manifest, _manifest_cache[static_folder][2]
+
+
+def asset_url(filename):
+    """url_for('static', ...) for the fingerprinted copy of a static file"""
+    manifest, _ = load_manifest(current_app.static_folder)
+    return url_for('static', filename=manifest.get(filename, filename))
+
+
+def is_immutable_static(path):
+    """Whether a static path (relative to static/) never changes its bytes"""
+    if _CONTENT_ADDRESSED_UPLOAD.match(path):
+        return True
+    _, fingerprinted = load_manifest(current_app.static_folder)
+    return path in fingerprinted
+
+
+if __name__ == '__main__':
+    static_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+    manifest = build_manifest(static_folder)
+    print(f"✅ Fingerprinted {len(manifest)} static files into static/{DIST_DIR}")
@@ -0,0 +1,151 @@
+"""Response compression.
+
+Dynamic responses (HTML, JSON, ...) above MIN_SIZE are compressed per
+request with brotli or gzip, whichever the client prefers. Fingerprinted
+static files under static/dist are compressed once at build time
+(precompress_static, run by the asset build) and served from their .br/.gz
+siblings, so static requests never spend CPU on compression.
+
+Brotli is optional: without the brotli package only gzip is offered.
+"""
+import gzip
+import mimetypes
+import os
+import time
+
+from flask import request, send_from_directory
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+
+# Smaller bodies gain little and can even grow
+MIN_SIZE = 1024
+
+COMPRESSIBLE_TYPES = {
+    'text/html', 'text/css', 'text/plain', 'text/xml', 'text/javascript',
+    'application/json', 'application/javascript', 'application/xml', 'image/svg+xml',
+}
+
+# Per-request levels trade ratio for CPU; build-time levels are maximal
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+STATIC_GZIP_LEVEL = 9
+STATIC_BROTLI_QUALITY = 11
+
+# Encoding -> file suffix of precompressed static files
+STATIC_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+PRECOMPRESS_EXTENSIONS = {'.css', '.js', '.svg', '.json', '.txt', '.html'}
+
+
+def _encodings():
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def negotiate_encoding(accept_encodings):
+    """Best supported encoding the client accepts, or None"""
+    best, best_quality = None, 0
+    for encoding in _encodings():
+        quality = accept_encodings[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(data, encoding, static=False):
+    if encoding == 'br':
+        return brotli.compress(data, quality=STATIC_BROTLI_QUALITY if static else BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=STATIC_GZIP_LEVEL if static else GZIP_LEVEL, mtime=0)
+
+
+def compress_response(response):
+    """after_request hook: compress eligible dynamic responses in place"""
+    response.vary.add('Accept-Encoding')
+    if (response.status_code < 200 or response.status_code >= 300
+            or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_TYPES):
+        return response
+    encoding = negotiate_encoding(request.accept_encodings)
+    if encoding is None:
+        return response
+    data = response.get_data()
+    if len(data) < MIN_SIZE:
+        return response
+
+    response.set_data(compress(data, encoding))
+    response.headers['Content-Encoding'] = encoding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        # The compressed bytes differ from the identity representation
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def serve_precompressed(static_folder):
+    """before_request hook: answer static/dist requests from a .br/.gz sibling"""
+    if request.endpoint != 'static':
+        return None
+    filename = request.view_args.get('filename', '')
+    if not filename.startswith('dist/'):
+        return None
+    encoding = negotiate_encoding(request.accept_encodings)
+    if encoding is None:
+        return None
+    compressed = filename + STATIC_SUFFIXES[encoding]
+    if not os.path.isfile(os.path.join(static_folder, compressed)):
+        return None
+
+    response = send_from_directory(
+        static_folder, compressed,
+        mimetype=mimetypes.guess_type(filename)[0], download_name=os.path.basename(filename),
+    )
+    response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+def precompress_static(folder):
+    """Write .br/.gz siblings for the text files under folder; returns files written"""
+    written = 0
+    for root, _, files in os.walk(folder):
+        for name in files:
+            if os.path.splitext(name)[1] not in PRECOMPRESS_EXTENSIONS:
+                continue
+            path = os.path.join(root, name)
+            with open(path, 'rb') as f:
+                data = f.read()
+            for encoding in _encodings():
+                compressed = compress(data, encoding, static=True)
+                if len(compressed) < len(data):
+                    with open(path + STATIC_SUFFIXES[encoding], 'wb') as f:
+                        f.write(compressed)
+                    written += 1
+    return written
+
+
+def init_compression(app):
+    """Register the precompressed-static and dynamic compression hooks"""
+    app.before_request(lambda: serve_precompressed(app.static_folder))
+    app.after_request(compress_response)
+
+
+def benchmark(client, paths, repeats=20):
+    """Bytes and CPU per request for each path and encoding.
+
+    Returns rows of (path, encoding, bytes, cpu ms per request), where
+    encoding 'identity' is the uncompressed baseline.
+    """
+    rows = []
+    for path in paths:
+        for encoding in ('identity',) + _encodings():
+            headers = {'Accept-Encoding': encoding}
+            size = len(client.get(path, headers=headers).data)  # warm-up, and size
+            started = time.process_time()
+            for _ in range(repeats):
+                client.get(path, headers=headers)
+            cpu_ms = (time.process_time() - started) * 1000 / repeats
+            rows.append((path, encoding, size, cpu_ms))
+    return rows
@@ -0,0 +1,84 @@
+"""Conditional GET support (ETags) for listing pages.
+
+Validators come from per-property state: updated_at for listing edits
+and the revision counter the mapper events bump on bookings, reviews,
+images, amenities and owner profile changes (models.py). Listing pages
+aggregate them over the property table in one query; the detail page
+reads them off the property it already loaded. Pages carry per-user
+parts (navbar, booking status, own review), so validators always include
+the user and responses are marked private and revalidated on every use.
+"""
+import hashlib
+
+from flask import make_response, request, session
+from flask.globals import request_ctx
+
+from models import db, Property
+
+
+def listing_stamps():
+    """Change stamps covering every listing card, facet and booking count.
+
+    One aggregate over the property table: updated_at catches listing
+    edits, the count catches inserts and deletes, and the revision sum
+    catches bookings, reviews, images and owner profile changes.
+    """
+    return list(db.session.execute(db.select(
+        db.func.max(Property.updated_at),
+        db.func.count(Property.id),
+        db.func.coalesce(db.func.sum(Property.revision), 0),
+    )).one())
+
+
+def property_stamps(prop):
+    """Change stamps for one property's detail page, read off the loaded row"""
+    return [
+        prop.updated_at,
+        prop.revision,
+        prop.owner.name,
+        prop.owner.profile_pic,
+    ]
+
+
+def page_etag(stamps, user_id=None):
+    """ETag for a page built from the given stamps.
+
+    No Last-Modified goes with it: revision changes leave updated_at alone,
+    so a date alone could validate a stale page.
+    """
+    parts = [request.full_path, user_id, session.get('user_name')] + list(stamps)
+    return hashlib.sha1('|'.join(str(part) for part in parts).encode()).hexdigest()
+
+
+def _has_flashes():
+    """Whether flash messages are pending or were rendered into this response"""
+    return bool(session.get('_flashes') or request_ctx.flashes)
+
+
+def not_modified(etag):
+    """A 304 response if the client's copy is current, else None.
+
+    Pending flash messages are rendered into the page, so a request with
+    flashes is always answered in full.
+    """
+    if _has_flashes():
+        return None
+    # Weak comparison: compressed responses carry the ETag as W/"..."
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    return with_validators(make_response('', 304), etag)
+
+
+def with_validators(response, etag):
+    """Attach validators and per-user cache headers to a page response.
+
+    A page that rendered flash messages gets no ETag: a later clean request
+    must not revalidate against it and be shown the flash again.
+    """
+    if not _has_flashes():
+        response.set_etag(etag)
+    # Per-user HTML: browsers may keep it but must revalidate, shared caches must not
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.vary.add('Cookie')
+    return response
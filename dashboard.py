@@ -0,0 +1,281 @@
+"""Landlord and tenant dashboard widgets.
+
+The dashboard page is a shell; each widget (counts, view chart, activity
+feed, payments, messages, policies) is rendered by its own JSON endpoint,
+which the browser fetches in parallel (static/js/dashboard.js). A slow
+widget no longer delays the page and a failing one only blanks itself.
+
+Every builder runs a fixed number of queries: counts come from one GROUP
+BY per table and each list is a single joined query limited to the rows
+displayed. The full lists are paginated on the pending bookings and
+billing pages, which reuse the same queries.
+
+Rendered widgets are cached per user (dashboard_cache, TTL + LRU). Mapper
+events drop the entries a change affects - the tenant's and the
+landlord's on bookings and bills, both parties' on messages, everyone's
+policies on a policy change - once when the change is flushed and again
+after it commits, so a request racing the commit cannot keep stale HTML.
+The cache is per process; other workers see changes when the TTL ends.
+"""
+from sqlalchemy import event
+from sqlalchemy.orm import Session, contains_eager, joinedload, object_session
+
+from cache import TTLCache
+from models import db, Property, PropertyViewStat, Booking, Billing, Message, Policy
+from viewcounter import view_series
+
+
+# Rows shown per list on the dashboard
+DASHBOARD_ROWS = 3
+
+# (user id, widget, query args) -> (html, etag)
+dashboard_cache = TTLCache(maxsize=2048, ttl=60)
+
+
+def landlord_bookings(landlord_id, status=None):
+    """Bookings on a landlord's properties, newest first, tenant and property loaded"""
+    query = (
+        Booking.query.join(Property, Booking.property_id == Property.id)
+        .filter(Property.landlord_id == landlord_id)
+        .options(contains_eager(Booking.property_obj), joinedload(Booking.tenant))
+    )
+    if status is not None:
+        query = query.filter(Booking.status == status)
+    return query.order_by(Booking.created_at.desc(), Booking.id.desc())
+
+
+def landlord_bills(landlord_id):
+    """Bills on a landlord's properties, newest first, tenant and property loaded"""
+    return (
+        Billing.query.join(Property, Billing.property_id == Property.id)
+        .filter(Property.landlord_id == landlord_id)
+        .options(contains_eager(Billing.property_obj), joinedload(Billing.tenant))
+        .order_by(Billing.created_at.desc(), Billing.id.desc())
+    )
+
+
+def tenant_bookings(tenant_id, status=None):
+    """A tenant's bookings, newest first, property loaded"""
+    query = Booking.query.filter(Booking.tenant_id == tenant_id).options(joinedload(Booking.property_obj))
+    if status is not None:
+        query = query.filter(Booking.status == status)
+    return query.order_by(Booking.created_at.desc(), Booking.id.desc())
+
+
+def tenant_bills(tenant_id):
+    """A tenant's bills, newest first, property loaded"""
+    return (
+        Billing.query.filter(Billing.tenant_id == tenant_id)
+        .options(joinedload(Billing.property_obj))
+        .order_by(Billing.created_at.desc(), Billing.id.desc())
+    )
+
+
+def _user_bookings(user):
+    return landlord_bookings(user.id) if user.role == 'landlord' else tenant_bookings(user.id)
+
+
+def _user_bills(user):
+    return landlord_bills(user.id) if user.role == 'landlord' else tenant_bills(user.id)
+
+
+def _status_counts(model, user):
+    """{status: rows} of a model's rows on a landlord's properties or of a tenant"""
+    query = db.session.query(model.status, db.func.count(model.id))
+    if user.role == 'landlord':
+        query = query.join(Property, model.property_id == Property.id).filter(Property.landlord_id == user.id)
+    else:
+        query = query.filter(model.tenant_id == user.id)
+    return dict(query.group_by(model.status).all())
+
+
+def _upcoming_bills(user, rows):
+    """Unpaid and overdue bills, soonest due first (bills without a due date last)"""
+    return (
+        _user_bills(user)
+        .filter(Billing.status != 'paid')
+        .order_by(None)
+        .order_by(Billing.due_date.is_(None), Billing.due_date, Billing.id)
+        .limit(rows).all()
+    )
+
+
+def summary_widget(user, args):
+    """Booking and bill counts (and the property count for landlords)"""
+    bookings = _status_counts(Booking, user)
+    bills = _status_counts(Billing, user)
+    context = {
+        'total_bookings': sum(bookings.values()),
+        'approved_bookings': bookings.get('approved', 0),
+        'pending_bookings_count': bookings.get('pending', 0),
+        'total_bills': sum(bills.values()),
+        'paid_bills': bills.get('paid', 0),
+        'unpaid_bills': bills.get('unpaid', 0),
+    }
+    if user.role == 'landlord':
+        context['total_properties'] = Property.query.filter_by(landlord_id=user.id).count()
+    return context
+
+
+def views_widget(user, args):
+    """Views over time of each of a landlord's properties, from the rollup table"""
+    view_period = args.get('views', 'week')
+    if view_period not in PropertyViewStat.PERIODS:
+        view_period = 'week'
+    properties = Property.query.filter_by(landlord_id=user.id).order_by(Property.id).all()
+    view_starts, series = view_series([prop.id for prop in properties], period=view_period)
+    date_format = '%b %Y' if view_period == 'month' else '%b %d'
+    return {
+        'view_period': view_period,
+        'view_labels': [start.strftime(date_format) for start in view_starts],
+        'view_stats': [
+            {
+                'property': prop,
+                'points': series[prop.id],
+                'total': sum(series[prop.id]),
+                'peak': max(series[prop.id]) if series[prop.id] else 0
+            }
+            for prop in properties
+        ],
+    }
+
+
+def activity_widget(user, args, rows=DASHBOARD_ROWS):
+    """Newest pending bookings and bills (and approved bookings for tenants)"""
+    context = {
+        'pending_bookings': _user_bookings(user).filter(Booking.status == 'pending').limit(rows).all(),
+        'tenant_bills': _user_bills(user).limit(rows).all(),
+        'bookings': [],
+    }
+    if user.role != 'landlord':
+        context['bookings'] = tenant_bookings(user.id, status='approved').limit(rows).all()
+    return context
+
+
+def payments_widget(user, args, rows=DASHBOARD_ROWS):
+    """Unpaid bills due soonest"""
+    return {
+        'has_bills': db.session.query(_user_bills(user).order_by(None).exists()).scalar(),
+        'upcoming_bills': _upcoming_bills(user, rows),
+    }
+
+
+def messages_widget(user, args, rows=DASHBOARD_ROWS):
+    """Newest messages sent or received, with both parties loaded"""
+    messages = (
+        Message.query.filter((Message.sender_id == user.id) | (Message.receiver_id == user.id))
+        .options(joinedload(Message.sender), joinedload(Message.receiver))
+        .order_by(Message.timestamp.desc())
+        .limit(rows).all()
+    )
+    return {'messages': messages}
+
+
+def policies_widget(user, args):
+    """Policies for the user's role"""
+    policies = Policy.query.filter(
+        (Policy.applicable_role == user.role) | (Policy.applicable_role == 'all')
+    ).all()
+    return {'policies': policies}
+
+
+class Widget:
+    """A dashboard widget: its builder, partial template and browser cache lifetime"""
+
+    def __init__(self, name, build, roles=('landlord', 'tenant'), max_age=0, args=()):
+        self.name = name
+        self.build = build
+        self.roles = roles
+        self.template = f"dashboard_widgets/{name}.html"
+        # Seconds the browser may reuse the widget without revalidating
+        self.max_age = max_age
+        # Query arguments the builder reads
+        self.args = args
+
+    def cache_key(self, user_id, args):
+        return (user_id, self.name, tuple(args.get(arg) for arg in self.args))
+
+
+WIDGETS = {
+    widget.name: widget for widget in (
+        Widget('summary', summary_widget),
+        Widget('views', views_widget, roles=('landlord',), args=('views',)),
+        Widget('activity', activity_widget),
+        Widget('payments', payments_widget),
+        Widget('messages', messages_widget),
+        Widget('policies', policies_widget, max_age=300),
+    )
+}
+
+
+def invalidate_widgets(user_ids=None, widgets=None):
+    """Drop cached widgets of the given users (None: everyone); returns entries dropped"""
+    return dashboard_cache.pop_where(
+        lambda key: (user_ids is None or key[0] in user_ids) and (widgets is None or key[1] in widgets)
+    )
+
+
+# ---- Invalidation on data changes ----
+
+_PENDING = 'dashboard_invalidations'
+
+# Widgets showing each model's rows
+_BOOKING_WIDGETS = frozenset({'summary', 'activity', 'payments'})
+_BILL_WIDGETS = frozenset({'summary', 'activity', 'payments'})
+_MESSAGE_WIDGETS = frozenset({'messages'})
+_PROPERTY_WIDGETS = frozenset({'summary', 'views', 'activity', 'payments'})
+_POLICY_WIDGETS = frozenset({'policies'})
+
+
+def _changed(target, user_ids, widgets):
+    """Drop the affected entries now and again once the transaction commits"""
+    invalidate_widgets(user_ids, widgets)
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING, []).append((user_ids, widgets))
+
+
+def _landlord_of(connection, property_id):
+    return connection.execute(
+        db.select(Property.landlord_id).where(Property.id == property_id)
+    ).scalar()
+
+
+def _tenant_row_changed(widgets):
+    def listener(mapper, connection, target):
+        _changed(target, {target.tenant_id, _landlord_of(connection, target.property_id)}, widgets)
+    return listener
+
+
+def _message_changed(mapper, connection, target):
+    _changed(target, {target.sender_id, target.receiver_id}, _MESSAGE_WIDGETS)
+
+
+def _property_changed(mapper, connection, target):
+    _changed(target, {target.landlord_id}, _PROPERTY_WIDGETS)
+
+
+def _policy_changed(mapper, connection, target):
+    _changed(target, None, _POLICY_WIDGETS)
+
+
+for _model, _listener in (
+    (Booking, _tenant_row_changed(_BOOKING_WIDGETS)),
+    (Billing, _tenant_row_changed(_BILL_WIDGETS)),
+    (Message, _message_changed),
+    (Property, _property_changed),
+    (Policy, _policy_changed),
+):
+    for _event_name in ('after_insert', 'after_update', 'after_delete'):
+        event.listen(_model, _event_name, _listener)
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_committed(session):
+    for user_ids, widgets in session.info.pop(_PENDING, ()):
+        invalidate_widgets(user_ids, widgets)
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _forget_rolled_back(session, previous_transaction):
+    session.info.pop(_PENDING, None)
@@ -0,0 +1,132 @@
+"""Facet counts for the listing filter panel.
+
+Each facet is counted over the listing filtered by every *other* active
+filter, so the panel shows how many results each option would give.
+Results are cached per normalized filter key and listing stamp (see
+listing_stamps in conditional.py), so any committed property, booking,
+review or amenity change - including bulk updates that fire no mapper
+events - makes later requests miss the counts cached before it.
+"""
+import json
+
+from sqlalchemy import and_, case
+
+from cache import TTLCache
+from conditional import listing_stamps
+from listings import PRICE_BUCKETS, build_listing_query, slots_left_expression
+from models import db, Property, Booking, Amenity, property_amenities
+
+
+# Amenity values always shown in the filter panel, even at zero
+AMENITY_FACETS = ('wifi', 'ac', 'furnished', 'parking', 'kitchen', 'laundry', 'gym', 'pool', 'security')
+
+MAX_LOCATION_FACETS = 10
+
+# Filters that do not narrow the result set
+_NON_FACET_KEYS = ('sort',)
+
+facet_cache = TTLCache(maxsize=512, ttl=300)
+
+
+def facet_cache_key(filters, landlord_id=None, stamps=None):
+    """Normalized, order-independent key for a filter set at a listing stamp"""
+    normalized = {}
+    for key, value in filters.items():
+        if key in _NON_FACET_KEYS or value in (None, '', []):
+            continue
+        normalized[key] = sorted(value) if isinstance(value, list) else value
+    return json.dumps([landlord_id, normalized, stamps], sort_keys=True, default=str)
+
+
+def _without(filters, key):
+    """Copy of filters with one facet's own selection cleared"""
+    relaxed = dict(filters)
+    relaxed[key] = []
+    return relaxed
+
+
+def _grouped_counts(filters, facet_key, column, landlord_id, limit=None):
+    query = (
+        build_listing_query(_without(filters, facet_key), landlord_id=landlord_id)
+        .with_entities(column, db.func.count(Property.id))
+        .filter(column.isnot(None))
+        .group_by(column)
+        .order_by(db.func.count(Property.id).desc(), column)
+    )
+    if limit:
+        query = query.limit(limit)
+    return {value: count for value, count in query.all() if value != ''}
+
+
+def _conditional_counts(filters, facet_key, conditions, landlord_id):
+    """One aggregate row with a SUM(CASE ...) per facet value"""
+    query = build_listing_query(_without(filters, facet_key), landlord_id=landlord_id).with_entities(
+        *[db.func.coalesce(db.func.sum(case((cond, 1), else_=0)), 0) for cond in conditions.values()]
+    )
+    row = query.one()
+    return {name: int(count) for name, count in zip(conditions, row)}
+
+
+def _amenity_counts(filters, landlord_id):
+    """Per-amenity counts via a GROUP BY over the association table"""
+    matching = build_listing_query(_without(filters, 'amenity'), landlord_id=landlord_id).with_entities(Property.id)
+    rows = (
+        db.session.query(Amenity.name, db.func.count(property_amenities.c.property_id))
+        .join(property_amenities, property_amenities.c.amenity_id == Amenity.id)
+        .filter(property_amenities.c.property_id.in_(matching.subquery().select()))
+        .group_by(Amenity.name)
+        .all()
+    )
+    counts = {name: 0 for name in AMENITY_FACETS}
+    counts.update({name: count for name, count in rows})
+    return counts
+
+
+def _price_conditions():
+    conditions = {}
+    for bucket, (low, high) in PRICE_BUCKETS.items():
+        parts = []
+        if low is not None:
+            parts.append(Property.price > low)
+        if high is not None:
+            parts.append(Property.price <= high)
+        conditions[bucket] = and_(*parts)
+    return conditions
+
+
+def compute_facet_counts(filters, landlord_id=None):
+    """Run the grouped facet queries for a filter set (uncached)"""
+    gender = _grouped_counts(filters, 'gender', db.func.lower(Property.gender_preference), landlord_id)
+    # Listings without a preference are shown as mixed
+    unspecified = build_listing_query(_without(filters, 'gender'), landlord_id=landlord_id).filter(
+        Property.gender_preference.is_(None)
+    ).count()
+    if unspecified:
+        gender['both'] = gender.get('both', 0) + unspecified
+
+    slots_left = slots_left_expression()
+    return {
+        'property_type': _grouped_counts(filters, 'property_type', db.func.lower(Property.property_type), landlord_id),
+        'location': _grouped_counts(filters, 'location', Property.location, landlord_id, limit=MAX_LOCATION_FACETS),
+        'gender': gender,
+        'amenity': _amenity_counts(filters, landlord_id),
+        'price': _conditional_counts(filters, 'price', _price_conditions(), landlord_id),
+        'availability': _conditional_counts(
+            filters, 'availability', {'available': slots_left > 0, 'full': slots_left <= 0}, landlord_id
+        ),
+    }
+
+
+def get_facet_counts(filters, landlord_id=None, stamps=None):
+    """Facet counts for a filter set, served from cache when possible.
+
+    Pass the listing_stamps() the caller already read to save a query.
+    """
+    if stamps is None:
+        stamps = listing_stamps()
+    key = facet_cache_key(filters, landlord_id, stamps)
+    facets = facet_cache.get(key)
+    if facets is None:
+        facets = compute_facet_counts(filters, landlord_id=landlord_id)
+        facet_cache.set(key, facets)
+    return facets
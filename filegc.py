@@ -0,0 +1,244 @@
+"""Background removal of upload files.
+
+Requests never delete files themselves. release_upload() queues a blob
+(with its variants) on the process-wide file_collector, whose worker
+thread deletes it through the storage backend - once it has checked,
+right before each delete, that no row references the blob again and no
+upload stored it again since it was released, since content-addressed
+blobs can be re-used by a later upload. Failed deletions are retried a few times.
+
+Anything that still leaks (a crash before the queue drained, deletes that
+kept failing, spool files of aborted requests) is reclaimed by
+sweep_orphans(), which diffs the files in storage against every filename
+referenced in the database and deletes unreferenced files older than a
+grace period in batches. It runs periodically when UPLOAD_SWEEP_INTERVAL
+is set, and as `flask sweep-uploads`.
+"""
+import atexit
+import os
+import queue
+import threading
+import time
+
+from images import VARIANT_FORMATS, VARIANT_WIDTHS, remove_image_files, variant_filename
+from models import db, PropertyImage, User
+from storage import STATIC_FILES, get_storage
+from uploads import REFERENCE_COLUMNS
+
+
+# Most queued blobs checked and deleted per worker pass
+DELETE_BATCH = 100
+
+# Attempts per blob before it is left to the orphan sweeper
+MAX_DELETE_ATTEMPTS = 3
+
+# Files younger than this are never swept: they may belong to an upload
+# whose row is not committed yet
+DEFAULT_SWEEP_MIN_AGE = 3600
+SWEEP_BATCH = 500
+
+# Temporary files written next to the blobs (uploads.py, storage.py)
+SPOOL_PREFIXES = ('.upload-', '.read-')
+
+
+def referenced_names(filenames=None):
+    """Blob names referenced by any image column, optionally limited to filenames"""
+    names = set()
+    for column in REFERENCE_COLUMNS:
+        query = db.session.query(column).filter(column.isnot(None))
+        if filenames is not None:
+            query = query.filter(column.in_(list(filenames)))
+        names.update(name for (name,) in query.distinct())
+    return names
+
+
+def _variant_names(filename):
+    return {variant_filename(filename, variant, fmt) for variant in VARIANT_WIDTHS for fmt in VARIANT_FORMATS}
+
+
+def _recorded_variant_names():
+    names = set()
+    for (variants,) in db.session.query(PropertyImage.variants).filter(PropertyImage.variants.isnot(None)):
+        names.update(entry[fmt] for entry in variants.values() for fmt in VARIANT_FORMATS if fmt in entry)
+    for (records,) in db.session.query(User.image_variants).filter(User.image_variants.isnot(None)):
+        for variants in records.values():
+            names.update(entry[fmt] for entry in variants.values() for fmt in VARIANT_FORMATS if fmt in entry)
+    return names
+
+
+def _stored_since(storage, name, since):
+    """Whether a file is referenced again or was (re)stored after since"""
+    if referenced_names({name}):
+        return True
+    modified = storage.modified(name)
+    return modified is not None and modified >= since
+
+
+def live_file_names():
+    """Every stored name that must be kept: referenced blobs and their variants"""
+    names = set(STATIC_FILES)
+    for filename in referenced_names():
+        names.add(filename)
+        names.update(_variant_names(filename))
+    names.update(_recorded_variant_names())
+    return names
+
+
+class FileCollector:
+    """Queue of released blobs, deleted by a background worker"""
+
+    def __init__(self, batch_size=DELETE_BATCH, max_attempts=MAX_DELETE_ATTEMPTS):
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self._queue = queue.Queue()
+        self._thread = None
+        self._stop = threading.Event()
+
+    def enqueue(self, filename, variants=None):
+        """Queue a blob and its variants for deletion (no I/O, no database access)"""
+        if filename and filename not in STATIC_FILES:
+            self._queue.put((filename, variants, 0, time.time()))
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def _take_batch(self, timeout=None):
+        batch = []
+        try:
+            batch.append(self._queue.get(timeout=timeout))
+            while len(batch) < self.batch_size:
+                batch.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    def collect(self, batch):
+        """Delete the unreferenced blobs of a batch; returns blobs deleted"""
+        storage = get_storage()
+        still_used = referenced_names({filename for filename, _, _, _ in batch})
+        db.session.remove()
+        deleted = 0
+        for filename, variants, attempts, released_at in batch:
+            # Uploaded again since it was released: _store touches existing
+            # blobs before their new row is committed
+            if filename in still_used or _stored_since(storage, filename, released_at):
+                continue
+            db.session.remove()
+            try:
+                remove_image_files(filename, variants)
+                deleted += 1
+            except Exception as e:
+                if attempts + 1 < self.max_attempts:
+                    self._queue.put((filename, variants, attempts + 1, released_at))
+                else:
+                    print(f"⚠️ [FILES] Giving up on {filename} (left to the sweeper): {e}")
+        db.session.remove()
+        return deleted
+
+    def drain(self):
+        """Process the queue synchronously until it is empty; returns blobs deleted"""
+        deleted = 0
+        while True:
+            batch = self._take_batch(timeout=0)
+            if not batch:
+                return deleted
+            deleted += self.collect(batch)
+
+    def start(self, app, sweep_interval=None, sweep_min_age=DEFAULT_SWEEP_MIN_AGE):
+        """Start the worker thread (once per process), optionally sweeping orphans"""
+        if self._thread is not None:
+            return
+
+        def run():
+            next_sweep = time.monotonic() + sweep_interval if sweep_interval else None
+            while not self._stop.is_set():
+                batch = self._take_batch(timeout=1)
+                with app.app_context():
+                    try:
+                        if batch:
+                            self.collect(batch)
+                        if next_sweep is not None and time.monotonic() >= next_sweep:
+                            next_sweep = time.monotonic() + sweep_interval
+                            swept = sweep_orphans(app.config['UPLOAD_FOLDER'], min_age=sweep_min_age)
+                            if swept:
+                                print(f"🧹 [FILES] Swept {swept} orphaned upload files")
+                    except Exception as e:
+                        for item in batch:
+                            self._queue.put(item)
+                        print(f"⚠️ [FILES] Cleanup failed, will retry: {e}")
+                        self._stop.wait(5)
+
+        self._thread = threading.Thread(target=run, name='file-collector', daemon=True)
+        self._thread.start()
+
+        def drain_on_exit():
+            self._stop.set()
+            with app.app_context():
+                try:
+                    self.drain()
+                except Exception as e:
+                    print(f"⚠️ [FILES] Final cleanup failed: {e}")
+
+        atexit.register(drain_on_exit)
+
+
+file_collector = FileCollector()
+
+
+def release_upload(filename, variants=None):
+    """Queue a blob and its variants for deletion once nothing references it.
+
+    Call after the referencing rows were deleted or repointed and the
+    change committed; the worker re-checks references before deleting.
+    """
+    file_collector.enqueue(filename, variants)
+
+
+def _sweep_spool(upload_folder, cutoff, dry_run):
+    """Remove temporary files left behind by aborted uploads and reads"""
+    removed = 0
+    if not os.path.isdir(upload_folder):
+        return removed
+    for entry in os.scandir(upload_folder):
+        if entry.name.startswith(SPOOL_PREFIXES) and entry.stat().st_mtime < cutoff:
+            if not dry_run:
+                os.remove(entry.path)
+            removed += 1
+    return removed
+
+
+def sweep_orphans(upload_folder, min_age=DEFAULT_SWEEP_MIN_AGE, batch_size=SWEEP_BATCH, dry_run=False):
+    """Delete stored files no row references; returns the number of files deleted.
+
+    Only files older than min_age seconds are considered. References are
+    re-read before every batch, and each file is checked once more right
+    before it is deleted in case it was uploaded again meanwhile.
+    """
+    cutoff = time.time() - min_age
+    storage = get_storage()
+    swept = _sweep_spool(upload_folder, cutoff, dry_run)
+
+    live = live_file_names()
+    candidates = [name for name, modified in storage.list_files() if modified < cutoff and name not in live]
+    for start in range(0, len(candidates), batch_size):
+        if start:
+            # Re-read references between batches: a blob may have been uploaded again
+            live = live_file_names()
+        db.session.remove()
+        deletions = []
+        for name in candidates[start:start + batch_size]:
+            if name in live:
+                continue
+            if dry_run:
+                swept += 1
+            elif not _stored_since(storage, name, cutoff):
+                deletions.append((name, storage.delete(name)))
+        db.session.remove()
+        # S3 deletions run in the background; count only those that succeeded
+        for name, result in deletions:
+            error = result.exception() if result is not None else None
+            if error is not None:
+                print(f"⚠️ [FILES] Could not sweep {name}: {error}")
+            else:
+                swept += 1
+    return swept
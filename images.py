@@ -0,0 +1,198 @@
+"""Upload image pipeline: resized WebP/JPEG variants built off the request thread.
+
+Every uploaded photo is kept as uploaded and additionally rendered into
+fixed-width variants (thumb, card, full) in WebP and JPEG, stored through
+the upload storage backend under variants/. The generated variants are recorded on the owning
+row - PropertyImage.variants, or User.image_variants keyed by column name -
+and templates build srcset attributes from that record. Rows without a
+record (not yet processed, or Pillow missing) fall back to the original.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from models import db, Property, PropertyImage, User
+from storage import get_storage, upload_url
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow is optional; uploads are then served as-is
+    Image = None
+
+
+# Variant name -> maximum width in pixels
+VARIANT_WIDTHS = {
+    'thumb': 320,
+    'card': 640,
+    'full': 1600,
+}
+
+# Output format -> (file extension, Pillow save options)
+VARIANT_FORMATS = {
+    'webp': ('webp', {'quality': 80, 'method': 4}),
+    'jpeg': ('jpg', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+VARIANT_DIR = 'variants'
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='image-variants')
+
+
+def variant_filename(filename, variant, fmt):
+    """Path of a variant relative to the uploads folder"""
+    stem = os.path.splitext(filename)[0]
+    return f"{VARIANT_DIR}/{stem}__{variant}.{VARIANT_FORMATS[fmt][0]}"
+
+
+def build_variants(upload_folder, filename):
+    """Render every variant of one upload; returns the variants record.
+
+    The record maps variant name to {'width', 'height', 'webp', 'jpeg'},
+    with storage names relative to the uploads root. Variants are rendered
+    into upload_folder and then handed to the storage backend.
+    """
+    if Image is None:
+        return None
+
+    storage = get_storage()
+    os.makedirs(os.path.join(upload_folder, VARIANT_DIR), exist_ok=True)
+    with storage.local_copy(filename) as source, Image.open(source) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode in ('RGBA', 'LA', 'P'):
+            # JPEG has no alpha channel, so flatten transparent PNGs onto white
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            image = background
+        elif image.mode != 'RGB':
+            image = image.convert('RGB')
+
+        record = {}
+        for variant, max_width in VARIANT_WIDTHS.items():
+            resized = image
+            if image.width > max_width:
+                height = round(image.height * max_width / image.width)
+                resized = image.resize((max_width, height), Image.LANCZOS)
+            entry = {'width': resized.width, 'height': resized.height}
+            for fmt, (_, options) in VARIANT_FORMATS.items():
+                name = variant_filename(filename, variant, fmt)
+                path = os.path.join(upload_folder, name)
+                resized.save(path, format=fmt.upper(), **options)
+                storage.put_file(name, path)
+                entry[fmt] = name
+            record[variant] = entry
+    return record
+
+
+def _process(app, kind, record_id, filename, column=None):
+    with app.app_context():
+        try:
+            # Deduplicated uploads share variants with earlier rows of the same blob
+            shared = PropertyImage.query.filter(
+                PropertyImage.filename == filename, PropertyImage.variants.isnot(None)
+            ).first()
+            record = shared.variants if shared else build_variants(app.config['UPLOAD_FOLDER'], filename)
+            if record is None:
+                return
+            if kind == 'property_image':
+                image = db.session.get(PropertyImage, record_id)
+                if image is not None and image.filename == filename:
+                    image.variants = record
+            else:
+                user = db.session.get(User, record_id)
+                if user is not None and getattr(user, column) == filename:
+                    user.image_variants = {**(user.image_variants or {}), column: record}
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            print(f"⚠️ [IMAGES] Could not build variants for {filename}: {e}")
+        finally:
+            db.session.remove()
+
+
+def process_property_image(app, image):
+    """Queue variant generation for a committed PropertyImage"""
+    if Image is not None:
+        _executor.submit(_process, app, 'property_image', image.id, image.filename)
+
+
+def process_user_image(app, user, column):
+    """Queue variant generation for a committed User image column"""
+    filename = getattr(user, column)
+    if Image is not None and filename:
+        _executor.submit(_process, app, 'user', user.id, filename, column)
+
+
+def backfill_image_variants(upload_folder):
+    """Build variants for every image uploaded before the pipeline existed.
+
+    Also records a primary PropertyImage row for main images that only
+    live in Property.image. Runs synchronously; returns images processed.
+    """
+    if Image is None:
+        return 0
+
+    recorded = {(img.property_id, img.filename) for img in PropertyImage.query.all()}
+    for prop in Property.query.filter(Property.image.isnot(None)).all():
+        if (prop.id, prop.image) not in recorded:
+            db.session.add(PropertyImage(property_id=prop.id, filename=prop.image, is_primary=True))
+    db.session.commit()
+
+    processed = 0
+    targets = [(img, 'variants', img.filename) for img in PropertyImage.query.filter(PropertyImage.variants.is_(None))]
+    for user in User.query.all():
+        for column in ('profile_pic', 'license_image'):
+            filename = getattr(user, column)
+            if filename and column not in (user.image_variants or {}):
+                targets.append((user, column, filename))
+
+    for row, column, filename in targets:
+        if not get_storage().exists(filename):
+            continue
+        try:
+            record = build_variants(upload_folder, filename)
+        except Exception as e:
+            print(f"⚠️ [IMAGES] Could not build variants for {filename}: {e}")
+            continue
+        if column == 'variants':
+            row.variants = record
+        else:
+            row.image_variants = {**(row.image_variants or {}), column: record}
+        db.session.commit()
+        processed += 1
+    return processed
+
+
+def image_srcset(variants, fmt='jpeg'):
+    """srcset value ('url 320w, url 640w, ...') for a variants record"""
+    if not variants:
+        return ''
+    # Small originals give several variants of the same width; list each width once
+    by_width = {}
+    for entry in variants.values():
+        if fmt in entry:
+            by_width.setdefault(entry['width'], entry[fmt])
+    return ', '.join(f"{upload_url(name)} {width}w" for width, name in sorted(by_width.items()))
+
+
+def image_src(filename, variants=None, variant='full'):
+    """URL for the JPEG of one variant, or the original upload"""
+    if variants and variant in variants:
+        return upload_url(variants[variant]['jpeg'])
+    return upload_url(filename)
+
+
+def remove_image_files(filename, variants=None):
+    """Delete an upload and its variant files from storage, ignoring missing ones"""
+    if not filename:
+        return
+    names = {filename}
+    names.update(variant_filename(filename, variant, fmt) for variant in VARIANT_WIDTHS for fmt in VARIANT_FORMATS)
+    for entry in (variants or {}).values():
+        names.update(entry[fmt] for fmt in VARIANT_FORMATS if fmt in entry)
+    storage = get_storage()
+    # S3 deletions run in the background; wait so a failure reaches the caller
+    results = [storage.delete(name) for name in names]
+    errors = [result.exception() for result in results if result is not None]
+    for error in errors:
+        if error is not None:
+            raise error
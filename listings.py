@@ -0,0 +1,327 @@
+"""Server-side property listing queries (filters, sorting, pagination)"""
+import base64
+import json
+from datetime import datetime
+
+from sqlalchemy import and_, case, or_, tuple_
+from sqlalchemy.orm import joinedload, selectinload
+
+from models import db, Property, Booking, Amenity, property_amenities
+from search import apply_text_search, rank_order
+
+
+# Pagination defaults for the listing page
+DEFAULT_PER_PAGE = 12
+MAX_PER_PAGE = 48
+
+# Price buckets used by the filter panel: (exclusive lower, inclusive upper)
+PRICE_BUCKETS = {
+    'budget': (None, 3000),
+    'mid-range': (3000, 6000),
+    'premium': (6000, None),
+}
+
+# Minimum average rating for the rating filter
+RATING_THRESHOLDS = {
+    'high': 4.5,
+    'good': 4.0,
+}
+
+SORT_OPTIONS = ('default', 'price-low', 'price-high', 'newest', 'slots')
+
+# Keyset orderings for the JSON API: sort -> (key column, descending?)
+KEYSET_SORTS = {
+    'newest': (Property.created_at, True),
+    'price-low': (Property.price, False),
+    'price-high': (Property.price, True),
+}
+
+# Only what a listing card needs - notably not the description Text
+CARD_COLUMNS = (
+    Property.id,
+    Property.title,
+    Property.price,
+    Property.location,
+    Property.property_type,
+    Property.gender_preference,
+    Property.status,
+    Property.image,
+    Property.slots,
+    Property.approved_booking_count,
+    Property.review_count,
+    Property.rating_sum,
+    Property.landlord_id,
+    Property.created_at,
+)
+
+
+def _clean_list(values):
+    """Strip, lowercase and de-duplicate a list of query string values"""
+    cleaned = []
+    for value in values:
+        value = (value or '').strip().lower()
+        if value and value not in cleaned:
+            cleaned.append(value)
+    return cleaned
+
+
+def _to_float(value):
+    """Parse a float query argument, ignoring bad input"""
+    try:
+        return float(value) if value not in (None, '') else None
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_listing_filters(args):
+    """Normalize listing filters from request.args into a plain dict"""
+    sort = (args.get('sort') or 'default').strip().lower()
+    if sort not in SORT_OPTIONS:
+        sort = 'default'
+
+    return {
+        'q': (args.get('q') or '').strip(),
+        'location': _clean_list(args.getlist('location')),
+        'property_type': _clean_list(args.getlist('property_type')),
+        'status': _clean_list(args.getlist('status')),
+        'gender': _clean_list(args.getlist('gender')),
+        'amenity': _clean_list(args.getlist('amenity')),
+        'price': [p for p in _clean_list(args.getlist('price')) if p in PRICE_BUCKETS],
+        'min_price': _to_float(args.get('min_price')),
+        'max_price': _to_float(args.get('max_price')),
+        'availability': [a for a in _clean_list(args.getlist('availability')) if a in ('available', 'full')],
+        'rating': [r for r in _clean_list(args.getlist('rating')) if r in RATING_THRESHOLDS],
+        'sort': sort,
+    }
+
+
+def average_rating_expression():
+    """SQL expression for a property's average rating (0 when unrated)"""
+    return case(
+        (Property.review_count > 0, db.cast(Property.rating_sum, db.Float) / Property.review_count),
+        else_=0
+    )
+
+
+def slots_left_expression():
+    """SQL expression for the number of free slots on a property"""
+    return Property.slots - Property.approved_booking_count
+
+
+def properties_with_all_amenities(amenities):
+    """Subquery of property ids that have every amenity in the list"""
+    return (
+        db.select(property_amenities.c.property_id)
+        .join(Amenity, Amenity.id == property_amenities.c.amenity_id)
+        .where(Amenity.name.in_(amenities))
+        .group_by(property_amenities.c.property_id)
+        .having(db.func.count(db.distinct(Amenity.id)) == len(amenities))
+    )
+
+
+def build_listing_query(filters, landlord_id=None):
+    """Build a filtered (unsorted) Property query from parsed filters"""
+    query = Property.query
+
+    if landlord_id is not None:
+        query = query.filter(Property.landlord_id == landlord_id)
+
+    if filters['q']:
+        query = apply_text_search(query, filters['q'])
+
+    if filters['location']:
+        query = query.filter(or_(*[Property.location.ilike(f'%{loc}%') for loc in filters['location']]))
+
+    if filters['property_type']:
+        query = query.filter(db.func.lower(Property.property_type).in_(filters['property_type']))
+
+    if filters['status']:
+        query = query.filter(Property.status.in_(filters['status']))
+
+    if filters['gender']:
+        gender_conditions = [Property.gender_preference.in_(filters['gender'])]
+        if 'both' in filters['gender']:
+            gender_conditions.append(Property.gender_preference.is_(None))
+        query = query.filter(or_(*gender_conditions))
+
+    # Every selected amenity must be present (set intersection on the index)
+    if filters['amenity']:
+        query = query.filter(Property.id.in_(properties_with_all_amenities(filters['amenity'])))
+
+    if filters['price']:
+        bucket_conditions = []
+        for bucket in filters['price']:
+            low, high = PRICE_BUCKETS[bucket]
+            parts = []
+            if low is not None:
+                parts.append(Property.price > low)
+            if high is not None:
+                parts.append(Property.price <= high)
+            bucket_conditions.append(and_(*parts))
+        query = query.filter(or_(*bucket_conditions))
+
+    if filters['min_price'] is not None:
+        query = query.filter(Property.price >= filters['min_price'])
+    if filters['max_price'] is not None:
+        query = query.filter(Property.price <= filters['max_price'])
+
+    # "Available" and "full" together mean no restriction
+    if len(filters['availability']) == 1:
+        if filters['availability'][0] == 'available':
+            query = query.filter(slots_left_expression() > 0)
+        else:
+            query = query.filter(slots_left_expression() <= 0)
+
+    if filters['rating']:
+        threshold = min(RATING_THRESHOLDS[r] for r in filters['rating'])
+        query = query.filter(average_rating_expression() >= threshold)
+
+    return query
+
+
+def apply_listing_sort(query, sort, q=''):
+    """Apply a sort option, always ending with the primary key for stable pages"""
+    if sort == 'default' and q:
+        rank = rank_order(q)
+        if rank is not None:
+            return query.order_by(rank, Property.created_at.desc(), Property.id.desc())
+    if sort == 'price-low':
+        return query.order_by(Property.price.asc(), Property.id.asc())
+    if sort == 'price-high':
+        return query.order_by(Property.price.desc(), Property.id.desc())
+    if sort == 'slots':
+        return query.order_by(slots_left_expression().desc(), Property.id.desc())
+    # 'newest' and unranked 'default' list the latest properties first
+    return query.order_by(Property.created_at.desc(), Property.id.desc())
+
+
+def get_page_args(args):
+    """Read page and per_page from request.args with sane bounds"""
+    page = args.get('page', 1, type=int) or 1
+    per_page = args.get('per_page', DEFAULT_PER_PAGE, type=int) or DEFAULT_PER_PAGE
+    return max(page, 1), max(1, min(per_page, MAX_PER_PAGE))
+
+
+def paginate_listing(filters, page, per_page, landlord_id=None):
+    """Return a Flask-SQLAlchemy Pagination of filtered, sorted properties"""
+    query = build_listing_query(filters, landlord_id=landlord_id)
+    query = apply_listing_sort(query, filters['sort'], q=filters['q'])
+    query = query.options(
+        joinedload(Property.owner),
+        selectinload(Property.amenity_items),
+        selectinload(Property.primary_image)
+    )
+    return query.paginate(page=page, per_page=per_page, max_per_page=MAX_PER_PAGE, error_out=False)
+
+
+def listing_projection(property_ids, user_id=None):
+    """Booking stats for a page of properties in one grouped query.
+
+    Returns {property_id: {'approved_count', 'total_bookings',
+    'user_has_booked', 'user_booking_status'}}. When the user has several
+    bookings on a property, approved wins over pending over rejected.
+    """
+    stats = {
+        pid: {
+            'approved_count': 0,
+            'total_bookings': 0,
+            'user_has_booked': False,
+            'user_booking_status': None,
+        }
+        for pid in property_ids
+    }
+    if not property_ids:
+        return stats
+
+    def user_status_flag(status):
+        return db.func.max(case(
+            (and_(Booking.tenant_id == user_id, Booking.status == status), 1), else_=0
+        ))
+
+    rows = db.session.query(
+        Booking.property_id,
+        db.func.count(Booking.id),
+        db.func.sum(case((Booking.status == 'approved', 1), else_=0)),
+        db.func.max(case((Booking.tenant_id == user_id, 1), else_=0)),
+        user_status_flag('approved'),
+        user_status_flag('pending'),
+        user_status_flag('rejected'),
+    ).filter(
+        Booking.property_id.in_(property_ids)
+    ).group_by(Booking.property_id).all()
+
+    for pid, total, approved, has_booked, is_approved, is_pending, is_rejected in rows:
+        user_status = None
+        if is_approved:
+            user_status = 'approved'
+        elif is_pending:
+            user_status = 'pending'
+        elif is_rejected:
+            user_status = 'rejected'
+        stats[pid].update({
+            'approved_count': int(approved or 0),
+            'total_bookings': int(total or 0),
+            'user_has_booked': bool(has_booked),
+            'user_booking_status': user_status,
+        })
+    return stats
+
+
+def encode_cursor(sort, key, property_id):
+    """Opaque cursor for the row a page ended on"""
+    if isinstance(key, datetime):
+        key = key.isoformat()
+    payload = json.dumps([sort, key, property_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, sort):
+    """Decode a cursor into (key, property_id); raises ValueError if invalid"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        cursor_sort, key, property_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise ValueError('Malformed cursor')
+    if cursor_sort != sort:
+        raise ValueError('Cursor does not match the requested sort')
+    try:
+        if sort == 'newest':
+            # fromisoformat raises TypeError on non-strings, ValueError on bad dates
+            key = datetime.fromisoformat(key)
+        elif isinstance(key, bool) or not isinstance(key, (int, float)):
+            raise TypeError('Price key must be a number')
+        if isinstance(property_id, bool) or not isinstance(property_id, int):
+            raise TypeError('Property id must be an integer')
+    except (TypeError, ValueError):
+        raise ValueError('Malformed cursor')
+    return key, property_id
+
+
+def keyset_listing_page(filters, limit, cursor=None, landlord_id=None):
+    """One keyset page of listing card rows.
+
+    Returns (rows, next_cursor). Rows are Row objects with CARD_COLUMNS;
+    next_cursor is None on the last page.
+    """
+    sort = filters['sort'] if filters['sort'] in KEYSET_SORTS else 'newest'
+    key_column, descending = KEYSET_SORTS[sort]
+
+    query = build_listing_query(filters, landlord_id=landlord_id).with_entities(*CARD_COLUMNS)
+
+    if cursor:
+        key, last_id = decode_cursor(cursor, sort)
+        position = tuple_(key_column, Property.id)
+        query = query.filter(position < (key, last_id) if descending else position > (key, last_id))
+
+    if descending:
+        query = query.order_by(key_column.desc(), Property.id.desc())
+    else:
+        query = query.order_by(key_column.asc(), Property.id.asc())
+
+    rows = query.limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(sort, getattr(last, key_column.key), last.id)
+    return rows, next_cursor
@@ -0,0 +1,53 @@
+"""add denormalized booking and review aggregates to property
+
+Revision ID: 3c1f9a2b7d40
+Revises: 
+Create Date: 2026-10-17 09:12:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c1f9a2b7d40'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+AGGREGATE_COLUMNS = ('approved_booking_count', 'review_count', 'rating_sum')
+
+
+def _existing_columns(table):
+    return {col['name'] for col in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    # db.create_all() at app start already creates these on fresh databases
+    existing = _existing_columns('property')
+    with op.batch_alter_table('property') as batch_op:
+        for name in AGGREGATE_COLUMNS:
+            if name not in existing:
+                batch_op.add_column(sa.Column(name, sa.Integer(), nullable=False, server_default='0'))
+
+    # Backfill from the source tables
+    op.execute("""
+        UPDATE property SET
+            approved_booking_count = (
+                SELECT COUNT(*) FROM booking
+                WHERE booking.property_id = property.id AND booking.status = 'approved'
+            ),
+            review_count = (
+                SELECT COUNT(*) FROM review WHERE review.property_id = property.id
+            ),
+            rating_sum = (
+                SELECT COALESCE(SUM(review.rating), 0) FROM review WHERE review.property_id = property.id
+            )
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('property') as batch_op:
+        for name in reversed(AGGREGATE_COLUMNS):
+            batch_op.drop_column(name)
@@ -0,0 +1,75 @@
+"""normalize property amenities into a many-to-many table
+
+Revision ID: 5d7a0c3e9b12
+Revises: 8e4b2d6f1a93
+Create Date: 2026-10-17 13:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d7a0c3e9b12'
+down_revision = '8e4b2d6f1a93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    tables = set(sa.inspect(bind).get_table_names())
+
+    if 'amenity' not in tables:
+        op.create_table(
+            'amenity',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(length=50), nullable=False),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_amenity_name', 'amenity', ['name'], unique=True)
+
+    if 'property_amenities' not in tables:
+        op.create_table(
+            'property_amenities',
+            sa.Column('property_id', sa.Integer(), nullable=False),
+            sa.Column('amenity_id', sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(['property_id'], ['property.id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['amenity_id'], ['amenity.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('property_id', 'amenity_id')
+        )
+        op.create_index('ix_property_amenities_amenity_id', 'property_amenities', ['amenity_id', 'property_id'])
+
+    # Backfill from the comma-joined property.amenities column
+    if bind.execute(sa.text('SELECT 1 FROM property_amenities')).first() is not None:
+        return
+
+    amenity_ids = {name: id_ for id_, name in bind.execute(sa.text('SELECT id, name FROM amenity'))}
+    rows = bind.execute(sa.text(
+        "SELECT id, amenities FROM property WHERE amenities IS NOT NULL AND amenities != ''"
+    )).fetchall()
+    links = []
+    for property_id, amenities in rows:
+        names = []
+        for name in amenities.split(','):
+            name = name.strip().lower()[:50]
+            if name and name not in names:
+                names.append(name)
+        for name in names:
+            if name not in amenity_ids:
+                bind.execute(sa.text('INSERT INTO amenity (name) VALUES (:name)'), {'name': name})
+                amenity_ids[name] = bind.execute(
+                    sa.text('SELECT id FROM amenity WHERE name = :name'), {'name': name}
+                ).scalar()
+            links.append({'property_id': property_id, 'amenity_id': amenity_ids[name]})
+    if links:
+        bind.execute(sa.text(
+            'INSERT INTO property_amenities (property_id, amenity_id) VALUES (:property_id, :amenity_id)'
+        ), links)
+
+
+def downgrade():
+    op.drop_index('ix_property_amenities_amenity_id', table_name='property_amenities')
+    op.drop_table('property_amenities')
+    op.drop_index('ix_amenity_name', table_name='amenity')
+    op.drop_table('amenity')
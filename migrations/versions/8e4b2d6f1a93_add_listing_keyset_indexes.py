@@ -0,0 +1,34 @@
+"""add composite indexes for keyset listing pagination
+
+Revision ID: 8e4b2d6f1a93
+Revises: 3c1f9a2b7d40
+Create Date: 2026-10-17 11:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e4b2d6f1a93'
+down_revision = '3c1f9a2b7d40'
+branch_labels = None
+depends_on = None
+
+
+KEYSET_INDEXES = {
+    'ix_property_created_at_id': ['created_at', 'id'],
+    'ix_property_price_id': ['price', 'id'],
+}
+
+
+def upgrade():
+    existing = {ix['name'] for ix in sa.inspect(op.get_bind()).get_indexes('property')}
+    for name, columns in KEYSET_INDEXES.items():
+        if name not in existing:
+            op.create_index(name, 'property', columns)
+
+
+def downgrade():
+    for name in KEYSET_INDEXES:
+        op.drop_index(name, table_name='property')
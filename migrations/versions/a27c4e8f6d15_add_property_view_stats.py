@@ -0,0 +1,34 @@
+"""add per-day, per-week and per-month property view stats
+
+Revision ID: a27c4e8f6d15
+Revises: 5d7a0c3e9b12
+Create Date: 2026-10-17 14:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a27c4e8f6d15'
+down_revision = '5d7a0c3e9b12'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if 'property_view_stat' in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        'property_view_stat',
+        sa.Column('property_id', sa.Integer(), nullable=False),
+        sa.Column('period', sa.String(length=10), nullable=False),
+        sa.Column('period_start', sa.Date(), nullable=False),
+        sa.Column('views', sa.Integer(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['property_id'], ['property.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('property_id', 'period', 'period_start')
+    )
+
+
+def downgrade():
+    op.drop_table('property_view_stat')
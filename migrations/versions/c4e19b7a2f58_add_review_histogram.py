@@ -0,0 +1,57 @@
+"""add per-property star histogram and review ordering indexes
+
+Revision ID: c4e19b7a2f58
+Revises: a27c4e8f6d15
+Create Date: 2026-10-17 15:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4e19b7a2f58'
+down_revision = 'a27c4e8f6d15'
+branch_labels = None
+depends_on = None
+
+
+HISTOGRAM_COLUMNS = tuple(f'rating_{stars}_count' for stars in range(1, 6))
+
+REVIEW_INDEXES = {
+    'ix_review_property_created_at': ['property_id', 'created_at'],
+    'ix_review_property_helpful': ['property_id', 'helpful_count'],
+    'ix_review_property_rating': ['property_id', 'rating'],
+}
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    # db.create_all() at app start already creates these on fresh databases
+    existing = {col['name'] for col in inspector.get_columns('property')}
+    with op.batch_alter_table('property') as batch_op:
+        for name in HISTOGRAM_COLUMNS:
+            if name not in existing:
+                batch_op.add_column(sa.Column(name, sa.Integer(), nullable=False, server_default='0'))
+
+    for stars in range(1, 6):
+        op.execute(f"""
+            UPDATE property SET rating_{stars}_count = (
+                SELECT COUNT(*) FROM review
+                WHERE review.property_id = property.id AND review.rating = {stars}
+            )
+        """)
+
+    existing_indexes = {ix['name'] for ix in inspector.get_indexes('review')}
+    for name, columns in REVIEW_INDEXES.items():
+        if name not in existing_indexes:
+            op.create_index(name, 'review', columns)
+
+
+def downgrade():
+    for name in REVIEW_INDEXES:
+        op.drop_index(name, table_name='review')
+    with op.batch_alter_table('property') as batch_op:
+        for name in reversed(HISTOGRAM_COLUMNS):
+            batch_op.drop_column(name)
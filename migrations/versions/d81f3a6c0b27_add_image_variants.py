@@ -0,0 +1,36 @@
+"""record resized image variants on property images and users
+
+Revision ID: d81f3a6c0b27
+Revises: c4e19b7a2f58
+Create Date: 2026-10-17 16:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd81f3a6c0b27'
+down_revision = 'c4e19b7a2f58'
+branch_labels = None
+depends_on = None
+
+
+VARIANT_COLUMNS = {
+    'property_images': 'variants',
+    'user': 'image_variants',
+}
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    for table, column in VARIANT_COLUMNS.items():
+        if column not in {col['name'] for col in inspector.get_columns(table)}:
+            with op.batch_alter_table(table) as batch_op:
+                batch_op.add_column(sa.Column(column, sa.JSON(), nullable=True))
+
+
+def downgrade():
+    for table, column in VARIANT_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column(column)
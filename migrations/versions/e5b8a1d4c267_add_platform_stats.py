@@ -0,0 +1,38 @@
+"""add platform stats snapshot
+
+Revision ID: e5b8a1d4c267
+Revises: d81f3a6c0b27
+Create Date: 2026-10-17 18:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5b8a1d4c267'
+down_revision = 'd81f3a6c0b27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Filled by the first admin page load or `flask rebuild-platform-stats`
+    if 'platform_stat' in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        'platform_stat',
+        sa.Column('metric', sa.String(length=30), nullable=False),
+        sa.Column('status', sa.String(length=50), nullable=False),
+        sa.Column('period', sa.String(length=10), nullable=False),
+        sa.Column('period_start', sa.Date(), nullable=False),
+        sa.Column('count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('amount', sa.Float(), server_default='0', nullable=False),
+        sa.Column('commission', sa.Float(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('metric', 'status', 'period', 'period_start')
+    )
+
+
+def downgrade():
+    op.drop_table('platform_stat')
@@ -0,0 +1,31 @@
+"""add property revision counter for conditional GET validators
+
+Revision ID: f3c6d9e2a158
+Revises: e5b8a1d4c267
+Create Date: 2026-10-17 18:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3c6d9e2a158'
+down_revision = 'e5b8a1d4c267'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    # db.create_all() at app start already creates it on fresh databases
+    existing = {col['name'] for col in inspector.get_columns('property')}
+    if 'revision' not in existing:
+        with op.batch_alter_table('property') as batch_op:
+            batch_op.add_column(sa.Column('revision', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade():
+    with op.batch_alter_table('property') as batch_op:
+        batch_op.drop_column('revision')
@@ -1,6 +1,7 @@
 from flask_sqlalchemy import SQLAlchemy
 from datetime import date, datetime, timedelta
 from flask_login import UserMixin
+from sqlalchemy import case, event, inspect
 import secrets
 import string
 
@@ -50,6 +51,7 @@ class User(db.Model, UserMixin):
     profile_pic = db.Column(db.String(200), default='default.jpg')
     trend_image = db.Column(db.String(200), nullable=True)
     license_image = db.Column(db.String(200), nullable=True)
+    image_variants = db.Column(db.JSON, nullable=True)  # Resized variants per image column (see images.py)
     
     # Account status
     is_active = db.Column(db.Boolean, default=True, nullable=False)  # NEW: For soft deletes
@@ -130,6 +132,55 @@ class User(db.Model, UserMixin):
     def __repr__(self):
         return f'<User {self.id}: {self.name} ({self.role})>'
 
+# Association table between properties and their amenities
+property_amenities = db.Table(
+    'property_amenities',
+    db.Column('property_id', db.Integer, db.ForeignKey('property.id', ondelete='CASCADE'), primary_key=True),
+    db.Column('amenity_id', db.Integer, db.ForeignKey('amenity.id', ondelete='CASCADE'), primary_key=True),
+    # The primary key covers property -> amenities; this covers amenity -> properties
+    db.Index('ix_property_amenities_amenity_id', 'amenity_id', 'property_id')
+)
+
+class Amenity(db.Model):
+    """Amenity model - one row per distinct amenity name"""
+    __tablename__ = 'amenity'
+    
+    # Primary key
+    id = db.Column(db.Integer, primary_key=True)
+    
+    # Normalized (lowercase) amenity name, e.g. 'wifi'
+    name = db.Column(db.String(50), unique=True, nullable=False, index=True)
+    
+    # Relationships
+    properties = db.relationship('Property', secondary=property_amenities, back_populates='amenity_items', lazy='dynamic')
+    
+    @staticmethod
+    def normalize_names(names):
+        """Lowercase, strip and de-duplicate amenity names, keeping order"""
+        cleaned = []
+        for name in names or []:
+            # Truncate before comparing: names differing only past 50 chars are one amenity
+            name = (name or '').strip().lower()[:50]
+            if name and name not in cleaned:
+                cleaned.append(name)
+        return cleaned
+    
+    @classmethod
+    def get_or_create_many(cls, names):
+        """Fetch Amenity rows for names, creating the missing ones"""
+        names = cls.normalize_names(names)
+        if not names:
+            return []
+        existing = {a.name: a for a in cls.query.filter(cls.name.in_(names)).all()}
+        for name in names:
+            if name not in existing:
+                existing[name] = cls(name=name)
+                db.session.add(existing[name])
+        return [existing[name] for name in names]
+    
+    def __repr__(self):
+        return f'<Amenity {self.id}: {self.name}>'
+
 class Property(db.Model):
     """Property model for rental listings"""
     __tablename__ = 'property'
@@ -161,6 +212,22 @@ class Property(db.Model):
     # NEW: View tracking
     view_count = db.Column(db.Integer, default=0, nullable=False)
     
+    # Denormalized aggregates - maintained by the Booking/Review mapper events below
+    approved_booking_count = db.Column(db.Integer, default=0, server_default='0', nullable=False)
+    review_count = db.Column(db.Integer, default=0, server_default='0', nullable=False)
+    rating_sum = db.Column(db.Integer, default=0, server_default='0', nullable=False)
+    
+    # Star histogram: number of reviews per rating
+    rating_1_count = db.Column(db.Integer, default=0, server_default='0', nullable=False)
+    rating_2_count = db.Column(db.Integer, default=0, server_default='0', nullable=False)
+    rating_3_count = db.Column(db.Integer, default=0, server_default='0', nullable=False)
+    rating_4_count = db.Column(db.Integer, default=0, server_default='0', nullable=False)
+    rating_5_count = db.Column(db.Integer, default=0, server_default='0', nullable=False)
+    
+    # Bumped by every change the listing and detail pages show that leaves
+    # updated_at alone: bookings, reviews, images, amenities, the owner's profile
+    revision = db.Column(db.Integer, default=0, server_default='0', nullable=False)
+    
     # Timestamps
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -171,6 +238,20 @@ class Property(db.Model):
     bookings = db.relationship('Booking', back_populates='property_obj', lazy='dynamic', cascade='all, delete-orphan')
     images = db.relationship('PropertyImage', back_populates='property_obj', lazy='dynamic', cascade='all, delete-orphan')
     reviews = db.relationship('Review', back_populates='property_obj', lazy='dynamic', cascade='all, delete-orphan')
+    amenity_items = db.relationship('Amenity', secondary=property_amenities, back_populates='properties', order_by='Amenity.name')
+    # The PropertyImage row for the main image, when one was recorded
+    primary_image = db.relationship(
+        'PropertyImage',
+        primaryjoin='and_(PropertyImage.property_id == Property.id, PropertyImage.filename == Property.image)',
+        viewonly=True,
+        uselist=False
+    )
+
+    # Composite indexes backing the keyset-paginated listing API
+    __table_args__ = (
+        db.Index('ix_property_created_at_id', 'created_at', 'id'),
+        db.Index('ix_property_price_id', 'price', 'id'),
+    )
 
     @property
     def daily_rate(self):
@@ -180,8 +261,7 @@ class Property(db.Model):
     @property
     def available_slots(self):
         """Calculate available slots based on approved bookings"""
-        approved_bookings = sum(1 for booking in self.bookings if booking.status == 'approved')
-        return max(0, self.slots - approved_bookings)
+        return max(0, self.slots - (self.approved_booking_count or 0))
     
     @property
     def is_available(self):
@@ -190,35 +270,45 @@ class Property(db.Model):
     
     @property
     def average_rating(self):
-        """Calculate average rating from reviews"""
-        reviews_list = list(self.reviews)
-        if not reviews_list:
+        """Calculate average rating from the stored review aggregates"""
+        if not self.review_count:
             return 0
-        return round(sum(r.rating for r in reviews_list) / len(reviews_list), 1)
+        return round(self.rating_sum / self.review_count, 1)
     
     @property
-    def review_count(self):
-        """Get total number of reviews"""
-        return self.reviews.count()
+    def rating_histogram(self):
+        """(stars, count, percent) rows from 5 stars down to 1"""
+        total = self.review_count or 0
+        rows = []
+        for stars in range(5, 0, -1):
+            count = getattr(self, f'rating_{stars}_count') or 0
+            rows.append((stars, count, round(count * 100 / total) if total else 0))
+        return rows
     
     @property
     def occupancy_rate(self):
         """Calculate occupancy rate percentage"""
         if self.slots == 0:
             return 0
-        approved_bookings = sum(1 for booking in self.bookings if booking.status == 'approved')
-        return round((approved_bookings / self.slots) * 100, 1)
+        return round(((self.approved_booking_count or 0) / self.slots) * 100, 1)
     
     def get_amenities_list(self):
-        """Get amenities as a list"""
-        if not self.amenities:
-            return []
-        return [a.strip() for a in self.amenities.split(',') if a.strip()]
+        """Get amenity names as a list"""
+        return [a.name for a in self.amenity_items]
+    
+    def set_amenities(self, names):
+        """Replace the property's amenities.
+
+        The comma-joined amenities column is kept as a denormalized copy
+        for the full-text index.
+        """
+        self.amenity_items = Amenity.get_or_create_many(names)
+        self.amenities = ','.join(a.name for a in self.amenity_items) or None
     
     def increment_view_count(self):
-        """Increment property view count"""
-        self.view_count += 1
-        db.session.commit()
+        """Count a view; buffered and written back by the view counter"""
+        from viewcounter import view_counter
+        view_counter.record(self.id)
 
     def __repr__(self):
         return f'<Property {self.id}: {self.title} | Status: {self.status}>'
@@ -230,13 +320,17 @@ class PropertyImage(db.Model):
     # Primary key
     id = db.Column(db.Integer, primary_key=True)
     
-    # Foreign keys
-    property_id = db.Column(db.Integer, db.ForeignKey('property.id', ondelete='CASCADE'), nullable=False, index=True)
+    # Foreign keys (active_history: see Booking)
+    property_id = db.column_property(
+        db.Column(db.Integer, db.ForeignKey('property.id', ondelete='CASCADE'), nullable=False, index=True),
+        active_history=True
+    )
     
     # Image data
     filename = db.Column(db.String(200), nullable=False)
     is_primary = db.Column(db.Boolean, default=False, nullable=False)  # NEW: Mark primary image
     uploaded_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    variants = db.Column(db.JSON, nullable=True)  # Resized WebP/JPEG variants (see images.py)
 
     # Relationship (renamed to avoid conflict)
     property_obj = db.relationship('Property', back_populates='images')
@@ -244,6 +338,59 @@ class PropertyImage(db.Model):
     def __repr__(self):
         return f"<PropertyImage {self.id}: {self.filename} for Property {self.property_id}>"
 
+class PropertyViewStat(db.Model):
+    """Property views per day, week (starting Monday) or month"""
+    __tablename__ = 'property_view_stat'
+
+    PERIODS = ('day', 'week', 'month')
+
+    # Composite primary key: (property, bucket size, first day of the bucket)
+    property_id = db.Column(db.Integer, db.ForeignKey('property.id', ondelete='CASCADE'), primary_key=True)
+    period = db.Column(db.String(10), primary_key=True)
+    period_start = db.Column(db.Date, primary_key=True)
+
+    views = db.Column(db.Integer, default=0, server_default='0', nullable=False)
+
+    @staticmethod
+    def bucket_start(day, period):
+        """First day of the day/week/month bucket containing day"""
+        if period == 'week':
+            return day - timedelta(days=day.weekday())
+        if period == 'month':
+            return day.replace(day=1)
+        return day
+
+    def __repr__(self):
+        return f"<PropertyViewStat {self.property_id} {self.period} {self.period_start}: {self.views}>"
+
+class PlatformStat(db.Model):
+    """Platform-wide counts and money totals per metric and status.
+
+    'day' rows bucket by the day each row was created; the 'all' row of a
+    (metric, status) holds the running total. Kept current by mapper
+    events, rebuilt from the source tables by rebuild_platform_stats().
+    """
+    __tablename__ = 'platform_stat'
+
+    PERIODS = ('day', 'all')
+    # period_start of the running-total rows
+    ALL_TIME = date(1970, 1, 1)
+    # (metric, status) of the row whose updated_at records the last full rebuild
+    REBUILD_MARKER = ('snapshot', 'rebuilt')
+
+    metric = db.Column(db.String(30), primary_key=True)
+    status = db.Column(db.String(50), primary_key=True)
+    period = db.Column(db.String(10), primary_key=True)
+    period_start = db.Column(db.Date, primary_key=True)
+
+    count = db.Column(db.Integer, default=0, server_default='0', nullable=False)
+    amount = db.Column(db.Float, default=0.0, server_default='0', nullable=False)
+    commission = db.Column(db.Float, default=0.0, server_default='0', nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<PlatformStat {self.metric}/{self.status} {self.period} {self.period_start}: {self.count}>"
+
 class Booking(db.Model):
     """Booking model for property reservations"""
     __tablename__ = 'booking'
@@ -256,13 +403,17 @@ class Booking(db.Model):
     
     # Foreign keys
     tenant_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), nullable=False, index=True)
-    property_id = db.Column(db.Integer, db.ForeignKey('property.id', ondelete='CASCADE'), nullable=False, index=True)
+    # active_history: the Property aggregate hooks need the old value, even
+    # when an expired instance is changed
+    property_id = db.column_property(db.Column(db.Integer, db.ForeignKey('property.id', ondelete='CASCADE'), nullable=False, index=True), active_history=True)
     
     # Booking details
     start_date = db.Column(db.Date, nullable=False, default=date.today, index=True)
     end_date = db.Column(db.Date, nullable=False, index=True)
     total_bill = db.Column(db.Float, default=0.0, nullable=False)
-    status = db.Column(db.String(20), default='pending', nullable=False, index=True)
+    status = db.column_property(
+        db.Column(db.String(20), default='pending', nullable=False, index=True), active_history=True
+    )
     
     # NEW: Status tracking
     approved_at = db.Column(db.DateTime, nullable=True)
@@ -458,12 +609,12 @@ class Review(db.Model):
     # Primary key
     id = db.Column(db.Integer, primary_key=True)
     
-    # Foreign keys
-    property_id = db.Column(db.Integer, db.ForeignKey('property.id', ondelete='CASCADE'), nullable=False, index=True)
+    # Foreign keys (active_history: see Booking)
+    property_id = db.column_property(db.Column(db.Integer, db.ForeignKey('property.id', ondelete='CASCADE'), nullable=False, index=True), active_history=True)
     tenant_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), nullable=False, index=True)
     
     # Review details
-    rating = db.Column(db.Integer, nullable=False, index=True)
+    rating = db.column_property(db.Column(db.Integer, nullable=False, index=True), active_history=True)
     comment = db.Column(db.Text, nullable=True)
     
     # NEW: Helpful tracking
@@ -481,6 +632,10 @@ class Review(db.Model):
     __table_args__ = (
         db.CheckConstraint('rating >= 1 AND rating <= 5', name='check_rating_range'),
         db.UniqueConstraint('property_id', 'tenant_id', name='unique_property_tenant_review'),  # One review per tenant per property
+        # Per-property orderings for the paginated review list
+        db.Index('ix_review_property_created_at', 'property_id', 'created_at'),
+        db.Index('ix_review_property_helpful', 'property_id', 'helpful_count'),
+        db.Index('ix_review_property_rating', 'property_id', 'rating'),
     )
     
     @property
@@ -617,4 +772,420 @@ class HelpSupport(db.Model):
         return (datetime.utcnow() - self.timestamp).total_seconds() / 3600
 
     def __repr__(self):
-        return f"<HelpSupport {self.id}: {self.subject} - {self.status}>"
\ No newline at end of file
+        return f"<HelpSupport {self.id}: {self.subject} - {self.status}>"
+
+
+# ========== PROPERTY AGGREGATE MAINTENANCE ==========
+
+def _previous_value(target, attr):
+    """Value an attribute had before the pending change (or its current value)"""
+    history = inspect(target).attrs[attr].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(target, attr)
+
+
+def _bump_property(connection, property_id, **deltas):
+    """Atomically add deltas to Property aggregate columns"""
+    deltas = {k: v for k, v in deltas.items() if v}
+    if not property_id or not deltas:
+        return
+    table = Property.__table__
+    values = {name: table.c[name] + delta for name, delta in deltas.items()}
+    # Counter updates are not listing edits, so keep updated_at as it is
+    values['updated_at'] = table.c.updated_at
+    connection.execute(table.update().where(table.c.id == property_id).values(values))
+
+
+@event.listens_for(Booking, 'after_insert')
+def _booking_inserted(mapper, connection, target):
+    _bump_property(connection, target.property_id, revision=1,
+                   approved_booking_count=int(target.status == 'approved'))
+
+
+@event.listens_for(Booking, 'after_update')
+def _booking_updated(mapper, connection, target):
+    old_status = _previous_value(target, 'status')
+    old_property_id = _previous_value(target, 'property_id')
+    if old_property_id != target.property_id:
+        _bump_property(connection, old_property_id, revision=1,
+                       approved_booking_count=-int(old_status == 'approved'))
+        _bump_property(connection, target.property_id, revision=1,
+                       approved_booking_count=int(target.status == 'approved'))
+    else:
+        approved = int(target.status == 'approved') - int(old_status == 'approved')
+        _bump_property(connection, target.property_id, revision=1, approved_booking_count=approved)
+
+
+@event.listens_for(Booking, 'after_delete')
+def _booking_deleted(mapper, connection, target):
+    _bump_property(connection, _previous_value(target, 'property_id'), revision=1,
+                   approved_booking_count=-int(_previous_value(target, 'status') == 'approved'))
+
+
+def subtract_bookings(*criteria):
+    """Update property aggregates for bookings about to be bulk-deleted.
+
+    Query.delete() skips the mapper events above, so callers run this first:
+    one grouped count, then one UPDATE per affected property.
+    """
+    connection = db.session.connection()
+    rows = connection.execute(
+        db.select(Booking.property_id, db.func.sum(case((Booking.status == 'approved', 1), else_=0)))
+        .where(*criteria)
+        .group_by(Booking.property_id)
+    ).all()
+    for property_id, approved in rows:
+        _bump_property(connection, property_id, revision=1, approved_booking_count=-approved)
+
+
+def _rating_bucket(rating):
+    """Histogram column name for a star rating"""
+    return f'rating_{rating}_count'
+
+
+@event.listens_for(Review, 'after_insert')
+def _review_inserted(mapper, connection, target):
+    _bump_property(
+        connection,
+        target.property_id,
+        revision=1,
+        review_count=1,
+        rating_sum=target.rating,
+        **{_rating_bucket(target.rating): 1}
+    )
+
+
+@event.listens_for(Review, 'after_update')
+def _review_updated(mapper, connection, target):
+    old_rating = _previous_value(target, 'rating')
+    old_property_id = _previous_value(target, 'property_id')
+    if old_property_id != target.property_id:
+        _bump_property(
+            connection, old_property_id, revision=1, review_count=-1, rating_sum=-old_rating,
+            **{_rating_bucket(old_rating): -1}
+        )
+        _bump_property(
+            connection, target.property_id, revision=1, review_count=1, rating_sum=target.rating,
+            **{_rating_bucket(target.rating): 1}
+        )
+        return
+    deltas = {'revision': 1}
+    if old_rating != target.rating:
+        deltas.update({
+            'rating_sum': target.rating - old_rating,
+            _rating_bucket(old_rating): -1,
+            _rating_bucket(target.rating): 1,
+        })
+    _bump_property(connection, target.property_id, **deltas)
+
+
+@event.listens_for(Review, 'after_delete')
+def _review_deleted(mapper, connection, target):
+    old_rating = _previous_value(target, 'rating')
+    _bump_property(
+        connection,
+        _previous_value(target, 'property_id'),
+        revision=1,
+        review_count=-1,
+        rating_sum=-old_rating,
+        **{_rating_bucket(old_rating): -1}
+    )
+
+
+@event.listens_for(PropertyImage, 'after_insert')
+@event.listens_for(PropertyImage, 'after_delete')
+def _image_changed(mapper, connection, target):
+    _bump_property(connection, _previous_value(target, 'property_id'), revision=1)
+
+
+@event.listens_for(PropertyImage, 'after_update')
+def _image_updated(mapper, connection, target):
+    old_property_id = _previous_value(target, 'property_id')
+    if old_property_id != target.property_id:
+        _bump_property(connection, old_property_id, revision=1)
+    _bump_property(connection, target.property_id, revision=1)
+
+
+@event.listens_for(Property, 'before_update')
+def _amenities_changed(mapper, connection, target):
+    # A changed amenity list alone issues no UPDATE, so updated_at would stay
+    if inspect(target).attrs.amenity_items.history.has_changes():
+        target.revision = (target.revision or 0) + 1
+
+
+@event.listens_for(User, 'after_update')
+def _landlord_profile_changed(mapper, connection, target):
+    # Listing cards and detail pages show the owner's name and photo
+    state = inspect(target)
+    if target.role == 'landlord' and (
+        state.attrs.name.history.has_changes() or state.attrs.profile_pic.history.has_changes()
+    ):
+        touch_properties(Property.landlord_id == target.id, connection=connection)
+
+
+def touch_properties(*criteria, connection=None):
+    """Bump revision of the matching properties; bulk query changes must call this themselves"""
+    table = Property.__table__
+    (connection or db.session.connection()).execute(
+        table.update().where(*criteria).values(revision=table.c.revision + 1, updated_at=table.c.updated_at)
+    )
+
+
+def reconcile_property_aggregates():
+    """Rebuild Property aggregate columns from the booking and review tables.
+
+    Bulk query deletes (Query.delete()) bypass the mapper events, so this is
+    the drift repair. Returns the number of property rows updated.
+    """
+    approved = (
+        db.select(db.func.count(Booking.id))
+        .where(Booking.property_id == Property.id, Booking.status == 'approved')
+        .scalar_subquery()
+    )
+    reviews = (
+        db.select(db.func.count(Review.id))
+        .where(Review.property_id == Property.id)
+        .scalar_subquery()
+    )
+    ratings = (
+        db.select(db.func.coalesce(db.func.sum(Review.rating), 0))
+        .where(Review.property_id == Property.id)
+        .scalar_subquery()
+    )
+    histogram = {
+        _rating_bucket(stars): (
+            db.select(db.func.count(Review.id))
+            .where(Review.property_id == Property.id, Review.rating == stars)
+            .scalar_subquery()
+        )
+        for stars in range(1, 6)
+    }
+    result = db.session.execute(
+        db.update(Property).values(
+            approved_booking_count=approved,
+            review_count=reviews,
+            rating_sum=ratings,
+            revision=Property.revision + 1,
+            updated_at=Property.updated_at,
+            **histogram
+        ).execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+    return result.rowcount
+
+
+def backfill_property_amenities():
+    """Populate property_amenities from the legacy comma-joined column.
+
+    Only runs while the association table is still empty. Returns the
+    number of properties linked.
+    """
+    if db.session.query(property_amenities).first() is not None:
+        return 0
+    linked = 0
+    for prop in Property.query.filter(Property.amenities.isnot(None), Property.amenities != '').all():
+        prop.set_amenities(prop.amenities.split(','))
+        linked += 1
+    db.session.commit()
+    return linked
+
+
+# ========== PLATFORM STATS SNAPSHOT MAINTENANCE ==========
+
+class _StatSource:
+    """How rows of one model feed one PlatformStat metric"""
+
+    def __init__(self, metric, model, day_attr, status_attr=None, amount_attr=None,
+                 commission_attr=None, condition=None, condition_sql=None, condition_attrs=()):
+        self.metric = metric
+        self.model = model
+        self.day_attr = day_attr
+        self.status_attr = status_attr
+        self.amount_attr = amount_attr
+        self.commission_attr = commission_attr
+        self.condition = condition
+        self.condition_sql = condition_sql
+        self.attrs = {day_attr, *condition_attrs} | {
+            attr for attr in (status_attr, amount_attr, commission_attr) if attr
+        }
+
+    def contribution(self, get):
+        """(day, status, amount, commission) a row adds, or None; get(attr) reads the row"""
+        if self.condition and not self.condition(get):
+            return None
+        created = get(self.day_attr) or datetime.utcnow()
+        return (
+            created.date() if isinstance(created, datetime) else created,
+            (get(self.status_attr) or '') if self.status_attr else '',
+            (get(self.amount_attr) or 0.0) if self.amount_attr else 0.0,
+            (get(self.commission_attr) or 0.0) if self.commission_attr else 0.0,
+        )
+
+    def grouped(self, *criteria):
+        """{(day, status): [count, amount, commission]} for the matching rows"""
+        model = self.model
+        day = db.func.date(getattr(model, self.day_attr))
+        status = getattr(model, self.status_attr) if self.status_attr else db.literal('')
+        amount = db.func.sum(getattr(model, self.amount_attr)) if self.amount_attr else db.literal(0.0)
+        commission = db.func.sum(getattr(model, self.commission_attr)) if self.commission_attr else db.literal(0.0)
+        query = db.session.query(day, status, db.func.count(), amount, commission)
+        if self.condition_sql is not None:
+            query = query.filter(self.condition_sql())
+        query = query.filter(*criteria).group_by(day, status)
+        totals = {}
+        for day_value, status_value, count, amount_value, commission_value in query:
+            if isinstance(day_value, str):
+                day_value = date.fromisoformat(day_value)
+            totals[(day_value, status_value or '')] = [count, amount_value or 0.0, commission_value or 0.0]
+        return totals
+
+
+_STAT_SOURCES = (
+    _StatSource('user', User, 'created_at', 'role'),
+    _StatSource(
+        'pending_landlord', User, 'created_at',
+        condition=lambda get: get('role') == 'landlord' and not get('is_approved_by_admin'),
+        condition_sql=lambda: db.and_(User.role == 'landlord', User.is_approved_by_admin.is_(False)),
+        condition_attrs=('role', 'is_approved_by_admin'),
+    ),
+    _StatSource('property', Property, 'created_at', 'status'),
+    _StatSource('booking', Booking, 'created_at', 'status'),
+    _StatSource('bill', Billing, 'created_at', 'status', 'amount', 'admin_commission'),
+    _StatSource('ticket', HelpSupport, 'timestamp', 'status'),
+)
+
+
+def _stat_upsert(connection):
+    """INSERT ... ON CONFLICT adding to the totals, or None if the dialect lacks it"""
+    if connection.dialect.name == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    elif connection.dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        return None
+    table = PlatformStat.__table__
+    stmt = insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=['metric', 'status', 'period', 'period_start'],
+        set_={
+            'count': table.c.count + stmt.excluded.count,
+            'amount': table.c.amount + stmt.excluded.amount,
+            'commission': table.c.commission + stmt.excluded.commission,
+            'updated_at': stmt.excluded.updated_at,
+        },
+    )
+
+
+def _bump_stats(connection, metric, day, status, count, amount=0.0, commission=0.0):
+    """Atomically add deltas to a (metric, status) day row and its running total"""
+    now = datetime.utcnow()
+    rows = [
+        {'metric': metric, 'status': status, 'period': period, 'period_start': start,
+         'count': count, 'amount': amount, 'commission': commission, 'updated_at': now}
+        for period, start in (('day', day), ('all', PlatformStat.ALL_TIME))
+    ]
+    upsert = _stat_upsert(connection)
+    if upsert is not None:
+        connection.execute(upsert, rows)
+        return
+
+    # Portable fallback: update existing rows, insert the rest
+    table = PlatformStat.__table__
+    for row in rows:
+        result = connection.execute(
+            table.update().where(
+                table.c.metric == row['metric'], table.c.status == row['status'],
+                table.c.period == row['period'], table.c.period_start == row['period_start'],
+            ).values(
+                count=table.c.count + row['count'],
+                amount=table.c.amount + row['amount'],
+                commission=table.c.commission + row['commission'],
+                updated_at=now,
+            )
+        )
+        if not result.rowcount:
+            connection.execute(table.insert().values(**row))
+
+
+def _listen_for_stats(source):
+    def current(target):
+        return source.contribution(lambda attr: getattr(target, attr))
+
+    def bump(connection, contribution, sign):
+        day, status, amount, commission = contribution
+        _bump_stats(connection, source.metric, day, status, sign, sign * amount, sign * commission)
+
+    def inserted(mapper, connection, target):
+        contribution = current(target)
+        if contribution:
+            bump(connection, contribution, 1)
+
+    def updated(mapper, connection, target):
+        before = source.contribution(lambda attr: _previous_value(target, attr))
+        after = current(target)
+        if before == after:
+            return
+        if before:
+            bump(connection, before, -1)
+        if after:
+            bump(connection, after, 1)
+
+    def deleted(mapper, connection, target):
+        contribution = current(target)
+        if contribution:
+            bump(connection, contribution, -1)
+
+    # Load the old value even when an expired instance is changed, so
+    # after_update always sees the row's previous contribution
+    for attr in source.attrs:
+        event.listen(getattr(source.model, attr), 'set', lambda *args: None, active_history=True)
+
+    event.listen(source.model, 'after_insert', inserted)
+    event.listen(source.model, 'after_update', updated)
+    event.listen(source.model, 'after_delete', deleted)
+
+
+for _source in _STAT_SOURCES:
+    _listen_for_stats(_source)
+
+
+def subtract_platform_stats(model, *criteria):
+    """Subtract rows about to be bulk-deleted (Query.delete() skips mapper events)"""
+    connection = db.session.connection()
+    for source in _STAT_SOURCES:
+        if source.model is not model:
+            continue
+        for (day, status), (count, amount, commission) in source.grouped(*criteria).items():
+            _bump_stats(connection, source.metric, day, status, -count, -amount, -commission)
+
+
+def rebuild_platform_stats():
+    """Recompute every PlatformStat row from the source tables.
+
+    Repairs drift from bulk updates or missed events. Returns the number
+    of rows written.
+    """
+    now = datetime.utcnow()
+    rows = []
+    for source in _STAT_SOURCES:
+        totals = {}
+        for (day, status), (count, amount, commission) in source.grouped().items():
+            rows.append(PlatformStat(metric=source.metric, status=status, period='day', period_start=day,
+                                     count=count, amount=amount, commission=commission, updated_at=now))
+            total = totals.setdefault(status, [0, 0.0, 0.0])
+            total[0] += count
+            total[1] += amount
+            total[2] += commission
+        for status, (count, amount, commission) in totals.items():
+            rows.append(PlatformStat(metric=source.metric, status=status, period='all',
+                                     period_start=PlatformStat.ALL_TIME, count=count, amount=amount,
+                                     commission=commission, updated_at=now))
+    metric, status = PlatformStat.REBUILD_MARKER
+    rows.append(PlatformStat(metric=metric, status=status, period='all',
+                             period_start=PlatformStat.ALL_TIME, updated_at=now))
+
+    PlatformStat.query.delete()
+    db.session.add_all(rows)
+    db.session.commit()
+    return len(rows)
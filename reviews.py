@@ -0,0 +1,40 @@
+"""Paginated review lists for the property detail page"""
+from sqlalchemy.orm import joinedload
+
+from models import Review
+
+
+REVIEWS_PER_PAGE = 10
+
+# Sort option -> ORDER BY columns, each ending with the primary key for stable pages
+REVIEW_SORTS = {
+    'newest': (Review.created_at.desc(), Review.id.desc()),
+    'helpful': (Review.helpful_count.desc(), Review.created_at.desc(), Review.id.desc()),
+    'rating-high': (Review.rating.desc(), Review.created_at.desc(), Review.id.desc()),
+    'rating-low': (Review.rating.asc(), Review.created_at.desc(), Review.id.desc()),
+}
+
+
+def get_review_args(args):
+    """Read review_sort and review_page from request.args with sane defaults"""
+    sort = (args.get('review_sort') or 'newest').strip().lower()
+    if sort not in REVIEW_SORTS:
+        sort = 'newest'
+    page = args.get('review_page', 1, type=int) or 1
+    return sort, max(page, 1)
+
+
+def paginate_reviews(prop, sort='newest', page=1, per_page=REVIEWS_PER_PAGE):
+    """One page of a property's reviews with their tenants joined.
+
+    The total comes from the stored Property.review_count, so no COUNT
+    query is issued.
+    """
+    pagination = (
+        Review.query.options(joinedload(Review.tenant))
+        .filter_by(property_id=prop.id)
+        .order_by(*REVIEW_SORTS.get(sort, REVIEW_SORTS['newest']))
+        .paginate(page=page, per_page=per_page, error_out=False, count=False)
+    )
+    pagination.total = prop.review_count or 0
+    return pagination
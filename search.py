@@ -0,0 +1,183 @@
+"""Full-text search over property listings.
+
+SQLite uses an FTS5 virtual table (property_fts) keyed by property id and
+kept in sync from the add/edit/delete property routes. PostgreSQL uses a
+generated tsvector column with a GIN index, which the database keeps in
+sync on its own. Any other backend falls back to ILIKE matching.
+"""
+import re
+
+from sqlalchemy import literal_column, or_, text
+
+from models import db, Property
+
+
+SEARCH_ALIAS = 'search_match'
+MAX_SEARCH_TERMS = 8
+
+# Column weights for FTS5 bm25(): title, description, location, amenities
+FTS5_WEIGHTS = (10.0, 1.0, 5.0, 5.0)
+
+_backend = None
+
+
+def search_backend():
+    """Name of the active full-text backend ('sqlite', 'postgresql' or None)"""
+    return _backend
+
+
+def _sqlite_table_exists(name):
+    return db.session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {'name': name}
+    ).first() is not None
+
+
+def init_search_index():
+    """Create the search index for the current database if it is missing"""
+    global _backend
+    dialect = db.engine.dialect.name
+
+    try:
+        if dialect == 'sqlite':
+            created = not _sqlite_table_exists('property_fts')
+            db.session.execute(text(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS property_fts USING fts5("
+                "title, description, location, amenities, tokenize = 'porter unicode61')"
+            ))
+            db.session.commit()
+            _backend = 'sqlite'
+            if created:
+                rebuild_search_index()
+        elif dialect == 'postgresql':
+            db.session.execute(text("""
+                ALTER TABLE property ADD COLUMN IF NOT EXISTS search_vector tsvector
+                GENERATED ALWAYS AS (
+                    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+                    setweight(to_tsvector('english', coalesce(location, '')), 'B') ||
+                    setweight(to_tsvector('english', replace(coalesce(amenities, ''), ',', ' ')), 'B') ||
+                    setweight(to_tsvector('english', coalesce(description, '')), 'C')
+                ) STORED
+            """))
+            db.session.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_property_search_vector ON property USING GIN (search_vector)"
+            ))
+            db.session.commit()
+            _backend = 'postgresql'
+        else:
+            _backend = None
+    except Exception as e:
+        db.session.rollback()
+        _backend = None
+        print(f"⚠️ [SEARCH] Full-text index unavailable, using ILIKE fallback: {e}")
+
+    return _backend
+
+
+def _fts_row(prop):
+    return {
+        'id': prop.id,
+        'title': prop.title or '',
+        'description': prop.description or '',
+        'location': prop.location or '',
+        'amenities': (prop.amenities or '').replace(',', ' '),
+    }
+
+
+def index_property(prop):
+    """Add or refresh one property in the search index (call before commit)"""
+    if _backend != 'sqlite':
+        return
+    db.session.execute(text("DELETE FROM property_fts WHERE rowid = :id"), {'id': prop.id})
+    db.session.execute(text(
+        "INSERT INTO property_fts (rowid, title, description, location, amenities) "
+        "VALUES (:id, :title, :description, :location, :amenities)"
+    ), _fts_row(prop))
+
+
+def remove_property_from_index(property_id):
+    """Drop one property from the search index (call before commit)"""
+    if _backend != 'sqlite':
+        return
+    db.session.execute(text("DELETE FROM property_fts WHERE rowid = :id"), {'id': property_id})
+
+
+def rebuild_search_index():
+    """Rebuild the SQLite FTS table from the property table"""
+    if _backend != 'sqlite':
+        return 0
+    db.session.execute(text("DELETE FROM property_fts"))
+    result = db.session.execute(text(
+        "INSERT INTO property_fts (rowid, title, description, location, amenities) "
+        "SELECT id, title, description, coalesce(location, ''), replace(coalesce(amenities, ''), ',', ' ') "
+        "FROM property"
+    ))
+    db.session.commit()
+    return result.rowcount
+
+
+def search_terms(q):
+    """Split user input into plain search words"""
+    return re.findall(r'\w+', q or '', flags=re.UNICODE)[:MAX_SEARCH_TERMS]
+
+
+def match_subquery(q):
+    """Subquery of (property_id, rank) for properties matching q.
+
+    Higher rank is a better match on both backends. Returns None when there
+    is no full-text backend or no usable search words.
+    """
+    terms = search_terms(q)
+    if not terms or _backend is None:
+        return None
+
+    if _backend == 'sqlite':
+        # Every word must match, as a prefix so partial words still find results
+        match = ' '.join(f'"{term}"*' for term in terms)
+        weights = ', '.join(str(w) for w in FTS5_WEIGHTS)
+        stmt = text(
+            f"SELECT rowid AS property_id, -bm25(property_fts, {weights}) AS rank "
+            "FROM property_fts WHERE property_fts MATCH :match"
+        ).bindparams(match=match)
+    else:
+        stmt = text(
+            "SELECT id AS property_id, "
+            "ts_rank_cd(search_vector, plainto_tsquery('english', :match)) AS rank "
+            "FROM property WHERE search_vector @@ plainto_tsquery('english', :match)"
+        ).bindparams(match=' '.join(terms))
+
+    return stmt.columns(
+        literal_column('property_id', db.Integer),
+        literal_column('rank', db.Float)
+    ).subquery(SEARCH_ALIAS)
+
+
+def apply_text_search(query, q):
+    """Restrict a Property query to properties matching q"""
+    matches = match_subquery(q)
+    if matches is None:
+        term = f"%{q}%"
+        return query.filter(or_(Property.title.ilike(term), Property.location.ilike(term)))
+    return query.join(matches, matches.c.property_id == Property.id)
+
+
+def rank_order(q):
+    """ORDER BY clause for relevance, or None when there is nothing to rank by"""
+    if _backend is None or not search_terms(q):
+        return None
+    return literal_column(f'{SEARCH_ALIAS}.rank').desc()
+
+
+def search_properties(q, limit=20):
+    """Top matching properties for q as (Property, rank) pairs"""
+    matches = match_subquery(q)
+    if matches is None:
+        rows = apply_text_search(Property.query, q).order_by(Property.created_at.desc()).limit(limit).all()
+        return [(prop, None) for prop in rows]
+    return (
+        db.session.query(Property, matches.c.rank)
+        .join(matches, matches.c.property_id == Property.id)
+        .order_by(matches.c.rank.desc(), Property.id.desc())
+        .limit(limit)
+        .all()
+    )
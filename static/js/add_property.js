@@ -0,0 +1,1176 @@
+document.addEventListener('DOMContentLoaded', function() {
+    // Character counter for description
+    const descriptionTextarea = document.getElementById('description');
+    const charCount = document.getElementById('charCount');
+
+    if (descriptionTextarea && charCount) {
+        descriptionTextarea.addEventListener('input', function() {
+            charCount.textContent = this.value.length;
+        });
+    }
+
+    // Enhanced image upload functionality
+    const uploadZone = document.getElementById('uploadArea');
+    const imageInput = document.getElementById('images');
+    const previewContainer = document.getElementById('previewContainer');
+    const previewGrid = document.getElementById('previewGrid');
+    const imageCount = document.getElementById('imageCount');
+    const clearAllBtn = document.getElementById('clearAll');
+
+    let selectedFiles = [];
+    const maxFiles = 10;
+    const maxFileSize = 5 * 1024 * 1024; // 5MB in bytes
+
+    // Click to upload
+    uploadZone.addEventListener('click', () => {
+        imageInput.click();
+    });
+
+    // Drag and drop functionality
+    uploadZone.addEventListener('dragover', (e) => {
+        e.preventDefault();
+        uploadZone.style.background = 'var(--fb-light-blue)';
+        uploadZone.style.borderColor = 'var(--fb-primary)';
+    });
+
+    uploadZone.addEventListener('dragleave', (e) => {
+        e.preventDefault();
+        uploadZone.style.background = '';
+        uploadZone.style.borderColor = '';
+    });
+
+    uploadZone.addEventListener('drop', (e) => {
+        e.preventDefault();
+        uploadZone.style.background = '';
+        uploadZone.style.borderColor = '';
+        const files = e.dataTransfer.files;
+        if (files.length > 0) {
+            handleFiles(Array.from(files));
+        }
+    });
+
+    // File input change
+    imageInput.addEventListener('change', (e) => {
+        if (e.target.files.length > 0) {
+            handleFiles(Array.from(e.target.files));
+        }
+    });
+
+    // Clear all button
+    clearAllBtn.addEventListener('click', () => {
+        selectedFiles = [];
+        updateImageInput();
+        updatePreview();
+        // Reset the file input
+        imageInput.value = '';
+        showAlert('All images cleared', 'info');
+    });
+
+    function handleFiles(files) {
+        // Filter valid image files
+        const validFiles = files.filter(file => {
+            // Check if file is an image
+            if (!file.type.startsWith('image/')) {
+                showAlert(`${file.name} is not an image file. Please select image files only.`, 'error');
+                return false;
+            }
+
+            // Check file size
+            if (file.size > maxFileSize) {
+                showAlert(`${file.name} is too large. Maximum size is 5MB.`, 'error');
+                return false;
+            }
+
+            // Check if file is duplicate
+            if (selectedFiles.some(existingFile => existingFile.name === file.name && existingFile.size === file.size)) {
+                showAlert(`${file.name} is already selected.`, 'warning');
+                return false;
+            }
+
+            return true;
+        });
+
+        // Check total file count
+        if (selectedFiles.length + validFiles.length > maxFiles) {
+            showAlert(`You can only upload up to ${maxFiles} images. You have ${selectedFiles.length} images selected. Please remove some images first.`, 'error');
+            return;
+        }
+
+        // Add new files to selected files
+        selectedFiles = [...selectedFiles, ...validFiles];
+
+        updateImageInput();
+        updatePreview();
+
+        // Show success message for new files
+        if (validFiles.length > 0) {
+            showAlert(`Successfully added ${validFiles.length} image(s)`, 'success');
+        }
+    }
+
+    function updateImageInput() {
+        // Create a new DataTransfer object to update the file input
+        const dt = new DataTransfer();
+        selectedFiles.forEach(file => dt.items.add(file));
+        imageInput.files = dt.files;
+    }
+
+    function updatePreview() {
+        previewGrid.innerHTML = '';
+
+        if (selectedFiles.length > 0) {
+            previewContainer.style.display = 'block';
+            imageCount.textContent = `(${selectedFiles.length} photo${selectedFiles.length > 1 ? 's' : ''})`;
+
+            selectedFiles.forEach((file, index) => {
+                const reader = new FileReader();
+                reader.onload = (e) => {
+                    const previewItem = createPreviewItem(e.target.result, index, file.name, file.type);
+                    previewGrid.appendChild(previewItem);
+                };
+                reader.onerror = () => {
+                    console.error('Error reading file:', file.name);
+                    showAlert(`Error reading file: ${file.name}`, 'error');
+                };
+                reader.readAsDataURL(file);
+            });
+        } else {
+            previewContainer.style.display = 'none';
+        }
+    }
+
+    function createPreviewItem(src, index, fileName, fileType) {
+        const item = document.createElement('div');
+        item.className = 'preview-item';
+        item.innerHTML = `
+            <img src="${src}" alt="${fileName}" class="preview-image" title="${fileName}">
+            <div class="preview-overlay">
+                <span class="preview-filename">${fileName}</span>
+                <span class="preview-filetype">${fileType.split('/')[1]?.toUpperCase() || 'IMAGE'}</span>
+            </div>
+            <button type="button" class="preview-remove" onclick="removePreview(${index})" title="Remove image">
+                <i class="bi bi-x"></i>
+            </button>
+        `;
+        return item;
+    }
+
+    // ===== MOBILE-SPECIFIC FUNCTIONALITY FOR ADD PROPERTY PAGE =====
+function initializeMobileFeatures() {
+    // Detect if mobile device
+    const isMobile = /Android|webOS|iPhone|iPad|iPod|BlackBerry|IEMobile|Opera Mini/i.test(navigator.userAgent);
+
+    if (isMobile) {
+        console.log('📱 Mobile device detected - applying mobile optimizations');
+
+        // Add mobile-specific class to body
+        document.body.classList.add('mobile-device');
+
+        // Improve touch scrolling
+        document.documentElement.style.scrollBehavior = 'smooth';
+
+        // Fix viewport height issues on mobile
+        function setVH() {
+            let vh = window.innerHeight * 0.01;
+            document.documentElement.style.setProperty('--vh', `${vh}px`);
+        }
+
+        setVH();
+        window.addEventListener('resize', setVH);
+        window.addEventListener('orientationchange', setVH);
+
+        // Enhance mobile form experience
+        enhanceMobileFormExperience();
+    }
+}
+
+// ===== ENHANCE MOBILE FORM EXPERIENCE =====
+function enhanceMobileFormExperience() {
+    // Prevent zoom on input focus (iOS)
+    const inputs = document.querySelectorAll('input, select, textarea');
+
+    inputs.forEach(input => {
+        // Add touch-specific classes
+        input.classList.add('mobile-input');
+
+        input.addEventListener('focus', function() {
+            this.classList.add('mobile-focused');
+            // Scroll to input on focus for better UX
+            setTimeout(() => {
+                this.scrollIntoView({ behavior: 'smooth', block: 'center' });
+            }, 300);
+        });
+
+        input.addEventListener('blur', function() {
+            this.classList.remove('mobile-focused');
+        });
+    });
+
+    // Improve number input for mobile
+    const numberInputs = document.querySelectorAll('input[type="number"]');
+    numberInputs.forEach(input => {
+        // Add increment/decrement buttons for better mobile UX
+        const wrapper = document.createElement('div');
+        wrapper.className = 'mobile-number-wrapper';
+        wrapper.style.position = 'relative';
+        wrapper.style.display = 'flex';
+        wrapper.style.alignItems = 'center';
+
+        input.parentNode.insertBefore(wrapper, input);
+        wrapper.appendChild(input);
+
+        // Add step buttons
+        const stepDown = document.createElement('button');
+        stepDown.type = 'button';
+        stepDown.className = 'mobile-step-btn mobile-step-down';
+        stepDown.innerHTML = '−';
+        stepDown.style.cssText = `
+            position: absolute;
+            left: 8px;
+            background: var(--bg-tertiary);
+            border: none;
+            border-radius: 6px;
+            width: 30px;
+            height: 30px;
+            font-size: 18px;
+            font-weight: bold;
+            color: var(--text-primary);
+            z-index: 2;
+            display: none;
+        `;
+
+        const stepUp = document.createElement('button');
+        stepUp.type = 'button';
+        stepUp.className = 'mobile-step-btn mobile-step-up';
+        stepUp.innerHTML = '+';
+        stepUp.style.cssText = `
+            position: absolute;
+            right: 8px;
+            background: var(--bg-tertiary);
+            border: none;
+            border-radius: 6px;
+            width: 30px;
+            height: 30px;
+            font-size: 18px;
+            font-weight: bold;
+            color: var(--text-primary);
+            z-index: 2;
+            display: none;
+        `;
+
+        wrapper.appendChild(stepDown);
+        wrapper.appendChild(stepUp);
+
+        // Show buttons on mobile
+        if (window.innerWidth <= 768) {
+            stepDown.style.display = 'flex';
+            stepUp.style.display = 'flex';
+            stepDown.style.alignItems = 'center';
+            stepUp.style.alignItems = 'center';
+            stepDown.style.justifyContent = 'center';
+            stepUp.style.justifyContent = 'center';
+            input.style.paddingLeft = '45px';
+            input.style.paddingRight = '45px';
+            input.style.textAlign = 'center';
+        }
+
+        // Add functionality
+        stepDown.addEventListener('click', () => {
+            input.stepDown();
+            input.dispatchEvent(new Event('input', { bubbles: true }));
+        });
+
+        stepUp.addEventListener('click', () => {
+            input.stepUp();
+            input.dispatchEvent(new Event('input', { bubbles: true }));
+        });
+    });
+}
+
+// ===== IMPROVE MOBILE IMAGE UPLOAD =====
+function improveMobileImageUpload() {
+    const uploadArea = document.getElementById('uploadArea');
+    const fileInput = document.getElementById('images');
+
+    if (!uploadArea || !fileInput) return;
+
+    // Add touch-specific improvements
+    uploadArea.style.cursor = 'pointer';
+
+    // Better touch feedback
+    let touchStartTime;
+
+    uploadArea.addEventListener('touchstart', function(e) {
+        touchStartTime = Date.now();
+        this.style.transform = 'scale(0.98)';
+        this.style.transition = 'transform 0.1s ease';
+    }, { passive: true });
+
+    uploadArea.addEventListener('touchend', function(e) {
+        const touchDuration = Date.now() - touchStartTime;
+        this.style.transform = 'scale(1)';
+
+        // Only trigger click if it was a quick tap (not a scroll)
+        if (touchDuration < 200) {
+            fileInput.click();
+        }
+    }, { passive: true });
+
+    // Prevent long press from triggering context menu
+    uploadArea.addEventListener('contextmenu', function(e) {
+        e.preventDefault();
+        return false;
+    });
+}
+
+// ===== MOBILE FORM SUBMISSION ENHANCEMENTS =====
+function enhanceMobileFormSubmission() {
+    const form = document.getElementById('propertyForm');
+
+    if (!form) return;
+
+    // Add mobile-specific form submission handling
+    form.addEventListener('submit', function(e) {
+        // Check if mobile device
+        if (window.innerWidth <= 768) {
+            // Add visual feedback for mobile users
+            const submitBtn = document.getElementById('submitBtn');
+            if (submitBtn) {
+                submitBtn.style.transform = 'scale(0.95)';
+                setTimeout(() => {
+                    submitBtn.style.transform = 'scale(1)';
+                }, 150);
+            }
+
+            // Scroll to top on submission for mobile
+            window.scrollTo({ top: 0, behavior: 'smooth' });
+        }
+    });
+}
+
+// ===== HANDLE MOBILE ORIENTATION CHANGES =====
+function handleMobileOrientation() {
+    let previousOrientation = window.orientation;
+
+    window.addEventListener('orientationchange', function() {
+        console.log('🔄 Orientation changed to: ' + window.orientation);
+
+        // Small delay to allow CSS to catch up
+        setTimeout(() => {
+            // Re-initialize mobile features
+            initializeMobileFeatures();
+
+            // Fix any layout issues
+            const uploadArea = document.getElementById('uploadArea');
+            if (uploadArea) {
+                uploadArea.style.height = 'auto';
+                setTimeout(() => {
+                    uploadArea.style.height = '';
+                }, 100);
+            }
+        }, 300);
+    });
+}
+
+// ===== IMPROVE MOBILE PERFORMANCE =====
+function optimizeMobilePerformance() {
+    // Debounce resize events for better performance
+    let resizeTimeout;
+    window.addEventListener('resize', function() {
+        clearTimeout(resizeTimeout);
+        resizeTimeout = setTimeout(() => {
+            // Re-initialize mobile features on resize
+            if (window.innerWidth <= 768) {
+                initializeMobileFeatures();
+                improveMobileImageUpload();
+            }
+        }, 250);
+    });
+
+    // Lazy load heavy operations
+    const heavyOperations = [];
+
+    // Add form auto-save to lazy operations
+    const autoSaveOperation = debounce(() => {
+        if (window.innerWidth <= 768) {
+            // Use requestIdleCallback for mobile performance
+            if ('requestIdleCallback' in window) {
+                requestIdleCallback(() => {
+                    // Auto-save logic here
+                    console.log('Mobile-optimized auto-save');
+                });
+            } else {
+                setTimeout(() => {
+                    // Auto-save logic here
+                    console.log('Mobile auto-save');
+                }, 1000);
+            }
+        }
+    }, 2000);
+
+    heavyOperations.push(autoSaveOperation);
+}
+
+// ===== CALL ALL MOBILE INIT FUNCTIONS =====
+document.addEventListener('DOMContentLoaded', function() {
+    initializeMobileFeatures();
+    improveMobileImageUpload();
+    enhanceMobileFormSubmission();
+    handleMobileOrientation();
+    optimizeMobilePerformance();
+
+    // Additional mobile-specific console log
+    if (/Android|webOS|iPhone|iPad|iPod|BlackBerry|IEMobile|Opera Mini/i.test(navigator.userAgent)) {
+        console.log('📱 Mobile optimizations applied successfully to Add Property page');
+
+        // Add mobile-specific tips
+        setTimeout(() => {
+            console.log('💡 Mobile Tips:');
+            console.log('   - Use landscape mode for better form filling');
+            console.log('   - Tap and hold on images to view details');
+            console.log('   - Swipe down to refresh if needed');
+        }, 1000);
+    }
+});
+
+// ===== DEBOUNCE UTILITY FUNCTION =====
+function debounce(func, wait) {
+    let timeout;
+    return function executedFunction(...args) {
+        const later = () => {
+            clearTimeout(timeout);
+            func(...args);
+        };
+        clearTimeout(timeout);
+        timeout = setTimeout(later, wait);
+    };
+}
+
+// ===== ENHANCE MOBILE KEYBOARD EXPERIENCE =====
+document.addEventListener('DOMContentLoaded', function() {
+    // Handle virtual keyboard appearance
+    const inputs = document.querySelectorAll('input, textarea');
+
+    inputs.forEach(input => {
+        input.addEventListener('focus', function() {
+            // Add a class when keyboard is likely open
+            document.body.classList.add('keyboard-open');
+
+            // Scroll input into view
+            setTimeout(() => {
+                this.scrollIntoView({ 
+                    behavior: 'smooth', 
+                    block: 'center',
+                    inline: 'nearest'
+                });
+            }, 300);
+        });
+
+        input.addEventListener('blur', function() {
+            // Remove class when keyboard closes
+            setTimeout(() => {
+                document.body.classList.remove('keyboard-open');
+            }, 300);
+        });
+    });
+});
+
+// ===== MOBILE-SPECIFIC ERROR HANDLING =====
+window.addEventListener('error', function(e) {
+    if (window.innerWidth <= 768) {
+        console.log('📱 Mobile error detected:', e.error);
+        // You could show a mobile-friendly error message here
+    }
+});
+
+// ===== ENHANCE MOBILE FORM VALIDATION =====
+function enhanceMobileFormValidation() {
+    const form = document.getElementById('propertyForm');
+
+    if (!form) return;
+
+    // Add mobile-specific validation styles
+    const inputs = form.querySelectorAll('input[required], select[required], textarea[required]');
+
+    inputs.forEach(input => {
+        input.addEventListener('invalid', function(e) {
+            e.preventDefault();
+
+            // Mobile-specific error display
+            if (window.innerWidth <= 768) {
+                this.style.borderColor = 'var(--danger)';
+                this.style.backgroundColor = 'rgba(231, 76, 60, 0.05)';
+
+                // Scroll to first error on mobile
+                if (!form.querySelector('.mobile-error-scrolled')) {
+                    this.scrollIntoView({ 
+                        behavior: 'smooth', 
+                        block: 'center' 
+                    });
+                    form.classList.add('mobile-error-scrolled');
+                }
+
+                // Show mobile-friendly alert
+                showMobileAlert('Please fill in all required fields correctly.', 'error');
+            }
+        });
+
+        input.addEventListener('input', function() {
+            // Clear error styles on input
+            if (window.innerWidth <= 768) {
+                this.style.borderColor = '';
+                this.style.backgroundColor = '';
+            }
+        });
+    });
+}
+
+// ===== MOBILE-FRIENDLY ALERT FUNCTION =====
+function showMobileAlert(message, type = 'info') {
+    // Create mobile-optimized alert
+    const alert = document.createElement('div');
+    alert.className = `mobile-alert mobile-alert-${type}`;
+    alert.innerHTML = `
+        <div class="mobile-alert-content">
+            <i class="bi bi-${type === 'error' ? 'exclamation-triangle' : type === 'warning' ? 'exclamation-circle' : type === 'success' ? 'check-circle' : 'info-circle'}"></i>
+            <span>${message}</span>
+            <button class="mobile-alert-close" onclick="this.parentElement.parentElement.remove()">×</button>
+        </div>
+    `;
+
+    // Add mobile-specific styles
+    alert.style.cssText = `
+        position: fixed;
+        top: 0;
+        left: 0;
+        right: 0;
+        background: ${type === 'error' ? 'var(--danger)' : type === 'warning' ? 'var(--warning)' : type === 'success' ? 'var(--success)' : 'var(--fb-primary)'};
+        color: white;
+        padding: 1rem;
+        z-index: 9999;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.3);
+        animation: slideDown 0.3s ease-out;
+    `;
+
+    alert.querySelector('.mobile-alert-content').style.cssText = `
+        display: flex;
+        align-items: center;
+        justify-content: space-between;
+        max-width: 100%;
+    `;
+
+    alert.querySelector('.mobile-alert-close').style.cssText = `
+        background: none;
+        border: none;
+        color: white;
+        font-size: 1.5rem;
+        cursor: pointer;
+        padding: 0;
+        width: 30px;
+        height: 30px;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+    `;
+
+    document.body.appendChild(alert);
+
+    // Auto-remove after 5 seconds
+    setTimeout(() => {
+        if (alert.parentElement) {
+            alert.style.animation = 'slideUp 0.3s ease-out';
+            setTimeout(() => {
+                if (alert.parentElement) {
+                    alert.remove();
+                }
+            }, 300);
+        }
+    }, 5000);
+}
+
+// Add mobile alert animations
+if (!document.querySelector('#mobile-alert-animations')) {
+    const style = document.createElement('style');
+    style.id = 'mobile-alert-animations';
+    style.textContent = `
+        @keyframes slideDown {
+            from {
+                transform: translateY(-100%);
+                opacity: 0;
+            }
+            to {
+                transform: translateY(0);
+                opacity: 1;
+            }
+        }
+
+        @keyframes slideUp {
+            from {
+                transform: translateY(0);
+                opacity: 1;
+            }
+            to {
+                transform: translateY(-100%);
+                opacity: 0;
+            }
+        }
+
+        .mobile-alert {
+            animation: slideDown 0.3s ease-out;
+        }
+    `;
+    document.head.appendChild(style);
+}
+
+// Initialize mobile form validation
+document.addEventListener('DOMContentLoaded', function() {
+    enhanceMobileFormValidation();
+});
+
+    // Make removePreview function globally accessible
+    window.removePreview = function(index) {
+        if (index >= 0 && index < selectedFiles.length) {
+            const removedFile = selectedFiles[index];
+            selectedFiles.splice(index, 1);
+            updateImageInput();
+            updatePreview();
+            showAlert(`Removed ${removedFile.name}`, 'info');
+        }
+    };
+
+    // Alert function for user feedback
+    function showAlert(message, type = 'info') {
+        // Remove existing alerts
+        const existingAlerts = document.querySelectorAll('.upload-alert');
+        existingAlerts.forEach(alert => alert.remove());
+
+        const alert = document.createElement('div');
+        alert.className = `upload-alert alert-${type === 'error' ? 'danger' : type === 'warning' ? 'warning' : type === 'success' ? 'success' : 'info'}`;
+        alert.innerHTML = `
+            <div class="d-flex align-items-center">
+                <i class="bi bi-${type === 'error' ? 'exclamation-triangle' : type === 'warning' ? 'exclamation-circle' : type === 'success' ? 'check-circle' : 'info-circle'} me-2"></i>
+                <span>${message}</span>
+            </div>
+            <button type="button" class="btn-close" onclick="this.parentElement.remove()" style="background: none; border: none; font-size: 1.2rem; margin-left: 1rem;">×</button>
+        `;
+
+        document.body.appendChild(alert);
+
+        // Auto remove after 5 seconds
+        setTimeout(() => {
+            if (alert.parentElement) {
+                alert.remove();
+            }
+        }, 5000);
+    }
+
+    // Form validation and submission - FIXED VERSION
+    const form = document.getElementById('propertyForm');
+    const submitBtn = document.getElementById('submitBtn');
+
+    // Track if form is being submitted to prevent beforeunload
+    let isSubmitting = false;
+
+    if (form && submitBtn) {
+        form.addEventListener('submit', function(e) {
+            // Prevent default first to handle validation
+            e.preventDefault();
+
+            // Validate required fields first
+            const title = document.getElementById('title')?.value.trim();
+            const description = document.getElementById('description')?.value.trim();
+            const price = document.getElementById('price')?.value;
+            const propertyType = document.getElementById('property_type')?.value;
+            const genderPreference = document.querySelector('input[name="gender_preference"]:checked');
+            const terms = document.getElementById('terms')?.checked;
+            const slots = document.getElementById('slots')?.value;
+
+            let isValid = true;
+            let errorMessage = '';
+
+            // Basic validation
+            if (!title) {
+                isValid = false;
+                errorMessage = 'Please enter a property title.';
+            } else if (!description) {
+                isValid = false;
+                errorMessage = 'Please enter a property description.';
+            } else if (!price) {
+                isValid = false;
+                errorMessage = 'Please enter the property price.';
+            } else if (!propertyType) {
+                isValid = false;
+                errorMessage = 'Please select a property type.';
+            } else if (!genderPreference) {
+                isValid = false;
+                errorMessage = 'Please select a gender preference.';
+            } else if (!slots || slots < 1) {
+                isValid = false;
+                errorMessage = 'Please enter a valid number of slots (minimum 1).';
+            } else if (selectedFiles.length === 0) {
+                isValid = false;
+                errorMessage = 'Please upload at least one property photo.';
+            } else if (!terms) {
+                isValid = false;
+                errorMessage = 'Please agree to the Terms & Conditions.';
+            }
+
+            // Additional validation for specific property types
+            if (propertyType === 'bedspacer') {
+                const pricePerBed = document.getElementById('price_per_bed')?.value;
+                if (!pricePerBed) {
+                    isValid = false;
+                    errorMessage = 'Please enter the price per bed for bedspacer setup.';
+                }
+            }
+
+            if (!isValid) {
+                showAlert(errorMessage, 'error');
+                // Scroll to the first error
+                window.scrollTo({ top: 0, behavior: 'smooth' });
+                return false;
+            }
+
+            // Mark as submitting to prevent beforeunload
+            isSubmitting = true;
+
+            // Add loading state
+            setLoadingState(true);
+
+            // Clear the draft since we're submitting
+            localStorage.removeItem('property_form_draft');
+
+            // Submit the form after a short delay to show loading state
+            setTimeout(() => {
+                form.submit();
+            }, 500);
+        });
+    }
+
+    // Enhanced form validation
+    const requiredFields = document.querySelectorAll('[required]');
+
+    requiredFields.forEach(field => {
+        field.addEventListener('blur', validateField);
+        field.addEventListener('input', clearValidation);
+    });
+
+    function validateField(e) {
+        const field = e.target;
+        const value = field.value.trim();
+
+        if (!value) {
+            showFieldError(field, 'This field is required');
+        } else {
+            clearFieldError(field);
+        }
+    }
+
+    function clearValidation(e) {
+        clearFieldError(e.target);
+    }
+
+    function showFieldError(field, message) {
+        field.classList.add('is-invalid');
+
+        let feedback = field.nextElementSibling;
+        if (!feedback || !feedback.classList.contains('invalid-feedback')) {
+            feedback = document.createElement('div');
+            feedback.className = 'invalid-feedback';
+            field.parentNode.insertBefore(feedback, field.nextSibling);
+        }
+        feedback.textContent = message;
+        feedback.style.color = 'var(--danger)';
+    }
+
+    function clearFieldError(field) {
+        field.classList.remove('is-invalid');
+        const feedback = field.nextElementSibling;
+        if (feedback && feedback.classList.contains('invalid-feedback')) {
+            feedback.remove();
+        }
+    }
+
+    // Price formatting
+    const priceInput = document.getElementById('price');
+    if (priceInput) {
+        priceInput.addEventListener('blur', function() {
+            const value = parseFloat(this.value);
+            if (value && !isNaN(value)) {
+                this.value = Math.round(value);
+            }
+        });
+    }
+
+    // Property type change handler with slot suggestions
+    const propertyTypeSelect = document.getElementById('property_type');
+    const roomConfiguration = document.getElementById('roomConfiguration');
+    const roomDetailsSection = document.getElementById('roomDetailsSection');
+    const roomDetailsContainer = document.getElementById('roomDetailsContainer');
+    const bedspacerPricing = document.getElementById('bedspacerPricing');
+    const slotsInput = document.getElementById('slots');
+
+    if (propertyTypeSelect) {
+        propertyTypeSelect.addEventListener('change', function() {
+            const selectedType = this.value;
+            updateRoomConfiguration(selectedType);
+            updateBedspacerPricing(selectedType);
+            suggestSlotsBasedOnType(selectedType);
+        });
+    }
+
+    // Slot suggestion function
+    function suggestSlotsBasedOnType(propertyType) {
+        const slotSuggestions = {
+            'studio': 2,
+            'room': 2,
+            'bedspacer': 8,
+            'boardinghouse': 20,
+            'apartment': 4,
+            'condo': 4,
+            'house': 6,
+            'other': 10
+        };
+
+        if (slotSuggestions[propertyType] && slotsInput) {
+            slotsInput.value = slotSuggestions[propertyType];
+            showAlert(`Suggested ${slotSuggestions[propertyType]} slots for ${propertyType}`, 'info');
+        }
+    }
+
+    function updateRoomConfiguration(propertyType) {
+        if (!roomConfiguration) return;
+
+        roomConfiguration.innerHTML = '';
+
+        switch(propertyType) {
+            case 'bedspacer':
+                createBedspacerConfiguration();
+                showRoomDetailsSection();
+                break;
+            case 'room':
+                createSingleRoomConfiguration();
+                showRoomDetailsSection();
+                break;
+            case 'boardinghouse':
+                createBoardingHouseConfiguration();
+                showRoomDetailsSection();
+                break;
+            default:
+                hideRoomDetailsSection();
+                break;
+        }
+    }
+
+    function updateBedspacerPricing(propertyType) {
+        if (!bedspacerPricing) return;
+
+        if (propertyType === 'bedspacer') {
+            bedspacerPricing.style.display = 'block';
+            const pricePerBed = document.getElementById('price_per_bed');
+            if (pricePerBed) pricePerBed.required = true;
+        } else {
+            bedspacerPricing.style.display = 'none';
+            const pricePerBed = document.getElementById('price_per_bed');
+            if (pricePerBed) pricePerBed.required = false;
+        }
+    }
+
+    function showRoomDetailsSection() {
+        if (roomDetailsSection) roomDetailsSection.style.display = 'block';
+    }
+
+    function hideRoomDetailsSection() {
+        if (roomDetailsSection) roomDetailsSection.style.display = 'none';
+    }
+
+    function createBedspacerConfiguration() {
+        const configHTML = `
+            <div class="room-config-section">
+                <div class="room-config-header">
+                    <h5 class="room-config-title">Bedspacer Setup</h5>
+                    <span class="room-type-badge">Bedspacer</span>
+                </div>
+                <div class="room-config-grid">
+                    <div class="form-group-enhanced">
+                        <label for="total_beds" class="form-label-enhanced">Total Beds *</label>
+                        <input type="number" class="form-control-enhanced" id="total_beds" name="total_beds" min="1" max="20" placeholder="4" required>
+                    </div>
+                    <div class="form-group-enhanced">
+                        <label for="vacant_beds" class="form-label-enhanced">Vacant Beds *</label>
+                        <input type="number" class="form-control-enhanced" id="vacant_beds" name="vacant_beds" min="1" max="20" placeholder="2" required>
+                    </div>
+                </div>
+            </div>
+        `;
+        roomConfiguration.innerHTML = configHTML;
+
+        // Add event listeners for dynamic validation
+        const totalBedsInput = document.getElementById('total_beds');
+        const vacantBedsInput = document.getElementById('vacant_beds');
+
+        if (totalBedsInput && vacantBedsInput) {
+            totalBedsInput.addEventListener('input', function() {
+                const total = parseInt(this.value) || 0;
+                const vacant = parseInt(vacantBedsInput.value) || 0;
+                if (vacant > total) {
+                    vacantBedsInput.value = total;
+                }
+                vacantBedsInput.max = total;
+            });
+        }
+    }
+
+    function createSingleRoomConfiguration() {
+        const configHTML = `
+            <div class="room-config-section">
+                <div class="room-config-header">
+                    <h5 class="room-config-title">Room Details</h5>
+                    <span class="room-type-badge">Single Room</span>
+                </div>
+                <div class="room-config-grid">
+                    <div class="form-group-enhanced">
+                        <label for="room_size" class="form-label-enhanced">Room Size (sqm)</label>
+                        <input type="number" class="form-control-enhanced" id="room_size" name="room_size" min="1" max="100" placeholder="12">
+                    </div>
+                    <div class="form-group-enhanced">
+                        <label for="max_occupants" class="form-label-enhanced">Max Occupants</label>
+                        <input type="number" class="form-control-enhanced" id="max_occupants" name="max_occupants" min="1" max="10" placeholder="2">
+                    </div>
+                </div>
+            </div>
+        `;
+        roomConfiguration.innerHTML = configHTML;
+    }
+
+    function createBoardingHouseConfiguration() {
+        const configHTML = `
+            <div class="room-config-section">
+                <div class="room-config-header">
+                    <h5 class="room-config-title">Boarding House Setup</h5>
+                    <span class="room-type-badge">Boarding House</span>
+                </div>
+                <div class="room-config-grid">
+                    <div class="form-group-enhanced">
+                        <label for="total_rooms" class="form-label-enhanced">Total Rooms *</label>
+                        <input type="number" class="form-control-enhanced" id="total_rooms" name="total_rooms" min="1" max="50" placeholder="10" required>
+                    </div>
+                    <div class="form-group-enhanced">
+                        <label for="vacant_rooms" class="form-label-enhanced">Vacant Rooms *</label>
+                        <input type="number" class="form-control-enhanced" id="vacant_rooms" name="vacant_rooms" min="1" max="50" placeholder="3" required>
+                    </div>
+                </div>
+            </div>
+        `;
+        roomConfiguration.innerHTML = configHTML;
+
+        // Add event listeners for dynamic validation
+        const totalRoomsInput = document.getElementById('total_rooms');
+        const vacantRoomsInput = document.getElementById('vacant_rooms');
+
+        if (totalRoomsInput && vacantRoomsInput) {
+            totalRoomsInput.addEventListener('input', function() {
+                const total = parseInt(this.value) || 0;
+                const vacant = parseInt(vacantRoomsInput.value) || 0;
+                if (vacant > total) {
+                    vacantRoomsInput.value = total;
+                }
+                vacantRoomsInput.max = total;
+            });
+        }
+    }
+
+    // Auto-save draft functionality
+    let formDraft = {};
+    const DRAFT_KEY = 'property_form_draft';
+
+    // Load draft from localStorage
+    try {
+        const savedDraft = localStorage.getItem(DRAFT_KEY);
+        if (savedDraft) {
+            formDraft = JSON.parse(savedDraft);
+            populateFormFromDraft();
+        }
+    } catch (e) {
+        console.warn('Could not load form draft:', e);
+    }
+
+    // Save draft on input changes with debouncing
+    const saveDraft = debounce(() => {
+        // Don't save if we're in the process of submitting
+        if (isSubmitting) return;
+
+        formDraft = getFormData();
+        try {
+            localStorage.setItem(DRAFT_KEY, JSON.stringify(formDraft));
+        } catch (e) {
+            console.warn('Could not save form draft:', e);
+        }
+    }, 1000);
+
+    // Attach event listeners for auto-save
+    const formElements = document.querySelectorAll('#propertyForm input, #propertyForm select, #propertyForm textarea');
+    formElements.forEach(element => {
+        element.addEventListener('input', saveDraft);
+        element.addEventListener('change', saveDraft);
+    });
+
+    function getFormData() {
+        const formData = new FormData(document.getElementById('propertyForm'));
+        const data = {};
+        for (let [key, value] of formData.entries()) {
+            if (key === 'images') continue; // Skip file inputs
+            data[key] = value;
+        }
+        return data;
+    }
+
+    function populateFormFromDraft() {
+        Object.keys(formDraft).forEach(key => {
+            const element = document.querySelector(`[name="${key}"]`);
+            if (element && formDraft[key] !== undefined && formDraft[key] !== null) {
+                if (element.type === 'checkbox' || element.type === 'radio') {
+                    element.checked = element.value === formDraft[key];
+                } else {
+                    element.value = formDraft[key];
+                }
+            }
+        });
+    }
+
+    // Debounce utility function
+    function debounce(func, wait) {
+        let timeout;
+        return function executedFunction(...args) {
+            const later = () => {
+                clearTimeout(timeout);
+                func(...args);
+            };
+            clearTimeout(timeout);
+            timeout = setTimeout(later, wait);
+        };
+    }
+
+    // Enhanced image validation with more detailed feedback
+    function validateImageFile(file) {
+        const errors = [];
+
+        // Check file type
+        const validTypes = ['image/jpeg', 'image/jpg', 'image/png', 'image/gif'];
+        if (!validTypes.includes(file.type)) {
+            errors.push(`"${file.name}" is not a supported image format. Please use JPG, PNG, or GIF.`);
+        }
+
+        // Check file size (5MB)
+        if (file.size > 5 * 1024 * 1024) {
+            errors.push(`"${file.name}" is too large. Maximum size is 5MB.`);
+        }
+
+        // Check dimensions (optional)
+        return new Promise((resolve) => {
+            const img = new Image();
+            img.onload = function() {
+                resolve({ file, errors });
+            };
+            img.onerror = function() {
+                errors.push(`"${file.name}" appears to be corrupted or not a valid image.`);
+                resolve({ file, errors });
+            };
+            img.src = URL.createObjectURL(file);
+        });
+    }
+
+    // Enhanced file handling with better error reporting
+    async function handleFilesWithValidation(files) {
+        const validationPromises = files.map(validateImageFile);
+        const results = await Promise.all(validationPromises);
+
+        const validFiles = [];
+        const allErrors = [];
+
+        results.forEach(({ file, errors }) => {
+            if (errors.length === 0) {
+                validFiles.push(file);
+            } else {
+                allErrors.push(...errors);
+            }
+        });
+
+        // Show all errors at once
+        if (allErrors.length > 0) {
+            showAlert(allErrors.join('<br>'), 'error');
+        }
+
+        return validFiles;
+    }
+
+    // Update the existing handleFiles function to use validation
+    window.handleFilesWithValidation = handleFilesWithValidation;
+
+    // Add keyboard navigation for accessibility
+    document.addEventListener('keydown', function(e) {
+        // Escape key closes modals or clears selections
+        if (e.key === 'Escape') {
+            const activeModal = document.querySelector('.modal.show');
+            if (activeModal) {
+                bootstrap.Modal.getInstance(activeModal).hide();
+            }
+        }
+
+        // Enter key on buttons without forms
+        if (e.key === 'Enter' && e.target.tagName === 'BUTTON' && e.target.type !== 'submit') {
+            e.target.click();
+        }
+    });
+
+    // FIXED: beforeunload event - only show warning if form has changes and not submitting
+    window.addEventListener('beforeunload', function(e) {
+        // Only show warning if form has changes and we're not actively submitting
+        if (!isSubmitting && form.checkValidity()) {
+            const confirmationMessage = 'You have unsaved changes. Are you sure you want to leave?';
+            e.returnValue = confirmationMessage;
+            return confirmationMessage;
+        }
+    });
+
+    // Enhanced number input handling
+    const numberInputs = document.querySelectorAll('input[type="number"]');
+    numberInputs.forEach(input => {
+        input.addEventListener('wheel', function(e) {
+            e.preventDefault();
+        });
+
+        // Ensure numbers are within bounds
+        input.addEventListener('blur', function() {
+            const min = parseFloat(this.min);
+            const max = parseFloat(this.max);
+            let value = parseFloat(this.value);
+
+            if (!isNaN(min) && value < min) {
+                this.value = min;
+            } else if (!isNaN(max) && value > max) {
+                this.value = max;
+            }
+        });
+    });
+
+    // Add loading states for better UX
+    function setLoadingState(loading) {
+        const submitBtn = document.getElementById('submitBtn');
+        if (loading) {
+            submitBtn.classList.add('loading');
+            submitBtn.disabled = true;
+            submitBtn.innerHTML = '<i class="bi bi-hourglass-split me-2"></i>Processing...';
+        } else {
+            submitBtn.classList.remove('loading');
+            submitBtn.disabled = false;
+            submitBtn.innerHTML = '<i class="bi bi-plus-square me-2"></i>Add Property';
+        }
+    }
+
+    // Initialize form with default state
+    updateRoomConfiguration('');
+    updateBedspacerPricing('');
+
+    console.log('Property form enhanced with additional features');
+});
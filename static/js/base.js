@@ -0,0 +1,992 @@
+document.addEventListener('DOMContentLoaded', function() {
+    // DOM Elements
+    const chatbotToggle = document.getElementById('chatbotToggle');
+    const chatbotWindow = document.getElementById('chatbotWindow');
+    const chatbotMessages = document.getElementById('chatbotMessages');
+    const chatbotInput = document.getElementById('chatbotInput');
+    const sendMessage = document.getElementById('sendMessage');
+    const quickActions = document.getElementById('quickActions');
+    const minimizeChat = document.getElementById('minimizeChat');
+    const closeChat = document.getElementById('closeChat');
+    const clearChat = document.getElementById('clearChat');
+    const chatbotNotification = document.getElementById('chatbotNotification');
+
+    // State
+    let isChatOpen = false;
+    let conversationHistory = [];
+    let userContext = {
+        name: 'Guest',
+        isLoggedIn: false,
+        currentPage: window.location.pathname
+    };
+
+    // Try to get user info from page if available
+    try {
+        const userNameElement = document.querySelector('.navbar-brand + .navbar-collapse .dropdown-toggle');
+        if (userNameElement && userNameElement.textContent.trim()) {
+            const userName = userNameElement.textContent.trim();
+            if (userName && userName !== 'Login' && userName !== 'Register') {
+                userContext.name = userName;
+                userContext.isLoggedIn = true;
+            }
+        }
+    } catch(e) {
+        // User not logged in or element not found
+    }
+
+    // Advanced AI Knowledge Base
+    const boardifyKnowledge = {
+        propertyManagement: {
+            types: ['Apartment', 'Bedspacer', 'Condo', 'Studio', 'House', 'Room'],
+            features: ['WiFi', 'Parking', 'Security', 'Laundry', 'Kitchen', 'Furnished'],
+            locations: ['Makati', 'BGC', 'Quezon City', 'Manila', 'Pasig', 'Mandaluyong']
+        },
+        bookingProcess: {
+            steps: [
+                'Browse available properties',
+                'Select your preferred property',
+                'Click Book Now button',
+                'Fill out booking form with details',
+                'Submit booking request',
+                'Wait for landlord approval (24-48 hours)',
+                'Receive approval notification',
+                'Review and sign digital contract',
+                'Pay security deposit and first month',
+                'Receive confirmation and access details'
+            ],
+            requirements: ['Valid ID', 'Proof of income', 'Emergency contact', 'Security deposit'],
+            timeline: 'Approval typically takes 24-48 hours'
+        },
+        billing: {
+            paymentMethods: ['GCash', 'Bank Transfer', 'PayMaya', 'Credit/Debit Card', 'Cash Payment'],
+            schedule: 'Monthly rent due on 1st of each month',
+            lateFee: '5% penalty after 5 days',
+            features: ['Auto-pay setup', 'Payment history', 'Download receipts', 'Split payment option']
+        },
+        features: {
+            tenant: ['Property search', 'Online booking', 'Digital contracts', 'Payment tracking', 'Maintenance requests', 'Messaging system'],
+            landlord: ['Property listing', 'Tenant management', 'Payment monitoring', 'Contract generation', 'Analytics dashboard', 'Review system']
+        },
+        support: {
+            hours: '24/7 AI Support, Human support 9AM-6PM',
+            channels: ['In-app chat', 'Email support', 'Phone hotline', 'Help center'],
+            response: 'AI responds instantly, human support within 1 hour'
+        }
+    };
+
+    // ============================================
+    // CORE FUNCTIONS
+    // ============================================
+
+    function initChat() {
+        const greeting = userContext.isLoggedIn 
+            ? `Hello ${userContext.name}! 👋 I'm your AI-powered Boardify assistant.`
+            : `Hello! 👋 Welcome to Boardify. I'm your AI assistant.`;
+
+        addBotMessage(greeting);
+
+        setTimeout(() => {
+            addBotMessage("I have comprehensive knowledge about:<br><br>🏠 <strong>Property Management</strong> - Search, filtering, availability<br>📅 <strong>Booking System</strong> - Complete booking workflow<br>💰 <strong>Payments & Billing</strong> - All payment methods & tracking<br>📋 <strong>Contracts</strong> - Digital agreements & signing<br>🔧 <strong>Platform Features</strong> - Every feature explained<br>📊 <strong>Analytics</strong> - Insights and reports<br><br>Ask me anything - I'm trained on the entire Boardify system!");
+            showQuickActions();
+        }, 800);
+    }
+
+    function addBotMessage(text, delay = 0, options = {}) {
+        setTimeout(() => {
+            const messageDiv = document.createElement('div');
+            messageDiv.className = 'message message-bot';
+
+            let content = formatMessage(text);
+
+            if (options.buttons) {
+                content += '<div class="message-buttons">';
+                options.buttons.forEach(btn => {
+                    content += `<button class="msg-btn" data-action="${btn.action}">${btn.label}</button>`;
+                });
+                content += '</div>';
+            }
+
+            messageDiv.innerHTML = `
+                <div>${content}</div>
+                <div class="message-time">${getCurrentTime()}</div>
+            `;
+            chatbotMessages.appendChild(messageDiv);
+
+            if (options.buttons) {
+                messageDiv.querySelectorAll('.msg-btn').forEach(btn => {
+                    btn.addEventListener('click', function() {
+                        const action = this.getAttribute('data-action');
+                        handleButtonAction(action);
+                    });
+                });
+            }
+
+            scrollToBottom();
+            conversationHistory.push({ type: 'bot', text, time: new Date(), options });
+        }, delay);
+    }
+
+    function addUserMessage(text) {
+        const messageDiv = document.createElement('div');
+        messageDiv.className = 'message message-user';
+        messageDiv.innerHTML = `
+            <div>${escapeHtml(text)}</div>
+            <div class="message-time">${getCurrentTime()}</div>
+        `;
+        chatbotMessages.appendChild(messageDiv);
+        scrollToBottom();
+        conversationHistory.push({ type: 'user', text, time: new Date() });
+    }
+
+    function showTypingIndicator() {
+        const typingDiv = document.createElement('div');
+        typingDiv.className = 'typing-indicator';
+        typingDiv.id = 'typingIndicator';
+        typingDiv.innerHTML = `
+            <div class="typing-dot"></div>
+            <div class="typing-dot"></div>
+            <div class="typing-dot"></div>
+        `;
+        chatbotMessages.appendChild(typingDiv);
+        scrollToBottom();
+    }
+
+    function hideTypingIndicator() {
+        const typingIndicator = document.getElementById('typingIndicator');
+        if (typingIndicator) {
+            typingIndicator.remove();
+        }
+    }
+
+    function formatMessage(text) {
+        return text.replace(/\n/g, '<br>')
+                  .replace(/\*\*(.*?)\*\*/g, '<strong>$1</strong>')
+                  .replace(/\*(.*?)\*/g, '<em>$1</em>')
+                  .replace(/`(.*?)`/g, '<code>$1</code>');
+    }
+
+    function escapeHtml(text) {
+        const div = document.createElement('div');
+        div.textContent = text;
+        return div.innerHTML;
+    }
+
+    function getCurrentTime() {
+        return new Date().toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' });
+    }
+
+    function scrollToBottom() {
+        chatbotMessages.scrollTop = chatbotMessages.scrollHeight;
+    }
+
+    function showQuickActions() {
+        quickActions.style.display = 'flex';
+    }
+
+    function hideQuickActions() {
+        quickActions.style.display = 'none';
+    }
+
+    // ============================================
+    // AI PROCESSING ENGINE
+    // ============================================
+
+    async function processUserMessage(message) {
+        const lowerMessage = message.toLowerCase();
+        showTypingIndicator();
+        hideQuickActions();
+
+        // Simulate AI thinking time
+        const thinkingTime = 800 + Math.random() * 700;
+
+        setTimeout(() => {
+            hideTypingIndicator();
+
+            // Advanced intent detection
+            const intent = detectIntent(lowerMessage);
+            const response = generateResponse(intent, lowerMessage, message);
+
+            if (Array.isArray(response)) {
+                response.forEach((msg, index) => {
+                    addBotMessage(msg.text, index * 600, msg.options || {});
+                });
+            } else {
+                addBotMessage(response);
+            }
+
+        }, thinkingTime);
+    }
+
+    function detectIntent(message) {
+        const intents = {
+            greeting: ['hello', 'hi', 'hey', 'good morning', 'good afternoon', 'good evening', 'greetings'],
+            propertySearch: ['find', 'search', 'looking for', 'property', 'apartment', 'room', 'studio', 'condo', 'house', 'bedspace'],
+            booking: ['book', 'reserve', 'reservation', 'how to book', 'booking process', 'rent'],
+            payment: ['pay', 'payment', 'bill', 'billing', 'rent payment', 'gcash', 'bank transfer', 'pay my rent'],
+            contract: ['contract', 'agreement', 'lease', 'terms', 'sign', 'document'],
+            features: ['features', 'what can', 'capabilities', 'functions', 'how does it work'],
+            support: ['help', 'support', 'problem', 'issue', 'trouble', 'error', 'bug'],
+            account: ['account', 'profile', 'register', 'sign up', 'login', 'password', 'email'],
+            landlord: ['landlord', 'owner', 'property owner', 'list property', 'add property'],
+            tenant: ['tenant', 'renter', 'my booking', 'my property', 'my rent'],
+            location: ['location', 'where', 'near', 'makati', 'bgc', 'quezon city', 'manila', 'area'],
+            price: ['price', 'cost', 'how much', 'budget', 'cheap', 'expensive', 'affordable'],
+            amenities: ['amenities', 'facilities', 'wifi', 'parking', 'security', 'furnished', 'kitchen'],
+            maintenance: ['maintenance', 'repair', 'fix', 'broken', 'not working'],
+            reviews: ['review', 'rating', 'feedback', 'comment', 'testimonial']
+        };
+
+        for (const [intent, keywords] of Object.entries(intents)) {
+            if (keywords.some(keyword => message.includes(keyword))) {
+                return intent;
+            }
+        }
+
+        return 'general';
+    }
+
+    function generateResponse(intent, lowerMessage, originalMessage) {
+        const responses = {
+            greeting: () => {
+                const greetings = [
+                    `Hello${userContext.isLoggedIn ? ' ' + userContext.name : ''}! 😊 How can I assist you with Boardify today?`,
+                    `Hi there! 👋 I'm here to help you navigate Boardify. What would you like to know?`,
+                    `Welcome! I'm ready to help you with any questions about properties, bookings, or payments.`
+                ];
+                return greetings[Math.floor(Math.random() * greetings.length)];
+            },
+
+            propertySearch: () => {
+                const responses = [{
+                    text: `<strong>🏠 Property Search Guide</strong><br><br>I can help you find the perfect property! Here's how:<br><br><strong>Search Options:</strong><br>📍 <strong>By Location:</strong> "Find properties in Makati"<br>💰 <strong>By Price:</strong> "Show apartments under ₱15,000"<br>🏢 <strong>By Type:</strong> Available types: ${boardifyKnowledge.propertyManagement.types.join(', ')}<br>✨ <strong>By Features:</strong> ${boardifyKnowledge.propertyManagement.features.join(', ')}<br><br><strong>Popular Locations:</strong><br>${boardifyKnowledge.propertyManagement.locations.map(loc => '• ' + loc).join('<br>')}`,
+                    options: {
+                        buttons: [
+                            { label: '🔍 Search Now', action: 'search_properties' },
+                            { label: '📋 View All Properties', action: 'view_all' },
+                            { label: '💡 Get Recommendations', action: 'recommendations' }
+                        ]
+                    }
+                }];
+
+                if (lowerMessage.includes('makati') || lowerMessage.includes('bgc') || lowerMessage.includes('quezon')) {
+                    const location = lowerMessage.includes('makati') ? 'Makati' : 
+                                   lowerMessage.includes('bgc') ? 'BGC' : 'Quezon City';
+                    responses.push({
+                        text: `Great choice! ${location} is a popular area. Let me show you available properties there.`,
+                        options: {}
+                    });
+                }
+
+                return responses;
+            },
+
+            booking: () => [{
+                text: `<strong>📅 Complete Booking Process</strong><br><br><strong>Step-by-Step Guide:</strong><br><br>${boardifyKnowledge.bookingProcess.steps.map((step, i) => `${i + 1}. ${step}`).join('<br>')}<br><br><strong>📋 Requirements:</strong><br>${boardifyKnowledge.bookingProcess.requirements.map(req => '✓ ' + req).join('<br>')}<br><br><strong>⏱️ Timeline:</strong> ${boardifyKnowledge.bookingProcess.timeline}<br><br><strong>💡 Tips:</strong><br>• Have all documents ready beforehand<br>• Respond promptly to landlord inquiries<br>• Read the contract carefully before signing<br>• Keep copies of all communications`,
+                options: {
+                    buttons: [
+                        { label: '📝 Start Booking', action: 'start_booking' },
+                        { label: '📄 View Requirements', action: 'booking_requirements' },
+                        { label: '❓ Booking FAQs', action: 'booking_faq' }
+                    ]
+                }
+            }],
+
+            payment: () => [{
+                text: `<strong>💰 Payment & Billing Information</strong><br><br><strong>Accepted Payment Methods:</strong><br>${boardifyKnowledge.billing.paymentMethods.map(method => '💳 ' + method).join('<br>')}<br><br><strong>Payment Schedule:</strong><br>📅 ${boardifyKnowledge.billing.schedule}<br>⚠️ ${boardifyKnowledge.billing.lateFee}<br><br><strong>Features:</strong><br>${boardifyKnowledge.billing.features.map(f => '✓ ' + f).join('<br>')}<br><br><strong>How to Pay:</strong><br>1. Go to Billing section in your profile<br>2. Select payment method<br>3. Enter payment details<br>4. Confirm transaction<br>5. Download receipt automatically`,
+                options: {
+                    buttons: [
+                        { label: '💳 Make Payment', action: 'make_payment' },
+                        { label: '📊 Payment History', action: 'payment_history' },
+                        { label: '🔄 Setup Auto-Pay', action: 'setup_autopay' }
+                    ]
+                }
+            }],
+
+            contract: () => [{
+                text: `<strong>📄 Digital Contract System</strong><br><br><strong>Our Contract Process:</strong><br><br>✓ <strong>Automatic Generation:</strong> Contracts are auto-generated after approval<br>✓ <strong>Digital Signing:</strong> Sign electronically - legally binding<br>✓ <strong>Cloud Storage:</strong> Access anytime from your profile<br>✓ <strong>Both Parties:</strong> Landlord and tenant both sign<br><br><strong>Contract Includes:</strong><br>• Property details and address<br>• Rental amount and payment terms<br>• Security deposit information<br>• Lease duration and renewal terms<br>• House rules and responsibilities<br>• Termination clauses<br><br><strong>After Signing:</strong><br>• Receive email confirmation<br>• Download PDF copy<br>• Access from Documents section<br>• Both parties get identical copies`,
+                options: {
+                    buttons: [
+                        { label: '📋 View Sample', action: 'view_contract_sample' },
+                        { label: '✍️ My Contracts', action: 'my_contracts' }
+                    ]
+                }
+            }],
+
+            features: () => [{
+                text: `<strong>🚀 Boardify Platform Features</strong><br><br><strong>For Tenants:</strong><br>${boardifyKnowledge.features.tenant.map(f => '✓ ' + f).join('<br>')}<br><br><strong>For Landlords:</strong><br>${boardifyKnowledge.features.landlord.map(f => '✓ ' + f).join('<br>')}<br><br><strong>Key Highlights:</strong><br>🤖 <strong>AI Assistant:</strong> 24/7 intelligent support (that's me!)<br>📱 <strong>Mobile Responsive:</strong> Works on all devices<br>🔒 <strong>Secure:</strong> Bank-level encryption<br>⚡ <strong>Real-time:</strong> Instant notifications<br>📊 <strong>Analytics:</strong> Detailed insights and reports`,
+                options: {
+                    buttons: [
+                        { label: '👤 Tenant Features', action: 'tenant_features' },
+                        { label: '🏢 Landlord Features', action: 'landlord_features' }
+                    ]
+                }
+            }],
+
+            support: () => [{
+                text: `<strong>🆘 Support & Help</strong><br><br><strong>Available Support Channels:</strong><br>${boardifyKnowledge.support.channels.map(c => '📞 ' + c).join('<br>')}<br><br><strong>Support Hours:</strong><br>${boardifyKnowledge.support.hours}<br><br><strong>Response Time:</strong><br>${boardifyKnowledge.support.response}<br><br><strong>Common Issues I Can Help With:</strong><br>• Payment problems<br>• Booking questions<br>• Account access<br>• Contract issues<br>• Property inquiries<br>• Technical difficulties<br><br><strong>For Urgent Issues:</strong><br>Contact our human support team for immediate assistance with critical problems.`,
+                options: {
+                    buttons: [
+                        { label: '📧 Email Support', action: 'email_support' },
+                        { label: '📚 Help Center', action: 'help_center' },
+                        { label: '🔧 Report Issue', action: 'report_issue' }
+                    ]
+                }
+            }],
+
+            account: () => {
+                if (userContext.isLoggedIn) {
+                    return [{
+                        text: `<strong>👤 Your Account</strong><br><br>Hello ${userContext.name}! Your account is active.<br><br><strong>Quick Actions:</strong><br>• View your profile<br>• Update information<br>• Change password<br>• Manage notifications<br>• Privacy settings<br><br><strong>Account Security:</strong><br>✓ Email verified<br>✓ Secure password<br>✓ 2FA available`,
+                        options: {
+                            buttons: [
+                                { label: '👤 View Profile', action: 'view_profile' },
+                                { label: '🔒 Security Settings', action: 'security' }
+                            ]
+                        }
+                    }];
+                } else {
+                    return [{
+                        text: `<strong>👤 Account & Registration</strong><br><br>You're not logged in yet. Here's how to get started:<br><br><strong>Create Account:</strong><br>1. Click 'Register' in the menu<br>2. Fill in your details<br>3. Verify your email<br>4. Complete your profile<br><br><strong>Benefits of Registration:</strong><br>✓ Save favorite properties<br>✓ Quick booking process<br>✓ Track your applications<br>✓ Manage payments<br>✓ Digital contracts<br>✓ Personalized recommendations`,
+                        options: {
+                            buttons: [
+                                { label: '📝 Register Now', action: 'register' },
+                                { label: '🔑 Login', action: 'login' }
+                            ]
+                        }
+                    }];
+                }
+            },
+
+            landlord: () => [{
+                text: `<strong>🏢 Landlord Features</strong><br><br><strong>Property Management:</strong><br>✓ <strong>List Properties:</strong> Add unlimited properties<br>✓ <strong>Photo Gallery:</strong> Upload multiple images<br>✓ <strong>Pricing Control:</strong> Set your own rates<br>✓ <strong>Availability:</strong> Real-time calendar<br><br><strong>Tenant Management:</strong><br>✓ Review applications<br>✓ Approve/reject bookings<br>✓ Screen tenants<br>✓ Communicate directly<br><br><strong>Financial Tools:</strong><br>✓ Payment tracking<br>✓ Auto-billing system<br>✓ Payment reminders<br>✓ Financial reports<br>✓ Tax documents<br><br><strong>Analytics Dashboard:</strong><br>📊 Occupancy rates<br>💰 Revenue tracking<br>📈 Performance metrics`,
+                options: {
+                    buttons: [
+                        { label: '➕ Add Property', action: 'add_property' },
+                        { label: '📊 View Dashboard', action: 'landlord_dashboard' }
+                    ]
+                }
+            }],
+
+            tenant: () => [{
+                text: `<strong>👤 Tenant Features</strong><br><br><strong>Property Search:</strong><br>✓ <strong>Advanced Filters:</strong> Location, price, type<br>✓ <strong>Save Favorites:</strong> Bookmark properties<br>✓ <strong>Compare:</strong> Side-by-side comparison<br>✓ <strong>Virtual Tours:</strong> 360° views<br><br><strong>Booking Management:</strong><br>✓ Quick booking process<br>✓ Application tracking<br>✓ Digital contracts<br>✓ Instant notifications<br><br><strong>Payment & Billing:</strong><br>✓ Online payments<br>✓ Payment history<br>✓ Auto-pay option<br>✓ Receipt downloads<br><br><strong>Communication:</strong><br>💬 Direct messaging<br>📞 Contact landlord<br>🔧 Maintenance requests<br>⭐ Leave reviews`,
+                options: {
+                    buttons: [
+                        { label: '🔍 Search Properties', action: 'search_properties' },
+                        { label: '📋 My Bookings', action: 'my_bookings' }
+                    ]
+                }
+            }],
+
+            location: () => {
+                const locationMentioned = boardifyKnowledge.propertyManagement.locations.find(loc => 
+                    lowerMessage.includes(loc.toLowerCase())
+                );
+
+                if (locationMentioned) {
+                    return [{
+                        text: `<strong>📍 Properties in ${locationMentioned}</strong><br><br>${locationMentioned} is a great choice! Here's what you should know:<br><br><strong>Area Highlights:</strong><br>• Central business district<br>• Near major transportation<br>• Shopping and dining<br>• Educational institutions<br><br><strong>Average Prices:</strong><br>Studio: ₱8,000 - ₱15,000/month<br>1BR: ₱12,000 - ₱25,000/month<br>2BR: ₱20,000 - ₱40,000/month<br><br>Let me find available properties for you!`,
+                        options: {
+                            buttons: [
+                                { label: `🔍 Search ${locationMentioned}`, action: `search_${locationMentioned}` },
+                                { label: '🗺️ View Map', action: 'view_map' }
+                            ]
+                        }
+                    }];
+                } else {
+                    return `<strong>📍 Location Search</strong><br><br>We have properties in these prime locations:<br><br>${boardifyKnowledge.propertyManagement.locations.map(loc => '📌 ' + loc).join('<br>')}<br><br>Which area interests you?`;
+                }
+            },
+
+            price: () => {
+                const priceRanges = [
+                    { range: 'Under ₱5,000', desc: 'Bedspacers, shared rooms' },
+                    { range: '₱5,000 - ₱10,000', desc: 'Studios, small apartments' },
+                    { range: '₱10,000 - ₱20,000', desc: '1-2BR apartments' },
+                    { range: '₱20,000 - ₱30,000', desc: '2-3BR condos' },
+                    { range: 'Above ₱30,000', desc: 'Premium properties' }
+                ];
+
+                return [{
+                    text: `<strong>💰 Price Ranges</strong><br><br>Here's a breakdown of what you can expect:<br><br>${priceRanges.map(p => `<strong>${p.range}</strong><br>${p.desc}`).join('<br><br>')}<br><br><strong>💡 Tips:</strong><br>• Prices vary by location<br>• Furnished = higher price<br>• Utilities may be separate<br>• Security deposit usually 1-2 months<br><br>What's your budget range?`,
+                    options: {
+                        buttons: [
+                            { label: 'Under ₱10K', action: 'budget_low' },
+                            { label: '₱10K-₱20K', action: 'budget_mid' },
+                            { label: 'Above ₱20K', action: 'budget_high' }
+                        ]
+                    }
+                }];
+            },
+
+            amenities: () => [{
+                text: `<strong>✨ Amenities & Features</strong><br><br><strong>Common Amenities:</strong><br>${boardifyKnowledge.propertyManagement.features.map(f => '✓ ' + f).join('<br>')}<br><br><strong>Filter by Amenities:</strong><br>You can search for properties with specific features:<br><br>🌐 <strong>WiFi:</strong> High-speed internet included<br>🚗 <strong>Parking:</strong> Dedicated parking space<br>🛡️ <strong>Security:</strong> 24/7 guard, CCTV<br>🧺 <strong>Laundry:</strong> Washing machine available<br>🍳 <strong>Kitchen:</strong> Full or shared kitchen<br>🛋️ <strong>Furnished:</strong> Move-in ready<br><br><strong>Premium Features:</strong><br>• Swimming pool<br>• Gym/Fitness center<br>• Rooftop deck<br>• Co-working space`,
+                options: {
+                    buttons: [
+                        { label: '✨ Premium Properties', action: 'premium' },
+                        { label: '🏢 Basic Properties', action: 'basic' }
+                    ]
+                }
+            }],
+
+            maintenance: () => [{
+                text: `<strong>🔧 Maintenance Requests</strong><br><br><strong>How to Request:</strong><br>1. Go to your tenant dashboard<br>2. Click "Maintenance Request"<br>3. Describe the issue<br>4. Upload photos if needed<br>5. Submit request<br>6. Track status in real-time<br><br><strong>Response Times:</strong><br>🚨 <strong>Emergency:</strong> Within 2 hours<br>⚠️ <strong>Urgent:</strong> Within 24 hours<br>📝 <strong>Regular:</strong> Within 3 days<br><br><strong>Emergency Issues:</strong><br>• No water/electricity<br>• Gas leak<br>• Broken locks<br>• Flooding<br>• Safety hazards<br><br>All requests are logged and tracked for accountability.`,
+                options: {
+                    buttons: [
+                        { label: '🚨 Report Emergency', action: 'emergency' },
+                        { label: '📝 Regular Request', action: 'maintenance_request' }
+                    ]
+                }
+            }],
+
+            reviews: () => [{
+                text: `<strong>⭐ Reviews & Ratings</strong><br><br><strong>Why Reviews Matter:</strong><br>• Help other tenants decide<br>• Hold landlords accountable<br>• Improve property quality<br>• Build community trust<br><br><strong>Review System:</strong><br>✓ <strong>Verified Reviews:</strong> Only actual tenants<br>✓ <strong>5-Star Rating:</strong> Clear scoring system<br>✓ <strong>Categories:</strong> Cleanliness, communication, value<br>✓ <strong>Response:</strong> Landlords can reply<br><br><strong>Leave a Review:</strong><br>After your stay, you'll receive a review request. Your honest feedback helps everyone!<br><br><strong>Reading Reviews:</strong><br>• Check recent reviews (last 6 months)<br>• Look for patterns<br>• Read landlord responses<br>• Consider overall rating`,
+                options: {
+                    buttons: [
+                        { label: '⭐ Leave Review', action: 'leave_review' },
+                        { label: '📖 Read Reviews', action: 'read_reviews' }
+                    ]
+                }
+            }],
+
+            general: () => {
+                const suggestions = [
+                    "Try asking 'Find apartments in Makati'",
+                    "Ask 'How do I book a property?'",
+                    "Say 'Explain the payment process'",
+                    "Type 'What features does Boardify have?'",
+                    "Ask 'Show me cheap properties'"
+                ];
+
+                return `I'm here to help! I have comprehensive knowledge about the entire Boardify system.<br><br><strong>💡 You can ask me about:</strong><br>• Property searching and filtering<br>• Complete booking workflow<br>• Payment methods and billing<br>• Digital contracts<br>• Account management<br>• Landlord and tenant features<br>• Maintenance requests<br>• Reviews and ratings<br><br><strong>Try these:</strong><br>${suggestions.map(s => '💬 ' + s).join('<br>')}<br><br>What would you like to know?`;
+            }
+        };
+
+        return responses[intent] ? responses[intent]() : responses.general();
+    }
+
+    // ============================================
+    // BUTTON ACTION HANDLERS
+    // ============================================
+
+    function handleButtonAction(action) {
+        const actionMap = {
+            search_properties: () => {
+                addUserMessage("Search for properties");
+                if (userContext.isLoggedIn) {
+                    addBotMessage("Opening property search page...", 300);
+                    setTimeout(() => window.location.href = '/properties', 1000);
+                } else {
+                    addBotMessage("You'll need to login first to search properties. Would you like me to take you to the login page?", 300, {
+                        buttons: [
+                            { label: '🔑 Login Now', action: 'login' },
+                            { label: '📝 Register', action: 'register' }
+                        ]
+                    });
+                }
+            },
+            view_all: () => {
+                addUserMessage("View all properties");
+                addBotMessage("Taking you to the properties page...", 300);
+                setTimeout(() => window.location.href = '/properties', 1000);
+            },
+            recommendations: () => {
+                addUserMessage("Get property recommendations");
+                showPersonalizedRecommendations();
+            },
+            start_booking: () => {
+                addUserMessage("I want to start booking");
+                if (userContext.isLoggedIn) {
+                    addBotMessage("Great! First, let's find you the perfect property. What are you looking for?", 300);
+                    setTimeout(() => processUserMessage("find properties"), 800);
+                } else {
+                    addBotMessage("You need an account to book properties. Let me help you get started!", 300, {
+                        buttons: [
+                            { label: '📝 Create Account', action: 'register' },
+                            { label: '🔑 I have an account', action: 'login' }
+                        ]
+                    });
+                }
+            },
+            booking_requirements: () => {
+                addUserMessage("Show booking requirements");
+                addBotMessage(`<strong>📋 Booking Requirements Checklist</strong><br><br>${boardifyKnowledge.bookingProcess.requirements.map(req => '☐ ' + req).join('<br>')}<br><br><strong>Document Formats:</strong><br>• ID: JPG, PNG, PDF (max 5MB)<br>• Proof of Income: Payslip or ITR<br>• Emergency Contact: Name & number<br><br><strong>💡 Pro Tip:</strong> Prepare these documents in advance for faster approval!`, 300);
+            },
+            booking_faq: () => {
+                addUserMessage("Booking FAQs");
+                addBotMessage(`<strong>❓ Frequently Asked Questions</strong><br><br><strong>Q: How long does approval take?</strong><br>A: Usually 24-48 hours<br><br><strong>Q: Can I cancel my booking?</strong><br>A: Yes, check cancellation policy per property<br><br><strong>Q: When do I pay?</strong><br>A: After approval, before move-in<br><br><strong>Q: What if I'm rejected?</strong><br>A: You can book other properties immediately<br><br><strong>Q: Is my deposit refundable?</strong><br>A: Yes, based on contract terms<br><br>Have more questions? Just ask!`, 300);
+            },
+            make_payment: () => {
+                addUserMessage("Make a payment");
+                if (userContext.isLoggedIn) {
+                    addBotMessage("Taking you to the billing section...", 300);
+                    setTimeout(() => window.location.href = '/billing', 1000);
+                } else {
+                    addBotMessage("Please login to access billing features.", 300);
+                }
+            },
+            payment_history: () => {
+                addUserMessage("View payment history");
+                if (userContext.isLoggedIn) {
+                    addBotMessage("Opening your payment history...", 300);
+                    setTimeout(() => window.location.href = '/billing#history', 1000);
+                } else {
+                    addBotMessage("Please login to view payment history.", 300);
+                }
+            },
+            setup_autopay: () => {
+                addUserMessage("Setup auto-pay");
+                addBotMessage("<strong>🔄 Auto-Pay Setup</strong><br><br>Auto-pay ensures you never miss a payment!<br><br><strong>How it works:</strong><br>1. Link your GCash or bank account<br>2. Set monthly deduction date<br>3. Automatic payment on due date<br>4. Receive confirmation email<br><br><strong>Benefits:</strong><br>✓ Never miss due dates<br>✓ No late fees<br>✓ Peace of mind<br>✓ Can cancel anytime<br><br>Would you like to set it up now?", 300, {
+                    buttons: [
+                        { label: '✓ Setup Now', action: 'make_payment' },
+                        { label: '📚 Learn More', action: 'autopay_info' }
+                    ]
+                });
+            },
+            view_contract_sample: () => {
+                addUserMessage("Show contract sample");
+                addBotMessage("<strong>📄 Digital Contract Sample</strong><br><br>Our contracts include:<br><br>• <strong>Parties:</strong> Landlord & Tenant info<br>• <strong>Property:</strong> Full address & description<br>• <strong>Terms:</strong> Duration (6/12 months typical)<br>• <strong>Rent:</strong> Monthly amount & due date<br>• <strong>Deposit:</strong> Security deposit terms<br>• <strong>Utilities:</strong> What's included<br>• <strong>Rules:</strong> Property guidelines<br>• <strong>Termination:</strong> How to end lease<br>• <strong>Signatures:</strong> Digital signing<br><br>All contracts are legally binding and stored securely in the cloud.", 300);
+            },
+            my_contracts: () => {
+                addUserMessage("View my contracts");
+                if (userContext.isLoggedIn) {
+                    addBotMessage("Opening your contracts...", 300);
+                    setTimeout(() => window.location.href = '/profile#contracts', 1000);
+                } else {
+                    addBotMessage("Please login to view your contracts.", 300);
+                }
+            },
+            tenant_features: () => {
+                addUserMessage("Tell me about tenant features");
+                processUserMessage("tenant features");
+            },
+            landlord_features: () => {
+                addUserMessage("Tell me about landlord features");
+                processUserMessage("landlord features");
+            },
+            email_support: () => {
+                addUserMessage("Contact email support");
+                addBotMessage("<strong>📧 Email Support</strong><br><br>You can reach our support team at:<br><br><strong>support@boardify.com</strong><br><br>Expected response time: <strong>2-4 hours</strong><br><br>Include in your email:<br>• Your name and account email<br>• Detailed description<br>• Screenshots if applicable<br>• Order/booking reference if relevant<br><br>We'll get back to you as soon as possible!", 300);
+            },
+            help_center: () => {
+                addUserMessage("Open help center");
+                addBotMessage("Opening the Help Center with detailed guides and tutorials...", 300);
+                setTimeout(() => window.location.href = '/help', 1000);
+            },
+            report_issue: () => {
+                addUserMessage("Report an issue");
+                addBotMessage("<strong>🔧 Report an Issue</strong><br><br>I'm here to help! Please describe the issue you're experiencing:<br><br>• <strong>Technical problem?</strong> (Login, loading, errors)<br>• <strong>Payment issue?</strong> (Failed transaction, billing)<br>• <strong>Booking problem?</strong> (Can't book, approval)<br>• <strong>Account issue?</strong> (Access, password)<br><br>Type your issue and I'll guide you through the solution or escalate to our technical team if needed.", 300);
+            },
+            view_profile: () => {
+                addUserMessage("View my profile");
+                if (userContext.isLoggedIn) {
+                    addBotMessage("Opening your profile...", 300);
+                    setTimeout(() => window.location.href = '/profile', 1000);
+                }
+            },
+            security: () => {
+                addUserMessage("Security settings");
+                addBotMessage("<strong>🔒 Account Security</strong><br><br><strong>Current Security Status:</strong><br>✓ Email verified<br>✓ Strong password<br>⚠️ 2FA not enabled (recommended)<br><br><strong>Security Tips:</strong><br>• Use unique password<br>• Enable 2-factor authentication<br>• Never share your password<br>• Review login activity<br>• Update recovery email<br><br>Would you like to enable 2FA for extra security?", 300, {
+                    buttons: [
+                        { label: '🛡️ Enable 2FA', action: 'view_profile' },
+                        { label: '🔑 Change Password', action: 'view_profile' }
+                    ]
+                });
+            },
+            register: () => {
+                addBotMessage("Taking you to registration page...", 300);
+                setTimeout(() => window.location.href = '/register', 1000);
+            },
+            login: () => {
+                addBotMessage("Taking you to login page...", 300);
+                setTimeout(() => window.location.href = '/login', 1000);
+            },
+            add_property: () => {
+                addUserMessage("Add a property");
+                if (userContext.isLoggedIn) {
+                    addBotMessage("Great! Let me guide you through adding your property...", 300);
+                    setTimeout(() => window.location.href = '/add-property', 1000);
+                } else {
+                    addBotMessage("Please login as a landlord to add properties.", 300);
+                }
+            },
+            landlord_dashboard: () => {
+                addUserMessage("View landlord dashboard");
+                addBotMessage("Opening landlord dashboard...", 300);
+                setTimeout(() => window.location.href = '/dashboard', 1000);
+            },
+            my_bookings: () => {
+                addUserMessage("View my bookings");
+                if (userContext.isLoggedIn) {
+                    addBotMessage("Opening your bookings...", 300);
+                    setTimeout(() => window.location.href = '/my-bookings', 1000);
+                } else {
+                    addBotMessage("Please login to view your bookings.", 300);
+                }
+            },
+            emergency: () => {
+                addUserMessage("Report emergency");
+                addBotMessage("<strong>🚨 EMERGENCY MAINTENANCE</strong><br><br>I'll connect you with urgent support right away!<br><br>For immediate assistance:<br><br>📞 <strong>Emergency Hotline:</strong> 0917-XXX-XXXX<br>📱 <strong>24/7 Support:</strong> Available now<br><br>Please describe your emergency and we'll dispatch help immediately.<br><br><strong>Common Emergencies:</strong><br>• No water/electricity<br>• Gas leak (evacuate immediately!)<br>• Flooding<br>• Fire (call 911 first!)<br>• Broken locks/security issues", 300);
+            },
+            maintenance_request: () => {
+                addUserMessage("Submit maintenance request");
+                if (userContext.isLoggedIn) {
+                    addBotMessage("Opening maintenance request form...", 300);
+                    setTimeout(() => window.location.href = '/maintenance', 1000);
+                } else {
+                    addBotMessage("Please login to submit maintenance requests.", 300);
+                }
+            },
+            leave_review: () => {
+                addUserMessage("Leave a review");
+                if (userContext.isLoggedIn) {
+                    addBotMessage("Opening review form...", 300);
+                    setTimeout(() => window.location.href = '/reviews', 1000);
+                } else {
+                    addBotMessage("Please login to leave reviews.", 300);
+                }
+            },
+            read_reviews: () => {
+                addUserMessage("Read property reviews");
+                addBotMessage("You can read reviews on any property page. Reviews are shown with verified tenant badges for authenticity.", 300);
+            }
+        };
+
+        const handler = actionMap[action];
+        if (handler) {
+            handler();
+        } else {
+            addUserMessage(action);
+            processUserMessage(action);
+        }
+    }
+
+    function showPersonalizedRecommendations() {
+        addBotMessage("Based on popular choices, here are my top recommendations:", 300);
+
+        setTimeout(() => {
+            const recommendations = [
+                {
+                    title: "Modern Studio in BGC",
+                    location: "Bonifacio Global City",
+                    price: "₱18,000/month",
+                    features: "WiFi, Furnished, 24/7 Security",
+                    rating: "⭐ 4.8 (24 reviews)",
+                    available: "Available Now"
+                },
+                {
+                    title: "Spacious 2BR near Ayala",
+                    location: "Makati City",
+                    price: "₱25,000/month",
+                    features: "Parking, Pool, Gym",
+                    rating: "⭐ 4.9 (18 reviews)",
+                    available: "Available Dec 1"
+                },
+                {
+                    title: "Affordable Bedspace",
+                    location: "Quezon City",
+                    price: "₱4,500/month",
+                    features: "WiFi, Near MRT, Female Only",
+                    rating: "⭐ 4.7 (31 reviews)",
+                    available: "Available Now"
+                }
+            ];
+
+            recommendations.forEach((prop, index) => {
+                setTimeout(() => {
+                    const propCard = document.createElement('div');
+                    propCard.className = 'property-card-chat';
+                    propCard.innerHTML = `
+                        <div class="property-title">${prop.title}</div>
+                        <div class="property-details">
+                            <i class="bi bi-geo-alt"></i> ${prop.location}<br>
+                            <small>${prop.features}</small><br>
+                            <small>${prop.rating}</small><br>
+                            <small style="color: var(--fb-primary);">✓ ${prop.available}</small>
+                        </div>
+                        <div class="property-price">${prop.price}</div>
+                    `;
+                    propCard.onclick = () => {
+                        addUserMessage(`Tell me more about ${prop.title}`);
+                        addBotMessage(`<strong>${prop.title}</strong> is an excellent choice!<br><br>📍 <strong>Location:</strong> ${prop.location}<br>💰 <strong>Price:</strong> ${prop.price}<br>✨ <strong>Features:</strong> ${prop.features}<br>${prop.rating}<br><br>${prop.available}. Would you like to book this property?`, 300, {
+                            buttons: [
+                                { label: '✓ Book Now', action: 'start_booking' },
+                                { label: '📖 Read Reviews', action: 'read_reviews' },
+                                { label: '🔍 Find Similar', action: 'search_properties' }
+                            ]
+                        });
+                    };
+                    chatbotMessages.appendChild(propCard);
+                    scrollToBottom();
+                }, index * 400);
+            });
+        }, 800);
+    }
+
+    // ============================================
+    // EVENT LISTENERS
+    // ============================================
+
+    chatbotToggle.addEventListener('click', function() {
+        isChatOpen = !isChatOpen;
+        chatbotWindow.classList.toggle('active', isChatOpen);
+
+        if (isChatOpen) {
+            chatbotNotification.style.display = 'none';
+            chatbotInput.focus();
+
+            if (conversationHistory.length === 0) {
+                initChat();
+            }
+        }
+    });
+
+    minimizeChat.addEventListener('click', function() {
+        chatbotWindow.classList.remove('active');
+        isChatOpen = false;
+    });
+
+    closeChat.addEventListener('click', function() {
+        chatbotWindow.classList.remove('active');
+        isChatOpen = false;
+    });
+
+    clearChat.addEventListener('click', function() {
+        if (confirm('Clear all chat messages?')) {
+            chatbotMessages.innerHTML = '';
+            conversationHistory = [];
+            sessionStorage.removeItem('boardify_chat_history');
+            initChat();
+        }
+    });
+
+    sendMessage.addEventListener('click', sendUserMessage);
+
+    chatbotInput.addEventListener('keypress', function(e) {
+        if (e.key === 'Enter') {
+            sendUserMessage();
+        }
+    });
+
+    document.querySelectorAll('.quick-action-btn').forEach(button => {
+        button.addEventListener('click', function() {
+            const action = this.getAttribute('data-action');
+            let message = "";
+
+            switch(action) {
+                case 'find_properties':
+                    message = "I want to find properties";
+                    break;
+                case 'booking_help':
+                    message = "How does booking work?";
+                    break;
+                case 'billing_info':
+                    message = "I have billing questions";
+                    break;
+            }
+
+            addUserMessage(message);
+            hideQuickActions();
+            processUserMessage(message);
+        });
+    });
+
+    document.querySelectorAll('.suggestion').forEach(suggestion => {
+        suggestion.addEventListener('click', function() {
+            const text = this.textContent.replace(/['"]/g, '');
+            chatbotInput.value = text;
+            chatbotInput.focus();
+        });
+    });
+
+    function sendUserMessage() {
+        const message = chatbotInput.value.trim();
+        if (message) {
+            addUserMessage(message);
+            chatbotInput.value = '';
+            hideQuickActions();
+            processUserMessage(message);
+        }
+    }
+
+    // ============================================
+    // ADVANCED FEATURES
+    // ============================================
+
+    // Context-aware greeting based on current page
+    function getContextualGreeting() {
+        const path = window.location.pathname;
+        const greetings = {
+            '/properties': "I see you're browsing properties! Need help finding something specific?",
+            '/booking': "Working on a booking? I can help guide you through the process!",
+            '/billing': "Need help with payments or billing? I'm here to assist!",
+            '/profile': "Managing your profile? Let me know if you need any help!",
+            '/dashboard': "Welcome to your dashboard! What would you like to do today?"
+        };
+
+        return greetings[path] || null;
+    }
+
+    // Smart notification system
+    function checkAutoOpen() {
+        const currentPath = window.location.pathname;
+        const autoOpenPages = ['/properties', '/booking', '/billing'];
+
+        if (autoOpenPages.some(page => currentPath.includes(page))) {
+            setTimeout(() => {
+                if (!isChatOpen) {
+                    chatbotNotification.textContent = '!';
+                    chatbotNotification.style.display = 'flex';
+                }
+            }, 3000);
+        }
+    }
+
+    // Save conversation history to session storage
+    function saveConversation() {
+        try {
+            sessionStorage.setItem('boardify_chat_history', JSON.stringify(conversationHistory));
+        } catch (e) {
+            console.log('Could not save chat history');
+        }
+    }
+
+    // Load previous conversation
+    function loadConversation() {
+        try {
+            const saved = sessionStorage.getItem('boardify_chat_history');
+            if (saved) {
+                const history = JSON.parse(saved);
+                if (history.length > 0) {
+                    conversationHistory = history;
+                    history.forEach(msg => {
+                        if (msg.type === 'bot') {
+                            addBotMessage(msg.text, 0, msg.options || {});
+                        } else {
+                            addUserMessage(msg.text);
+                        }
+                    });
+                    return true;
+                }
+            }
+        } catch (e) {
+            console.log('Could not load chat history');
+        }
+        return false;
+    }
+
+    // Auto-save conversation periodically
+    setInterval(saveConversation, 10000); // Every 10 seconds
+
+    // Keyboard shortcuts
+    document.addEventListener('keydown', function(e) {
+        // Ctrl/Cmd + K to open chatbot
+        if ((e.ctrlKey || e.metaKey) && e.key === 'k') {
+            e.preventDefault();
+            if (!isChatOpen) {
+                chatbotToggle.click();
+            }
+            chatbotInput.focus();
+        }
+
+        // Escape to close chatbot
+        if (e.key === 'Escape' && isChatOpen) {
+            closeChat.click();
+        }
+    });
+
+    // Smart suggestions based on context
+    function updateSmartSuggestions() {
+        const suggestionsContainer = document.getElementById('chatbotSuggestions');
+        const path = window.location.pathname;
+
+        const suggestions = {
+            '/properties': [
+                '"Filter by price"',
+                '"Show available now"',
+                '"Near MRT stations"'
+            ],
+            '/booking': [
+                '"What documents needed?"',
+                '"How long approval?"',
+                '"Cancel booking"'
+            ],
+            '/billing': [
+                '"Payment methods"',
+                '"Download receipt"',
+                '"Setup auto-pay"'
+            ],
+            'default': [
+                '"Find apartments in Makati"',
+                '"How to book?"',
+                '"Payment options"'
+            ]
+        };
+
+        const relevantSuggestions = suggestions[path] || suggestions.default;
+
+        suggestionsContainer.innerHTML = `
+            <small>Try asking:</small>
+            ${relevantSuggestions.map(s => `<span class="suggestion">${s}</span>`).join('')}
+        `;
+
+        // Reattach click handlers
+        suggestionsContainer.querySelectorAll('.suggestion').forEach(suggestion => {
+            suggestion.addEventListener('click', function() {
+                const text = this.textContent.replace(/['"]/g, '');
+                chatbotInput.value = text;
+                chatbotInput.focus();
+            });
+        });
+    }
+
+    // Initialize
+    const hasHistory = loadConversation();
+    if (!hasHistory) {
+        setTimeout(() => {
+            if (conversationHistory.length === 0 && isChatOpen) {
+                initChat();
+            }
+        }, 100);
+    }
+
+    checkAutoOpen();
+    updateSmartSuggestions();
+
+    console.log('🤖 Boardify AI Assistant loaded successfully!');
+    console.log('💡 Press Ctrl+K to open chat anytime');
+});
+
+// Auto-dismiss flash messages after 5 seconds
+document.addEventListener('DOMContentLoaded', function() {
+    const flashMessages = document.querySelectorAll('.alert');
+
+    flashMessages.forEach(function(message) {
+        // Auto-hide after 5 seconds
+        setTimeout(function() {
+            // Create fade-out animation
+            message.style.transition = 'opacity 0.3s ease-in-out';
+            message.style.opacity = '0';
+
+            // Remove from DOM after fade out
+            setTimeout(function() {
+                if (message.parentNode) {
+                    message.remove();
+                }
+            }, 300);
+        }, 3000); // 5000ms = 5 seconds
+
+        // Manual close with X button
+        const closeButton = message.querySelector('.btn-close');
+        if (closeButton) {
+            closeButton.addEventListener('click', function() {
+                message.style.transition = 'opacity 0.3s ease-in-out';
+                message.style.opacity = '0';
+                setTimeout(function() {
+                    if (message.parentNode) {
+                        message.remove();
+                    }
+                }, 300);
+            });
+        }
+    });
+});
@@ -0,0 +1,135 @@
+document.addEventListener('DOMContentLoaded', function() {
+    initializeMobileMenu();
+    
+    let resizeTimer;
+    window.addEventListener('resize', function() {
+        clearTimeout(resizeTimer);
+        resizeTimer = setTimeout(initializeMobileMenu, 250);
+    });
+});
+
+function initializeMobileMenu() {
+    const windowWidth = window.innerWidth;
+    const sidebar = document.querySelector('.sidebar');
+    const mainContent = document.querySelector('.main-content');
+    
+    if (!sidebar || !mainContent) return;
+    
+    if (windowWidth <= 992) {
+        if (!document.querySelector('.mobile-header')) {
+            addMobileHeader();
+        }
+        if (!document.querySelector('.sidebar-overlay')) {
+            addOverlay();
+        }
+    } else {
+        const mobileHeader = document.querySelector('.mobile-header');
+        const overlay = document.querySelector('.sidebar-overlay');
+        
+        if (mobileHeader) mobileHeader.remove();
+        if (overlay) overlay.remove();
+        
+        sidebar.classList.remove('show');
+        document.body.style.overflow = '';
+    }
+}
+
+function addMobileHeader() {
+    const mainContent = document.querySelector('.main-content');
+    if (!mainContent) return;
+    
+    const mobileHeader = document.createElement('div');
+    mobileHeader.className = 'mobile-header';
+    mobileHeader.innerHTML = `
+        <button class="hamburger-btn" onclick="toggleMobileSidebar()">
+            <i class="bi bi-list"></i>
+        </button>
+        <h3 style="margin: 0; font-size: 1.2rem; color: var(--fb-primary); display: flex; align-items: center;">
+            <i class="bi bi-house-heart-fill me-2"></i>Boardify
+        </h3>
+        <div style="width: 40px;"></div>
+    `;
+    
+    mainContent.insertBefore(mobileHeader, mainContent.firstChild);
+}
+
+function addOverlay() {
+    const overlay = document.createElement('div');
+    overlay.className = 'sidebar-overlay';
+    overlay.onclick = toggleMobileSidebar;
+    document.body.appendChild(overlay);
+}
+
+function toggleMobileSidebar() {
+    const sidebar = document.querySelector('.sidebar');
+    const overlay = document.querySelector('.sidebar-overlay');
+    
+    if (!sidebar || !overlay) return;
+    
+    const isOpen = sidebar.classList.contains('show');
+    
+    if (isOpen) {
+        sidebar.classList.remove('show');
+        overlay.classList.remove('show');
+        document.body.style.overflow = '';
+    } else {
+        sidebar.classList.add('show');
+        overlay.classList.add('show');
+        document.body.style.overflow = 'hidden';
+    }
+}
+
+document.addEventListener('click', function(e) {
+    if (e.target.closest('.sidebar .nav-link')) {
+        if (window.innerWidth <= 992) {
+            setTimeout(toggleMobileSidebar, 200);
+        }
+    }
+});
+
+console.log('🎨 Boardify Dashboard loaded successfully!');
+
+// ---- Widgets: fetched in parallel, each fails on its own ----
+
+function loadWidget(container) {
+    container.setAttribute('aria-busy', 'true');
+    return fetch(container.dataset.widgetUrl, {
+        headers: { 'Accept': 'application/json' },
+        credentials: 'same-origin'
+    })
+        .then(function(response) {
+            return response.json().catch(function() { return {}; }).then(function(data) {
+                if (!response.ok || typeof data.html !== 'string') {
+                    throw new Error(data.error || ('HTTP ' + response.status));
+                }
+                return data;
+            });
+        })
+        .then(function(data) {
+            container.innerHTML = data.html;
+        })
+        .catch(function(error) {
+            console.error('Dashboard widget ' + container.dataset.widget + ' failed:', error);
+            showWidgetError(container);
+        })
+        .finally(function() {
+            container.setAttribute('aria-busy', 'false');
+        });
+}
+
+function showWidgetError(container) {
+    container.innerHTML = `
+        <div class="widget-error">
+            <span><i class="bi bi-exclamation-triangle me-2"></i>This section could not be loaded.</span>
+            <button type="button" class="btn btn-sm btn-outline-primary">Retry</button>
+        </div>
+    `;
+    container.querySelector('button').addEventListener('click', function() {
+        container.innerHTML = '<div class="widget-placeholder"><span class="spinner-border spinner-border-sm text-primary" role="status"></span></div>';
+        loadWidget(container);
+    });
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    document.querySelectorAll('.dashboard-widget[data-widget-url]').forEach(loadWidget);
+});
@@ -0,0 +1,666 @@
+// ===== THEME TOGGLE FUNCTIONALITY =====
+function toggleTheme() {
+    const body = document.body;
+    const themeIcon = document.getElementById('themeIcon');
+
+    body.classList.toggle('dark-theme');
+
+    if (body.classList.contains('dark-theme')) {
+        themeIcon.className = 'bi bi-moon-fill';
+        localStorage.setItem('boardify_theme', 'dark');
+    } else {
+        themeIcon.className = 'bi bi-sun-fill';
+        localStorage.setItem('boardify_theme', 'light');
+    }
+}
+
+// ===== DELETE IMAGE FUNCTION =====
+function deleteImage(imageId, filename) {
+    // Show confirmation modal
+    showConfirmModal(
+        'Delete Image',
+        'Are you sure you want to delete this image? This action cannot be undone.',
+        () => {
+            // User confirmed deletion
+            const formData = new FormData();
+            formData.append('image_id', imageId);
+            formData.append('action', 'delete_image');
+
+            fetch(window.location.href, {
+                method: 'POST',
+                body: formData
+            })
+            .then(response => response.json())
+            .then(data => {
+                if (data.success) {
+                    // Remove the image element from DOM
+                    const imageElement = document.querySelector(`[data-image-id="${imageId}"]`);
+                    if (imageElement) {
+                        imageElement.style.animation = 'fadeOut 0.3s ease-out';
+                        setTimeout(() => {
+                            imageElement.remove();
+
+                            // Check if gallery is empty
+                            const gallery = document.getElementById('existingImagesGallery');
+                            if (gallery && gallery.querySelectorAll('.gallery-item').length === 0) {
+                                gallery.innerHTML = `
+                                    <div class="no-images-placeholder">
+                                        <i class="bi bi-image"></i>
+                                        <p>No images uploaded yet</p>
+                                    </div>
+                                `;
+                            }
+                        }, 300);
+                    }
+                    showToast('Image deleted successfully!', 'success');
+                } else {
+                    showToast(data.message || 'Failed to delete image', 'danger');
+                }
+            })
+            .catch(error => {
+                console.error('Error:', error);
+                showToast('An error occurred while deleting the image', 'danger');
+            });
+        }
+    );
+}
+
+// ===== SETUP DELETE BUTTON LISTENERS =====
+function setupDeleteButtons() {
+    // Use event delegation for dynamically loaded content
+    document.addEventListener('click', function(e) {
+        const deleteBtn = e.target.closest('.btn-delete-image');
+        if (deleteBtn) {
+            e.preventDefault();
+            e.stopPropagation();
+            const imageId = deleteBtn.getAttribute('data-image-id');
+            const filename = deleteBtn.getAttribute('data-image-filename');
+            deleteImage(imageId, filename);
+        }
+    });
+}
+
+// ===== MAIN INITIALIZATION =====
+document.addEventListener('DOMContentLoaded', function() {
+    console.log('🎨 Boardify Edit Property Page Loading...');
+
+    // Load saved theme
+    initializeTheme();
+
+    // Initialize all features
+    initializeCharacterCount();
+    initializeImageUpload();
+    initializeFormValidation();
+    initializePreview();
+    setupDeleteButtons();
+
+    console.log('✨ Edit Property Page Initialized!');
+});
+
+// ===== THEME INITIALIZATION =====
+function initializeTheme() {
+    const savedTheme = localStorage.getItem('boardify_theme');
+    const body = document.body;
+    const themeIcon = document.getElementById('themeIcon');
+
+    if (savedTheme === 'dark') {
+        body.classList.add('dark-theme');
+        if (themeIcon) themeIcon.className = 'bi bi-moon-fill';
+    } else {
+        if (themeIcon) themeIcon.className = 'bi bi-sun-fill';
+    }
+}
+
+// ===== CHARACTER COUNTER =====
+function initializeCharacterCount() {
+    const descriptionTextarea = document.getElementById('description');
+    const charCount = document.getElementById('charCount');
+
+    if (descriptionTextarea && charCount) {
+        descriptionTextarea.addEventListener('input', function() {
+            charCount.textContent = this.value.length;
+
+            // Visual feedback for length
+            if (this.value.length > 500) {
+                charCount.style.color = 'var(--warning)';
+            } else if (this.value.length > 1000) {
+                charCount.style.color = 'var(--danger)';
+            } else {
+                charCount.style.color = 'var(--text-tertiary)';
+            }
+        });
+    }
+}
+
+// ===== IMAGE UPLOAD WITH DRAG & DROP (MULTIPLE FILES) =====
+function initializeImageUpload() {
+    const uploadArea = document.getElementById('uploadArea');
+    const fileInput = document.getElementById('images');
+    const newImagesPreview = document.getElementById('newImagesPreview');
+
+    if (!uploadArea || !fileInput) return;
+
+    let selectedFiles = [];
+
+    // Click to upload
+    uploadArea.addEventListener('click', function(e) {
+        if (e.target !== fileInput) {
+            fileInput.click();
+        }
+    });
+
+    // File selection
+    fileInput.addEventListener('change', function(e) {
+        const files = Array.from(e.target.files);
+        handleMultipleFiles(files);
+    });
+
+    // Drag and drop
+    uploadArea.addEventListener('dragover', function(e) {
+        e.preventDefault();
+        this.classList.add('drag-over');
+    });
+
+    uploadArea.addEventListener('dragleave', function(e) {
+        e.preventDefault();
+        this.classList.remove('drag-over');
+    });
+
+    uploadArea.addEventListener('drop', function(e) {
+        e.preventDefault();
+        this.classList.remove('drag-over');
+
+        const files = Array.from(e.dataTransfer.files).filter(file => file.type.startsWith('image/'));
+        if (files.length > 0) {
+            handleMultipleFiles(files);
+        } else {
+            showToast('Please upload image files only', 'danger');
+        }
+    });
+
+    function handleMultipleFiles(files) {
+        let validFiles = [];
+        let hasErrors = false;
+
+        files.forEach(file => {
+            // Validate file size (5MB max)
+            if (file.size > 5 * 1024 * 1024) {
+                showToast(`${file.name} is too large (max 5MB)`, 'danger');
+                hasErrors = true;
+                return;
+            }
+
+            // Validate file type
+            if (!file.type.startsWith('image/')) {
+                showToast(`${file.name} is not an image`, 'danger');
+                hasErrors = true;
+                return;
+            }
+
+            validFiles.push(file);
+        });
+
+        if (validFiles.length > 0) {
+            selectedFiles = [...selectedFiles, ...validFiles];
+            updateFileInput();
+            renderNewImagesPreviews();
+
+            if (!hasErrors) {
+                showToast(`${validFiles.length} image(s) added successfully!`, 'success');
+            }
+        }
+    }
+
+    function updateFileInput() {
+        const dataTransfer = new DataTransfer();
+        selectedFiles.forEach(file => dataTransfer.items.add(file));
+        fileInput.files = dataTransfer.files;
+    }
+
+    function renderNewImagesPreviews() {
+        newImagesPreview.innerHTML = '';
+
+        selectedFiles.forEach((file, index) => {
+            const reader = new FileReader();
+            reader.onload = function(e) {
+                const previewItem = document.createElement('div');
+                previewItem.className = 'new-image-item';
+                previewItem.innerHTML = `
+                    <img src="${e.target.result}" alt="New Image">
+                    <button type="button" class="btn-remove-new-image" onclick="removeNewImage(${index})">
+                        <i class="bi bi-x"></i>
+                    </button>
+                    ${index === 0 ? '<span class="primary-badge"><i class="bi bi-star-fill"></i> Primary</span>' : ''}
+                `;
+                newImagesPreview.appendChild(previewItem);
+            };
+            reader.readAsDataURL(file);
+        });
+    }
+
+    // Make removeNewImage globally accessible
+    window.removeNewImage = function(index) {
+        selectedFiles.splice(index, 1);
+        updateFileInput();
+        renderNewImagesPreviews();
+        showToast('Image removed', 'info');
+    };
+}
+
+// ===== FORM VALIDATION =====
+function initializeFormValidation() {
+    const form = document.getElementById('editPropertyForm');
+
+    if (!form) return;
+
+    // Real-time validation
+    const inputs = form.querySelectorAll('input[required], textarea[required], select[required]');
+
+    inputs.forEach(input => {
+        input.addEventListener('blur', function() {
+            validateField(this);
+        });
+
+        input.addEventListener('input', function() {
+            if (this.classList.contains('is-invalid')) {
+                validateField(this);
+            }
+        });
+    });
+
+    // Form submission
+    form.addEventListener('submit', function(e) {
+        let isValid = true;
+
+        inputs.forEach(input => {
+            if (!validateField(input)) {
+                isValid = false;
+            }
+        });
+
+        if (!isValid) {
+            e.preventDefault();
+            showToast('Please fill in all required fields correctly', 'danger');
+
+            // Scroll to first error
+            const firstError = form.querySelector('.is-invalid');
+            if (firstError) {
+                firstError.scrollIntoView({ behavior: 'smooth', block: 'center' });
+                firstError.focus();
+            }
+            return;
+        }
+
+        // Show loading state
+        const submitBtn = form.querySelector('button[type="submit"]');
+        if (submitBtn) {
+            submitBtn.classList.add('loading');
+            submitBtn.disabled = true;
+            submitBtn.innerHTML = '<i class="bi bi-hourglass-split me-2"></i>Saving Changes...';
+        }
+    });
+
+    function validateField(field) {
+        let isValid = true;
+        const errorMsg = field.parentElement.querySelector('.error-message');
+
+        // Remove existing error
+        if (errorMsg) {
+            errorMsg.remove();
+        }
+        field.classList.remove('is-invalid');
+
+        // Check if empty
+        if (field.hasAttribute('required') && !field.value.trim()) {
+            isValid = false;
+            showFieldError(field, 'This field is required');
+        }
+
+        // Validate price
+        if (field.id === 'price' && field.value) {
+            const price = parseFloat(field.value);
+            if (price <= 0) {
+                isValid = false;
+                showFieldError(field, 'Price must be greater than 0');
+            }
+        }
+
+        // Validate slots
+        if (field.id === 'total_slots' && field.value) {
+            const slots = parseInt(field.value);
+            if (slots < 1 || slots > 50) {
+                isValid = false;
+                showFieldError(field, 'Slots must be between 1 and 50');
+            }
+        }
+
+        return isValid;
+    }
+
+    function showFieldError(field, message) {
+        field.classList.add('is-invalid');
+
+        const errorDiv = document.createElement('small');
+        errorDiv.className = 'error-message form-helper-text';
+        errorDiv.style.color = 'var(--danger)';
+        errorDiv.innerHTML = '<i class="bi bi-exclamation-circle me-1"></i>' + message;
+
+        field.parentElement.appendChild(errorDiv);
+    }
+}
+
+// ===== PREVIEW FUNCTIONALITY =====
+function initializePreview() {
+    const previewBtn = document.getElementById('previewBtn');
+
+    if (previewBtn) {
+        previewBtn.addEventListener('click', function() {
+            const title = document.getElementById('title').value;
+            const description = document.getElementById('description').value;
+            const location = document.getElementById('location').value;
+            const price = document.getElementById('price').value;
+            const slots = document.getElementById('total_slots').value;
+            const gender = document.getElementById('gender_preference').value;
+            const status = document.getElementById('status').value;
+
+            // Validate required fields
+            if (!title || !description || !location || !price || !slots) {
+                showToast('Please fill in all required fields to preview', 'warning');
+                return;
+            }
+
+            // Create preview modal content
+            const previewContent = `
+                <div style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif;">
+                    <h3 style="color: var(--fb-primary); margin-bottom: 1rem;">
+                        <i class="bi bi-eye-fill me-2"></i>${title}
+                    </h3>
+                    <p style="color: var(--text-secondary); margin-bottom: 1rem;">
+                        <i class="bi bi-geo-alt-fill me-2" style="color: var(--fb-primary);"></i>${location}
+                    </p>
+                    <p style="line-height: 1.6; color: var(--text-primary);">${description}</p>
+                    <hr style="border-color: var(--border-color); margin: 1.5rem 0;">
+                    <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem;">
+                        <div>
+                            <strong style="color: var(--text-secondary);">Price:</strong>
+                            <div style="font-size: 1.5rem; font-weight: 700; color: var(--fb-primary);">
+                                ₱${parseFloat(price).toLocaleString()}
+                            </div>
+                        </div>
+                        <div>
+                            <strong style="color: var(--text-secondary);">Slots:</strong>
+                            <div style="font-size: 1.5rem; font-weight: 700; color: var(--text-primary);">
+                                ${slots}
+                            </div>
+                        </div>
+                        <div>
+                            <strong style="color: var(--text-secondary);">Gender:</strong>
+                            <div style="font-weight: 600; color: var(--text-primary);">
+                                ${gender === 'both' ? 'Both' : gender === 'male' ? 'Boys Only' : 'Girls Only'}
+                            </div>
+                        </div>
+                        <div>
+                            <strong style="color: var(--text-secondary);">Status:</strong>
+                            <div style="font-weight: 600; color: ${status === 'available' ? 'var(--success)' : 'var(--danger)'};">
+                                ${status === 'available' ? 'Available' : 'Unavailable'}
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            `;
+
+            showPreviewModal(previewContent);
+        });
+    }
+}
+
+// ===== CONFIRMATION MODAL =====
+function showConfirmModal(title, message, onConfirm) {
+    // Remove existing modal
+    const existingModal = document.getElementById('confirmModal');
+    if (existingModal) {
+        existingModal.remove();
+    }
+
+    // Create modal
+    const modal = document.createElement('div');
+    modal.id = 'confirmModal';
+    modal.style.cssText = `
+        position: fixed;
+        top: 0;
+        left: 0;
+        width: 100%;
+        height: 100%;
+        background: rgba(0, 0, 0, 0.75);
+        backdrop-filter: blur(4px);
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        z-index: 10000;
+        animation: fadeIn 0.3s ease;
+    `;
+
+    modal.innerHTML = `
+        <div style="
+            background: var(--bg-primary);
+            border-radius: 16px;
+            padding: 2rem;
+            max-width: 450px;
+            width: 90%;
+            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3);
+            animation: slideUp 0.3s ease;
+        ">
+            <h3 style="color: var(--text-primary); margin-bottom: 1rem; display: flex; align-items: center;">
+                <i class="bi bi-exclamation-triangle-fill me-2" style="color: var(--warning);"></i>
+                ${title}
+            </h3>
+            <p style="color: var(--text-secondary); line-height: 1.6; margin-bottom: 1.5rem;">${message}</p>
+            <div style="display: flex; gap: 0.75rem;">
+                <button id="confirmBtn" style="
+                    flex: 1;
+                    padding: 0.875rem;
+                    background: var(--danger);
+                    color: white;
+                    border: none;
+                    border-radius: 10px;
+                    font-weight: 700;
+                    cursor: pointer;
+                    transition: all 0.3s ease;
+                " onmouseover="this.style.background='#c0392b'" onmouseout="this.style.background='var(--danger)'">
+                    <i class="bi bi-check-circle me-2"></i>Yes, Delete
+                </button>
+                <button id="cancelBtn" style="
+                    flex: 1;
+                    padding: 0.875rem;
+                    background: var(--bg-tertiary);
+                    color: var(--text-primary);
+                    border: 2px solid var(--border-color);
+                    border-radius: 10px;
+                    font-weight: 700;
+                    cursor: pointer;
+                    transition: all 0.3s ease;
+                " onmouseover="this.style.background='var(--bg-hover)'" onmouseout="this.style.background='var(--bg-tertiary)'">
+                    <i class="bi bi-x-circle me-2"></i>Cancel
+                </button>
+            </div>
+        </div>
+    `;
+
+    document.body.appendChild(modal);
+
+    // Event listeners
+    document.getElementById('confirmBtn').addEventListener('click', () => {
+        modal.remove();
+        if (onConfirm) onConfirm();
+    });
+
+    document.getElementById('cancelBtn').addEventListener('click', () => {
+        modal.remove();
+    });
+
+    // Close on background click
+    modal.addEventListener('click', function(e) {
+        if (e.target === modal) {
+            modal.remove();
+        }
+    });
+
+    // Close on Escape key
+    const escapeHandler = (e) => {
+        if (e.key === 'Escape') {
+            modal.remove();
+            document.removeEventListener('keydown', escapeHandler);
+        }
+    };
+    document.addEventListener('keydown', escapeHandler);
+}
+
+// ===== PREVIEW MODAL =====
+function showPreviewModal(content) {
+    // Remove existing modal
+    const existingModal = document.getElementById('previewModal');
+    if (existingModal) {
+        existingModal.remove();
+    }
+
+    // Create modal
+    const modal = document.createElement('div');
+    modal.id = 'previewModal';
+    modal.style.cssText = `
+        position: fixed;
+        top: 0;
+        left: 0;
+        width: 100%;
+        height: 100%;
+        background: rgba(0, 0, 0, 0.75);
+        backdrop-filter: blur(4px);
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        z-index: 10000;
+        animation: fadeIn 0.3s ease;
+    `;
+
+    modal.innerHTML = `
+        <div style="
+            background: var(--bg-primary);
+            border-radius: 16px;
+            padding: 2rem;
+            max-width: 600px;
+            width: 90%;
+            max-height: 80vh;
+            overflow-y: auto;
+            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3);
+            animation: slideUp 0.3s ease;
+        ">
+            ${content}
+            <button onclick="document.getElementById('previewModal').remove()" style="
+                width: 100%;
+                margin-top: 1.5rem;
+                padding: 1rem;
+                background: var(--fb-primary);
+                color: white;
+                border: none;
+                border-radius: 12px;
+                font-weight: 700;
+                cursor: pointer;
+                transition: all 0.3s ease;
+            " onmouseover="this.style.background='var(--fb-primary-hover)'" onmouseout="this.style.background='var(--fb-primary)'">
+                <i class="bi bi-x-circle me-2"></i>Close Preview
+            </button>
+        </div>
+    `;
+
+    document.body.appendChild(modal);
+
+    // Close on background click
+    modal.addEventListener('click', function(e) {
+        if (e.target === modal) {
+            modal.remove();
+        }
+    });
+
+    // Close on Escape key
+    const escapeHandler = (e) => {
+        if (e.key === 'Escape') {
+            modal.remove();
+            document.removeEventListener('keydown', escapeHandler);
+        }
+    };
+    document.addEventListener('keydown', escapeHandler);
+}
+
+// ===== TOAST NOTIFICATION =====
+function showToast(message, type = 'info') {
+    // Remove existing toasts
+    const existingToasts = document.querySelectorAll('.custom-toast');
+    existingToasts.forEach(toast => toast.remove());
+
+    const toast = document.createElement('div');
+    toast.className = 'custom-toast';
+
+    const icons = {
+        success: 'check-circle-fill',
+        danger: 'x-circle-fill',
+        warning: 'exclamation-triangle-fill',
+        info: 'info-circle-fill'
+    };
+
+    const colors = {
+        success: 'var(--success)',
+        danger: 'var(--danger)',
+        warning: 'var(--warning)',
+        info: 'var(--fb-primary)'
+    };
+
+    toast.innerHTML = `
+        <i class="bi bi-${icons[type] || 'info-circle-fill'} me-2"></i>
+        <span>${message}</span>
+    `;
+
+    Object.assign(toast.style, {
+        position: 'fixed',
+        top: '20px',
+        right: '20px',
+        background: colors[type] || colors.info,
+        color: 'white',
+        padding: '1rem 1.5rem',
+        borderRadius: '12px',
+        boxShadow: '0 4px 12px rgba(0, 0, 0, 0.15)',
+        zIndex: '99999',
+        display: 'flex',
+        alignItems: 'center',
+        fontWeight: '600',
+        fontSize: '0.95rem',
+        animation: 'slideInRight 0.3s ease-out'
+    });
+
+    document.body.appendChild(toast);
+
+    setTimeout(() => {
+        toast.style.animation = 'slideOutRight 0.3s ease-out';
+        setTimeout(() => {
+            if (toast.parentNode) {
+                toast.parentNode.removeChild(toast);
+            }
+        }, 300);
+    }, 3000);
+}
+
+// Add fadeOut animation
+const style = document.createElement('style');
+style.textContent = `
+    @keyframes fadeOut {
+        from {
+            opacity: 1;
+            transform: scale(1);
+        }
+        to {
+            opacity: 0;
+            transform: scale(0.9);
+        }
+    }
+`;
+document.head.appendChild(style);
+
+console.log('✨ Edit Property Page - All Features Loaded!');
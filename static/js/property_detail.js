@@ -0,0 +1,589 @@
+    // ===== THEME TOGGLE FUNCTIONALITY =====
+    // ===== THEME TOGGLE FUNCTIONALITY =====
+function toggleTheme() {
+    const body = document.body;
+    const themeIcon = document.getElementById('themeIcon');
+
+    body.classList.toggle('dark-theme');
+
+    if (body.classList.contains('dark-theme')) {
+        themeIcon.className = 'bi bi-moon-fill';
+        localStorage.setItem('boardify_theme', 'dark');
+    } else {
+        themeIcon.className = 'bi bi-sun-fill';
+        localStorage.setItem('boardify_theme', 'light');
+    }
+}
+
+// ===== MAIN INITIALIZATION =====
+document.addEventListener('DOMContentLoaded', function() {
+    console.log('🏠 Boardify Property Detail Page Loading...');
+
+    // Load saved theme
+    initializeTheme();
+
+    // Initialize mobile features
+    initializeMobileFeatures();
+    initializeMobileMenu();
+
+    // Initialize all event listeners
+    initializeTabs();
+    initializeGallery();
+    initializeBookingForm();
+    initializeModals();
+    initializeFavorites();
+
+    console.log('✨ All features initialized successfully!');
+});
+
+// ===== THEME INITIALIZATION =====
+function initializeTheme() {
+    const savedTheme = localStorage.getItem('boardify_theme');
+    const body = document.body;
+    const themeIcon = document.getElementById('themeIcon');
+
+    if (savedTheme === 'dark') {
+        body.classList.add('dark-theme');
+        if (themeIcon) themeIcon.className = 'bi bi-moon-fill';
+    } else {
+        if (themeIcon) themeIcon.className = 'bi bi-sun-fill';
+    }
+}
+
+// ===== TAB FUNCTIONALITY =====
+function initializeTabs() {
+    const tabButtons = document.querySelectorAll('.custom-tab-btn');
+    const tabPanels = document.querySelectorAll('.tab-panel');
+
+    console.log(`📑 Found ${tabButtons.length} tab buttons and ${tabPanels.length} tab panels`);
+
+    tabButtons.forEach(button => {
+        button.addEventListener('click', function() {
+            const targetTab = this.getAttribute('data-tab');
+
+            // Remove active class from all buttons and panels
+            tabButtons.forEach(btn => btn.classList.remove('active'));
+            tabPanels.forEach(panel => panel.classList.remove('active'));
+
+            // Add active class to clicked button
+            this.classList.add('active');
+
+            // Show corresponding panel
+            const targetPanel = document.getElementById(targetTab + '-tab');
+            if (targetPanel) {
+                targetPanel.classList.add('active');
+                console.log(`✅ Switched to ${targetTab} tab`);
+            }
+        });
+    });
+}
+
+// ===== MOBILE FEATURES INITIALIZATION =====
+function initializeMobileFeatures() {
+    // Detect mobile device
+    const isMobile = window.innerWidth <= 992 || 
+                    /Android|webOS|iPhone|iPad|iPod|BlackBerry|IEMobile|Opera Mini/i.test(navigator.userAgent);
+
+    if (isMobile) {
+        // Add mobile class to body for CSS targeting
+        document.body.classList.add('mobile-device');
+
+        // Improve touch scrolling
+        document.documentElement.style.scrollBehavior = 'smooth';
+
+        // Prevent zoom on double tap (for iOS)
+        let lastTouchEnd = 0;
+        document.addEventListener('touchend', function (event) {
+            const now = (new Date()).getTime();
+            if (now - lastTouchEnd <= 300) {
+                event.preventDefault();
+            }
+            lastTouchEnd = now;
+        }, false);
+
+        // Fix for iOS viewport height
+        function setVH() {
+            let vh = window.innerHeight * 0.01;
+            document.documentElement.style.setProperty('--vh', `${vh}px`);
+        }
+
+        setVH();
+        window.addEventListener('resize', setVH);
+        window.addEventListener('orientationchange', setVH);
+
+        // Improve touch interactions
+        const touchElements = document.querySelectorAll('button, a, .thumbnail-box, .custom-tab-btn');
+        touchElements.forEach(el => {
+            el.style.webkitTapHighlightColor = 'transparent';
+        });
+    }
+
+    // Handle orientation changes
+    window.addEventListener('orientationchange', function() {
+        setTimeout(() => {
+            window.scrollTo(0, 0);
+        }, 100);
+    });
+}
+
+// ===== MOBILE MENU FUNCTIONALITY =====
+function initializeMobileMenu() {
+    const mobileMenuToggle = document.getElementById('mobileMenuToggle');
+    const sidebar = document.querySelector('.sidebar');
+    const mobileOverlay = document.getElementById('mobileOverlay');
+
+    if (mobileMenuToggle && sidebar && mobileOverlay) {
+        mobileMenuToggle.addEventListener('click', function() {
+            sidebar.classList.toggle('mobile-open');
+            mobileOverlay.classList.toggle('active');
+            document.body.style.overflow = sidebar.classList.contains('mobile-open') ? 'hidden' : '';
+        });
+
+        mobileOverlay.addEventListener('click', function() {
+            sidebar.classList.remove('mobile-open');
+            mobileOverlay.classList.remove('active');
+            document.body.style.overflow = '';
+        });
+
+        // Close menu when clicking on nav links
+        const navLinks = sidebar.querySelectorAll('.nav-link');
+        navLinks.forEach(link => {
+            link.addEventListener('click', function() {
+                sidebar.classList.remove('mobile-open');
+                mobileOverlay.classList.remove('active');
+                document.body.style.overflow = '';
+            });
+        });
+    } else {
+        console.log('❌ Mobile menu elements not found');
+    }
+}
+
+// ===== SIMPLE GALLERY FUNCTIONALITY =====
+function initializeGallery() {
+    const mainImages = document.querySelectorAll('.gallery-main-image');
+    const thumbnails = document.querySelectorAll('.thumbnail-box');
+    const prevBtn = document.querySelector('.prev-arrow');
+    const nextBtn = document.querySelector('.next-arrow');
+
+    if (mainImages.length === 0) {
+        console.log('❌ No gallery images found');
+        return;
+    }
+
+    let currentIndex = 0;
+
+    function showImage(index) {
+        // Hide all images
+        mainImages.forEach(img => {
+            img.classList.remove('active');
+            img.style.opacity = '0';
+        });
+
+        // Show selected image
+        mainImages[index].classList.add('active');
+        setTimeout(() => {
+            mainImages[index].style.opacity = '1';
+        }, 10);
+
+        // Update thumbnails
+        thumbnails.forEach((thumb, i) => {
+            thumb.classList.toggle('active', i === index);
+        });
+
+        // Update counter
+        const currentNum = document.querySelector('.current-image-num');
+        if (currentNum) {
+            currentNum.textContent = index + 1;
+        }
+
+        currentIndex = index;
+    }
+
+    // Thumbnail click events
+    thumbnails.forEach((thumb, index) => {
+        thumb.addEventListener('click', () => showImage(index));
+    });
+
+    // Navigation arrows
+    if (prevBtn) {
+        prevBtn.addEventListener('click', () => {
+            let newIndex = currentIndex - 1;
+            if (newIndex < 0) newIndex = mainImages.length - 1;
+            showImage(newIndex);
+        });
+    }
+
+    if (nextBtn) {
+        nextBtn.addEventListener('click', () => {
+            let newIndex = currentIndex + 1;
+            if (newIndex >= mainImages.length) newIndex = 0;
+            showImage(newIndex);
+        });
+    }
+
+    // Fullscreen button
+    const fullscreenBtn = document.querySelector('.fullscreen-btn');
+    if (fullscreenBtn) {
+        fullscreenBtn.addEventListener('click', () => {
+            const modalElement = document.getElementById('fullscreenGalleryModal');
+            if (modalElement) {
+                const modal = new bootstrap.Modal(modalElement);
+                modal.show();
+            }
+        });
+    }
+
+    // Initialize first image
+    showImage(0);
+}
+
+// ===== BOOKING FORM FUNCTIONALITY =====
+function initializeBookingForm() {
+    const startDateInput = document.getElementById('start_date');
+    const endDateInput = document.getElementById('end_date');
+    const totalPriceDisplay = document.getElementById('calculatedTotal');
+    const bookNowBtn = document.querySelector('[data-action="confirm-booking"]');
+
+    if (!startDateInput || !endDateInput || !bookNowBtn) {
+        console.log('❌ Booking form elements not found');
+        return;
+    }
+
+    // Get monthly price
+    const priceElement = document.querySelector('.price-amount');
+    let monthlyPrice = 0;
+    if (priceElement) {
+        const priceText = priceElement.textContent.replace(/[₱,]/g, '');
+        monthlyPrice = parseFloat(priceText) || 0;
+    }
+
+    const dailyRate = monthlyPrice / 30;
+
+    // Set minimum date to today
+    const today = new Date().toISOString().split('T')[0];
+    startDateInput.min = today;
+    endDateInput.min = today;
+
+    // Update end date min when start date changes
+    startDateInput.addEventListener('change', function() {
+        if (this.value) {
+            const nextDay = new Date(this.value);
+            nextDay.setDate(nextDay.getDate() + 1);
+            endDateInput.min = nextDay.toISOString().split('T')[0];
+
+            // If end date is before new min, clear it
+            if (endDateInput.value && new Date(endDateInput.value) < nextDay) {
+                endDateInput.value = '';
+            }
+        }
+        calculateTotal();
+    });
+
+    endDateInput.addEventListener('change', calculateTotal);
+
+    // Book Now button
+    bookNowBtn.addEventListener('click', function(e) {
+        e.preventDefault();
+
+        // Basic validation
+        if (!startDateInput.value || !endDateInput.value) {
+            showToast('Please select both check-in and check-out dates.', 'danger');
+            return;
+        }
+
+        const startDate = new Date(startDateInput.value);
+        const endDate = new Date(endDateInput.value);
+
+        if (endDate <= startDate) {
+            showToast('Check-out date must be after check-in date.', 'danger');
+            return;
+        }
+
+        confirmBooking();
+    });
+
+    function calculateTotal() {
+        const startDate = startDateInput.value;
+        const endDate = endDateInput.value;
+
+        if (!startDate || !endDate) {
+            if (totalPriceDisplay) totalPriceDisplay.textContent = '₱0';
+            return;
+        }
+
+        const start = new Date(startDate);
+        const end = new Date(endDate);
+
+        if (end <= start) {
+            if (totalPriceDisplay) totalPriceDisplay.textContent = '₱0';
+            return;
+        }
+
+        const diffTime = Math.abs(end - start);
+        const diffDays = Math.ceil(diffTime / (1000 * 60 * 60 * 24));
+        const total = diffDays * dailyRate;
+
+        if (totalPriceDisplay) {
+            totalPriceDisplay.textContent = '₱' + total.toLocaleString('en-PH', {
+                minimumFractionDigits: 2,
+                maximumFractionDigits: 2
+            });
+        }
+    }
+
+    function confirmBooking() {
+        const startDate = new Date(startDateInput.value);
+        const endDate = new Date(endDateInput.value);
+        const totalPrice = totalPriceDisplay ? totalPriceDisplay.textContent : '₱0';
+
+        // Format dates for display
+        const startFormatted = startDate.toLocaleDateString('en-US', { 
+            year: 'numeric', 
+            month: 'long', 
+            day: 'numeric' 
+        });
+
+        const endFormatted = endDate.toLocaleDateString('en-US', { 
+            year: 'numeric', 
+            month: 'long', 
+            day: 'numeric' 
+        });
+
+        // Update confirmation modal
+        const confirmCheckin = document.getElementById('confirmCheckin');
+        const confirmCheckout = document.getElementById('confirmCheckout');
+        const confirmTotal = document.getElementById('confirmTotal');
+
+        if (confirmCheckin) confirmCheckin.textContent = startFormatted;
+        if (confirmCheckout) confirmCheckout.textContent = endFormatted;
+        if (confirmTotal) confirmTotal.textContent = totalPrice;
+
+        // Show confirmation modal
+        const modalElement = document.getElementById('bookingConfirmModal');
+        if (modalElement) {
+            const confirmModal = new bootstrap.Modal(modalElement);
+            confirmModal.show();
+        }
+    }
+
+    // Initialize calculation
+    calculateTotal();
+}
+
+// ===== MODAL INITIALIZATION =====
+function initializeModals() {
+    // Review modal
+    const writeReviewBtn = document.querySelector('[data-action="open-review-modal"]');
+    if (writeReviewBtn) {
+        writeReviewBtn.addEventListener('click', function() {
+            const modalElement = document.getElementById('reviewSubmitModal');
+            if (modalElement) {
+                const modal = new bootstrap.Modal(modalElement);
+                modal.show();
+            }
+        });
+    }
+
+    // Booking confirmation submit
+    const confirmBookingBtn = document.querySelector('[data-action="submit-booking"]');
+    if (confirmBookingBtn) {
+        confirmBookingBtn.addEventListener('click', function() {
+            // Submit the actual form
+            const bookingForm = document.getElementById('bookingForm');
+            if (bookingForm) {
+                bookingForm.submit();
+            }
+        });
+    }
+}
+
+// ===== FAVORITES FUNCTIONALITY =====
+function initializeFavorites() {
+    const savePropertyBtn = document.querySelector('.save-property-btn');
+    if (savePropertyBtn) {
+        savePropertyBtn.addEventListener('click', function() {
+            const icon = this.querySelector('i');
+
+            if (icon.classList.contains('bi-heart')) {
+                icon.classList.remove('bi-heart');
+                icon.classList.add('bi-heart-fill');
+                this.style.background = 'var(--fb-primary)';
+                this.style.color = 'white';
+                showToast('Added to favorites!', 'success');
+            } else {
+                icon.classList.remove('bi-heart-fill');
+                icon.classList.add('bi-heart');
+                this.style.background = 'transparent';
+                this.style.color = 'var(--fb-primary)';
+                showToast('Removed from favorites', 'info');
+            }
+        });
+    }
+}
+
+// ===== TOAST NOTIFICATION =====
+function showToast(message, type = 'info') {
+    // Remove existing toasts
+    const existingToasts = document.querySelectorAll('.custom-toast');
+    existingToasts.forEach(toast => toast.remove());
+
+    const toast = document.createElement('div');
+    toast.className = `custom-toast toast-${type}`;
+
+    const icons = {
+        success: 'check-circle-fill',
+        danger: 'x-circle-fill',
+        warning: 'exclamation-circle-fill',
+        info: 'info-circle-fill'
+    };
+
+    toast.innerHTML = `
+        <i class="bi bi-${icons[type] || 'info-circle-fill'} me-2"></i>
+        <span>${message}</span>
+    `;
+
+    Object.assign(toast.style, {
+        position: 'fixed',
+        top: '20px',
+        right: '20px',
+        background: type === 'success' ? 'var(--success)' : 
+                   type === 'danger' ? 'var(--danger)' : 
+                   type === 'warning' ? 'var(--warning)' : 'var(--fb-primary)',
+        color: 'white',
+        padding: '1rem 1.5rem',
+        borderRadius: '12px',
+        boxShadow: '0 4px 12px rgba(0, 0, 0, 0.15)',
+        zIndex: '9999',
+        display: 'flex',
+        alignItems: 'center',
+        fontWeight: '600',
+        fontSize: '0.95rem',
+        animation: 'slideInRight 0.3s ease-out'
+    });
+
+    document.body.appendChild(toast);
+
+    setTimeout(() => {
+        toast.style.animation = 'slideOutRight 0.3s ease-out';
+        setTimeout(() => {
+            if (toast.parentNode) {
+                toast.parentNode.removeChild(toast);
+            }
+        }, 300);
+    }, 3000);
+}
+
+// ===== UTILITY FUNCTIONS =====
+function initializeUtilityFunctions() {
+    // Add toast animations
+    if (!document.querySelector('#toast-animations')) {
+        const style = document.createElement('style');
+        style.id = 'toast-animations';
+        style.textContent = `
+            @keyframes slideInRight {
+                from {
+                    transform: translateX(100%);
+                    opacity: 0;
+                }
+                to {
+                    transform: translateX(0);
+                    opacity: 1;
+                }
+            }
+
+            @keyframes slideOutRight {
+                from {
+                    transform: translateX(0);
+                    opacity: 1;
+                }
+                to {
+                    transform: translateX(100%);
+                    opacity: 0;
+                }
+            }
+        `;
+        document.head.appendChild(style);
+    }
+
+    // ===== LAZY LOADING FOR IMAGES =====
+    window.addEventListener('load', function() {
+        const images = document.querySelectorAll('img');
+
+        const imageObserver = new IntersectionObserver((entries, observer) => {
+            entries.forEach(entry => {
+                if (entry.isIntersecting) {
+                    const img = entry.target;
+                    img.style.opacity = '0';
+                    img.style.transition = 'opacity 0.5s ease';
+
+                    // If image is already loaded, show it immediately
+                    if (img.complete) {
+                        img.style.opacity = '1';
+                    } else {
+                        img.onload = function() {
+                            img.style.opacity = '1';
+                        };
+                    }
+
+                    observer.unobserve(img);
+                }
+            });
+        });
+
+        images.forEach(img => {
+            if (img.complete) {
+                img.style.opacity = '1';
+            } else {
+                imageObserver.observe(img);
+            }
+        });
+    });
+
+    // ===== SMOOTH SCROLL TO TOP ON PAGE LOAD =====
+    window.addEventListener('load', function() {
+        window.scrollTo({ top: 0, behavior: 'smooth' });
+    });
+
+    // ===== FORM VALIDATION =====
+    const bookingForm = document.getElementById('bookingForm');
+
+    if (bookingForm) {
+        const inputs = bookingForm.querySelectorAll('input[required]');
+
+        inputs.forEach(input => {
+            input.addEventListener('invalid', function(e) {
+                e.preventDefault();
+                this.classList.add('error');
+
+                if (!this.nextElementSibling || !this.nextElementSibling.classList.contains('error-message')) {
+                    const errorMsg = document.createElement('small');
+                    errorMsg.className = 'error-message';
+                    errorMsg.style.color = 'var(--danger)';
+                    errorMsg.style.display = 'block';
+                    errorMsg.style.marginTop = '0.5rem';
+                    errorMsg.style.fontWeight = '600';
+                    errorMsg.textContent = 'This field is required';
+                    this.parentNode.appendChild(errorMsg);
+                }
+            });
+
+            input.addEventListener('input', function() {
+                this.classList.remove('error');
+                const errorMsg = this.parentNode.querySelector('.error-message');
+                if (errorMsg) {
+                    errorMsg.remove();
+                }
+            });
+        });
+    }
+}
+
+// Initialize utility functions when DOM loads
+document.addEventListener('DOMContentLoaded', function() {
+    initializeUtilityFunctions();
+});
+
+// ===== CONSOLE LOG FOR DEBUGGING =====
+console.log('🏠 Boardify Property Detail Page Loaded - Facebook Blue Theme');
+console.log('✨ All features initialized successfully!');
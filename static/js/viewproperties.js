@@ -0,0 +1,521 @@
+    // Property deletion functionality
+function deleteProperty(propertyId) {
+    if (!confirm('Are you sure you want to delete this property? This action cannot be undone.')) {
+        return;
+    }
+
+    fetch(`/delete-property/${propertyId}`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'X-Requested-With': 'XMLHttpRequest'
+        },
+        credentials: 'same-origin'
+    })
+    .then(response => response.json())
+    .then(data => handleDeleteResponse(data, propertyId))
+    .catch(error => {
+        console.error('Error deleting property:', error);
+        showToast('Error deleting property. Please try again.', 'danger');
+    });
+}
+
+function handleDeleteResponse(response, propertyId) {
+    if (response.success === false) {
+        if (response.message.includes('not found') || response.message.includes('already deleted')) {
+            // Property already deleted - remove it from the UI
+            showToast('Property was already deleted', 'info');
+            // Remove the property card from DOM
+            const propertyCard = document.querySelector(`[data-property-id="${propertyId}"]`);
+            if (propertyCard) {
+                propertyCard.remove();
+                updatePropertyCount(); // Update count after removal
+            }
+        } else {
+            showToast(response.message, 'danger');
+        }
+    } else {
+        showToast('Property deleted successfully!', 'success');
+        // Remove the property card from DOM
+        const propertyCard = document.querySelector(`[data-property-id="${propertyId}"]`);
+        if (propertyCard) {
+            propertyCard.remove();
+        }
+        // Update property count
+        updatePropertyCount(response.new_count);
+    }
+}
+
+function updatePropertyCount(newCount = null) {
+    const countElement = document.getElementById('propertyCount');
+    const totalCountElement = document.getElementById('totalPropertiesCount');
+    const emptyState = document.querySelector('.empty-state');
+    const propertiesGrid = document.querySelector('.properties-grid');
+
+    if (countElement) {
+        if (newCount !== null) {
+            countElement.textContent = `${newCount} properties found`;
+        } else {
+            // Recalculate count from remaining properties
+            const remainingProperties = document.querySelectorAll('.property-card[data-property-id]').length;
+            countElement.textContent = `${remainingProperties} properties found`;
+        }
+    }
+
+    if (totalCountElement) {
+        const currentCount = newCount !== null ? newCount : document.querySelectorAll('.property-card[data-property-id]').length;
+        totalCountElement.textContent = currentCount;
+    }
+
+    // Show/hide empty state
+    const currentCount = newCount !== null ? newCount : document.querySelectorAll('.property-card[data-property-id]').length;
+
+    if (emptyState && propertiesGrid) {
+        if (currentCount === 0) {
+            emptyState.style.display = 'block';
+            propertiesGrid.style.display = 'none';
+        } else {
+            emptyState.style.display = 'none';
+            propertiesGrid.style.display = 'grid';
+        }
+    }
+}
+
+// Toast notification function
+function showToast(message, type = 'info') {
+    // Remove existing toasts
+    const existingToasts = document.querySelectorAll('.custom-toast');
+    existingToasts.forEach(toast => toast.remove());
+
+    const toast = document.createElement('div');
+    toast.className = `custom-toast toast-${type}`;
+
+    const icons = {
+        success: 'check-circle-fill',
+        danger: 'x-circle-fill',
+        warning: 'exclamation-circle-fill',
+        info: 'info-circle-fill'
+    };
+
+    toast.innerHTML = `<i class="bi bi-${icons[type] || 'info-circle-fill'} me-2"></i><span></span>`;
+    toast.querySelector('span').textContent = message;
+
+    Object.assign(toast.style, {
+        position: 'fixed',
+        top: '20px',
+        right: '20px',
+        background: type === 'success' ? '#28a745' : 
+                   type === 'danger' ? '#dc3545' : 
+                   type === 'warning' ? '#ffc107' : '#007bff',
+        color: 'white',
+        padding: '1rem 1.5rem',
+        borderRadius: '8px',
+        boxShadow: '0 4px 12px rgba(0, 0, 0, 0.15)',
+        zIndex: '9999',
+        display: 'flex',
+        alignItems: 'center',
+        fontWeight: '600',
+        fontSize: '0.95rem'
+    });
+
+    document.body.appendChild(toast);
+
+    setTimeout(() => {
+        toast.remove();
+    }, 4000);
+}
+    document.addEventListener('DOMContentLoaded', function() {
+        // Multi-Faceted Filter System
+        class MultiFacetFilter {
+            constructor() {
+                this.activeFilters = new Map();
+                this.form = document.getElementById('listingFilters');
+                this.searchInput = document.getElementById('searchInput');
+                this.sortSelect = document.getElementById('sortSelect');
+                this.clearSearchBtn = document.getElementById('clearSearchBtn');
+                this.clearAllFiltersBtn = document.getElementById('clearAllFilters');
+                this.activeFiltersDisplay = document.getElementById('activeFiltersDisplay');
+                this.activeFiltersList = document.getElementById('activeFiltersList');
+
+                this.init();
+            }
+
+            init() {
+                this.bindEvents();
+                this.restoreActiveFilters();
+                this.initializeCollapsibleCategories();
+            }
+
+            restoreActiveFilters() {
+                // Filters are applied server-side; rebuild the tags from the checked boxes
+                document.querySelectorAll('.filter-checkbox:checked').forEach(checkbox => {
+                    this.addFilter(checkbox.dataset.filterType, checkbox.dataset.filterValue);
+                });
+            }
+
+            submitFilters() {
+                this.form.submit();
+            }
+
+
+
+
+            initializeCollapsibleCategories() {
+                // Collapse all categories by default on mobile
+                const isMobile = window.innerWidth <= 768;
+
+                document.querySelectorAll('.filter-category-header').forEach(header => {
+                    header.addEventListener('click', (e) => {
+                        e.preventDefault();
+                        header.classList.toggle('expanded');
+                        header.classList.toggle('collapsed');
+                    });
+
+                    // Set initial state
+                    if (isMobile) {
+                        header.classList.add('collapsed');
+                    } else {
+                        header.classList.add('expanded');
+                    }
+                });
+            }
+
+            bindEvents() {
+                // Filter checkbox events
+                document.querySelectorAll('.filter-checkbox').forEach(checkbox => {
+                    checkbox.addEventListener('change', (e) => this.handleFilterChange(e));
+                });
+
+                // Search input events
+                this.searchInput.addEventListener('input', (e) => this.handleSearch(e));
+                this.clearSearchBtn.addEventListener('click', () => this.clearSearch());
+
+                // Sort events
+                this.sortSelect.addEventListener('change', (e) => this.handleSort(e));
+
+                // Clear all filters
+                this.clearAllFiltersBtn.addEventListener('click', () => this.clearAllFilters());
+
+                // Filter toggle for mobile
+                const filterToggleBtn = document.getElementById('filterToggleBtn');
+                const filterCategories = document.getElementById('filterCategories');
+
+                if (filterToggleBtn) {
+                    filterToggleBtn.addEventListener('click', () => {
+                        if (filterCategories.style.display === 'none') {
+                            filterCategories.style.display = 'flex';
+                            filterToggleBtn.classList.add('active');
+                        } else {
+                            filterCategories.style.display = 'none';
+                            filterToggleBtn.classList.remove('active');
+                        }
+                    });
+
+                    // Start with filters visible on desktop, hidden on mobile
+                    if (window.innerWidth <= 768) {
+                        filterCategories.style.display = 'none';
+                    }
+                }
+
+                // Handle window resize
+                window.addEventListener('resize', () => {
+                    const filterCategories = document.getElementById('filterCategories');
+                    if (window.innerWidth > 768 && filterCategories) {
+                        filterCategories.style.display = 'flex';
+                    }
+                });
+            }
+
+            handleFilterChange(event) {
+                const checkbox = event.target;
+                const filterType = checkbox.dataset.filterType;
+                const filterValue = checkbox.dataset.filterValue;
+                const isChecked = checkbox.checked;
+
+                if (isChecked) {
+                    this.addFilter(filterType, filterValue);
+                } else {
+                    this.removeFilter(filterType, filterValue);
+                }
+
+                this.submitFilters();
+            }
+
+            addFilter(type, value) {
+                if (!this.activeFilters.has(type)) {
+                    this.activeFilters.set(type, new Set());
+                }
+                this.activeFilters.get(type).add(value);
+                this.updateActiveFiltersDisplay();
+            }
+
+            removeFilter(type, value) {
+                if (this.activeFilters.has(type)) {
+                    this.activeFilters.get(type).delete(value);
+                    if (this.activeFilters.get(type).size === 0) {
+                        this.activeFilters.delete(type);
+                    }
+                }
+                this.updateActiveFiltersDisplay();
+            }
+
+            updateActiveFiltersDisplay() {
+                // Clear current display
+                this.activeFiltersList.innerHTML = '';
+
+                if (this.activeFilters.size === 0) {
+                    this.activeFiltersDisplay.style.display = 'none';
+                    return;
+                }
+
+                this.activeFiltersDisplay.style.display = 'block';
+
+                // Add active filter tags
+                for (const [type, values] of this.activeFilters) {
+                    for (const value of values) {
+                        const filterTag = this.createFilterTag(type, value);
+                        this.activeFiltersList.appendChild(filterTag);
+                    }
+                }
+            }
+
+            createFilterTag(type, value) {
+                const tag = document.createElement('div');
+                tag.className = 'active-filter-tag';
+
+                // Values come from landlord-entered listing fields: text nodes only, never HTML
+                const removeIcon = document.createElement('i');
+                removeIcon.className = 'bi bi-x';
+                removeIcon.dataset.filterType = type;
+                removeIcon.dataset.filterValue = value;
+                tag.append(this.getFilterDisplayText(type, value), ' ', removeIcon);
+
+                // Add remove event
+                removeIcon.addEventListener('click', (e) => {
+                    e.stopPropagation();
+                    this.removeFilter(type, value);
+                    this.uncheckCorrespondingCheckbox(type, value);
+                    this.submitFilters();
+                });
+
+                return tag;
+            }
+
+            getFilterDisplayText(type, value) {
+                const displayTexts = {
+                    status: {
+                        available: 'Available Now',
+                        full: 'Fully Booked'
+                    },
+                    price: {
+                        budget: 'Budget (₱0-₱3,000)',
+                        'mid-range': 'Mid-Range (₱3,001-₱6,000)',
+                        premium: 'Premium (₱6,001+)'
+                    },
+                    gender: {
+                        female: 'Girls Only',
+                        male: 'Boys Only',
+                        both: 'Mixed/Gender Neutral'
+                    },
+                    amenity: {
+                        wifi: 'Free WiFi',
+                        ac: 'Air Conditioning',
+                        furnished: 'Fully Furnished'
+                    },
+                    rating: {
+                        high: '4.5+ Stars',
+                        good: '4.0+ Stars'
+                    }
+                };
+
+                return displayTexts[type]?.[value] || value;
+            }
+
+            uncheckCorrespondingCheckbox(type, value) {
+                const checkbox = document.querySelector(
+                    `.filter-checkbox[data-filter-type="${CSS.escape(type)}"][data-filter-value="${CSS.escape(value)}"]`
+                );
+                if (checkbox) {
+                    checkbox.checked = false;
+                }
+            }
+
+            handleSearch(event) {
+                const searchTerm = event.target.value.trim();
+                this.clearSearchBtn.style.display = searchTerm ? 'flex' : 'none';
+            }
+
+            clearSearch() {
+                this.searchInput.value = '';
+                this.clearSearchBtn.style.display = 'none';
+                this.submitFilters();
+            }
+
+            handleSort(event) {
+                this.submitFilters();
+            }
+
+            clearAllFilters() {
+                window.location.href = this.form.getAttribute('action');
+            }
+        }
+
+        // Initialize the multi-facet filter system
+        const filterSystem = new MultiFacetFilter();
+
+        // View Toggle Functionality
+        const viewButtons = document.querySelectorAll('.view-btn');
+        const propertiesContainer = document.getElementById('propertiesContainer');
+
+        viewButtons.forEach(button => {
+            button.addEventListener('click', () => {
+                const view = button.dataset.view;
+
+                // Update active button
+                viewButtons.forEach(btn => btn.classList.remove('active'));
+                button.classList.add('active');
+
+                // Update view
+                propertiesContainer.className = 'properties-grid';
+                if (view === 'list') {
+                    propertiesContainer.classList.add('list-view');
+                }
+            });
+        });
+
+        // Back to Top Functionality
+        const backToTopBtn = document.getElementById('backToTop');
+
+        window.addEventListener('scroll', () => {
+            if (window.pageYOffset > 300) {
+                backToTopBtn.classList.add('visible');
+            } else {
+                backToTopBtn.classList.remove('visible');
+            }
+        });
+
+        backToTopBtn.addEventListener('click', () => {
+            window.scrollTo({
+                top: 0,
+                behavior: 'smooth'
+            });
+        });
+
+        // Delete Property Functionality
+const deleteModal = document.getElementById('deleteModal');
+const cancelDeleteBtn = document.getElementById('cancelDelete');
+const confirmDeleteBtn = document.getElementById('confirmDelete');
+const deletePropertyName = document.getElementById('deletePropertyName');
+
+let currentDeleteProperty = null;
+
+document.querySelectorAll('.delete-icon').forEach(button => {
+    button.addEventListener('click', (e) => {
+        e.preventDefault();
+        currentDeleteProperty = {
+            id: button.dataset.propertyId,
+            title: button.dataset.propertyTitle
+        };
+
+        deletePropertyName.textContent = currentDeleteProperty.title;
+        deleteModal.classList.add('active');
+        confirmDeleteBtn.disabled = true;
+
+        // Enable delete button after 2 seconds (safety measure)
+        setTimeout(() => {
+            confirmDeleteBtn.disabled = false;
+        }, 2000);
+    });
+});
+
+cancelDeleteBtn.addEventListener('click', () => {
+    deleteModal.classList.remove('active');
+    currentDeleteProperty = null;
+});
+
+confirmDeleteBtn.addEventListener('click', () => {
+    if (currentDeleteProperty && !confirmDeleteBtn.disabled) {
+        // Find and animate the property card
+        const propertyCard = document.querySelector(`[data-property-id="${currentDeleteProperty.id}"]`);
+        if (propertyCard) {
+            propertyCard.classList.add('deleting');
+
+            // Show loading state on button
+            confirmDeleteBtn.disabled = true;
+            confirmDeleteBtn.innerHTML = '<i class="bi bi-hourglass-split me-2"></i>Deleting...';
+
+            // Call the actual delete function
+            deleteProperty(currentDeleteProperty.id);
+
+            // Close modal after a short delay
+            setTimeout(() => {
+                deleteModal.classList.remove('active');
+                // Reset button state
+                confirmDeleteBtn.disabled = false;
+                confirmDeleteBtn.innerHTML = '<i class="bi bi-trash-fill me-2"></i>Delete Property';
+                currentDeleteProperty = null;
+            }, 1000);
+        }
+    }
+});
+
+// Initialize delete buttons when page loads
+document.addEventListener('DOMContentLoaded', function() {
+    // Your existing code...
+
+    // Add event listeners to all delete buttons
+    const deleteButtons = document.querySelectorAll('.delete-icon');
+    deleteButtons.forEach(button => {
+        button.addEventListener('click', function(e) {
+            e.preventDefault();
+            const propertyId = this.dataset.propertyId;
+            const propertyTitle = this.dataset.propertyTitle;
+
+            // Show confirmation modal
+            currentDeleteProperty = {
+                id: propertyId,
+                title: propertyTitle
+            };
+
+            deletePropertyName.textContent = currentDeleteProperty.title;
+            deleteModal.classList.add('active');
+            confirmDeleteBtn.disabled = true;
+
+            // Enable delete button after 2 seconds (safety measure)
+            setTimeout(() => {
+                confirmDeleteBtn.disabled = false;
+            }, 2000);
+        });
+    });
+});
+
+// Close modal when clicking outside
+deleteModal.addEventListener('click', (e) => {
+    if (e.target === deleteModal) {
+        deleteModal.classList.remove('active');
+        currentDeleteProperty = null;
+    }
+});
+
+        // Initialize progress bars
+        document.querySelectorAll('.slots-progress-bar').forEach(bar => {
+            const width = bar.dataset.width;
+            bar.style.width = `${width}%`;
+        });
+
+        // Close modal when clicking outside
+        deleteModal.addEventListener('click', (e) => {
+            if (e.target === deleteModal) {
+                deleteModal.classList.remove('active');
+                currentDeleteProperty = null;
+            }
+        });
+
+        // Favorite functionality (if user is tenant)
+        document.querySelectorAll('.favorite-btn').forEach(btn => {
+            btn.addEventListener('click', (e) => {
+                e.preventDefault();
+                btn.classList.toggle('active');
+            });
+        });
+    });
@@ -0,0 +1,227 @@
+"""Dashboard statistics computed with grouped aggregate queries.
+
+The admin dashboard used to issue a COUNT per figure and load every paid
+and unpaid Billing row to add up commissions in Python. admin_stats()
+gets the same figures from one GROUP BY per table; no Billing row is
+loaded.
+
+Admin pages go further and read the platform_stat snapshot (see
+PlatformStat in models.py) through snapshot_admin_stats(): mapper events
+keep its running totals current, and a full rebuild repairs drift whenever
+the last one is older than the staleness bound (STATS_MAX_STALENESS) or
+when `flask rebuild-platform-stats` runs from cron. Requests never rebuild
+the snapshot themselves: a stale one is served as it is (with its
+stats_as_of) while a background thread rebuilds it.
+"""
+import threading
+import time
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import case
+
+from models import db, User, Property, Booking, Billing, HelpSupport, PlatformStat, rebuild_platform_stats
+
+
+# Commission the platform expects on a bill that is still unpaid
+PENDING_COMMISSION_RATE = 0.05
+
+# Held while this process rebuilds the snapshot in the background
+_rebuild_lock = threading.Lock()
+
+
+def _grouped(column, *aggregates):
+    """{group value: row} for SELECT column, aggregates ... GROUP BY column"""
+    query = db.session.query(column, *aggregates).group_by(column)
+    return {row[0]: row for row in query}
+
+
+def user_counts():
+    """(users by role, landlords awaiting approval)"""
+    rows = _grouped(
+        User.role,
+        db.func.count(User.id),
+        db.func.sum(case((User.is_approved_by_admin.is_(False), 1), else_=0)),
+    )
+    by_role = {role: row[1] for role, row in rows.items()}
+    pending = rows['landlord'][2] if 'landlord' in rows else 0
+    return by_role, int(pending or 0)
+
+
+def booking_counts():
+    """Bookings by status"""
+    return {status: row[1] for status, row in _grouped(Booking.status, db.func.count(Booking.id)).items()}
+
+
+def billing_totals():
+    """Per bill status: count, sum of admin_commission and sum of amount"""
+    rows = _grouped(
+        Billing.status,
+        db.func.count(Billing.id),
+        db.func.coalesce(db.func.sum(Billing.admin_commission), 0),
+        db.func.coalesce(db.func.sum(Billing.amount), 0),
+    )
+    return {
+        status: {'count': row[1], 'commission': float(row[2]), 'amount': float(row[3])}
+        for status, row in rows.items()
+    }
+
+
+def commission_totals(bills=None):
+    """(commission earned on paid bills, commission expected on unpaid bills)"""
+    bills = billing_totals() if bills is None else bills
+    paid = bills.get('paid', {}).get('commission', 0.0)
+    pending = bills.get('unpaid', {}).get('amount', 0.0) * PENDING_COMMISSION_RATE
+    return paid, pending
+
+
+def admin_stats():
+    """Every count and total shown on the admin dashboard"""
+    by_role, pending_verifications = user_counts()
+    bookings = booking_counts()
+    bills = billing_totals()
+    total_commission, pending_commission = commission_totals(bills)
+
+    # Single-row counts share one round trip
+    total_properties, pending_tickets = db.session.query(
+        db.select(db.func.count(Property.id)).scalar_subquery(),
+        db.select(db.func.count(HelpSupport.id)).where(HelpSupport.status == 'pending').scalar_subquery(),
+    ).one()
+
+    return {
+        'total_users': sum(by_role.values()),
+        'total_landlords': by_role.get('landlord', 0),
+        'total_tenants': by_role.get('tenant', 0),
+        'total_properties': total_properties,
+        'pending_verifications': pending_verifications,
+        'pending_tickets': pending_tickets,
+        'total_bookings': sum(bookings.values()),
+        'approved_bookings': bookings.get('approved', 0),
+        'pending_bookings_count': bookings.get('pending', 0),
+        'total_bills': sum(bill['count'] for bill in bills.values()),
+        'paid_bills': bills.get('paid', {}).get('count', 0),
+        'unpaid_bills': bills.get('unpaid', {}).get('count', 0),
+        'total_commission': total_commission,
+        'pending_commission': pending_commission,
+    }
+
+
+def _snapshot_rows():
+    """({(metric, status): PlatformStat} of the running totals, last rebuild time)"""
+    rows = {
+        (row.metric, row.status): row
+        for row in PlatformStat.query.filter_by(period='all', period_start=PlatformStat.ALL_TIME)
+    }
+    marker = rows.pop(PlatformStat.REBUILD_MARKER, None)
+    return rows, marker.updated_at if marker else None
+
+
+def rebuild_in_background(app):
+    """Rebuild the snapshot on a worker thread unless one is already running"""
+    if not _rebuild_lock.acquire(blocking=False):
+        return
+
+    def run():
+        try:
+            with app.app_context():
+                try:
+                    rebuild_platform_stats()
+                except Exception as e:
+                    # Another worker may be rebuilding; the current rows are still usable
+                    db.session.rollback()
+                    print(f"⚠️ [STATS] Snapshot rebuild failed: {e}")
+        finally:
+            _rebuild_lock.release()
+
+    threading.Thread(target=run, name='stats-rebuild', daemon=True).start()
+
+
+def snapshot_admin_stats(max_age=None):
+    """admin_stats() figures read from the platform_stat snapshot.
+
+    When the snapshot has never been built or its last rebuild is more than
+    max_age seconds old, a background rebuild is started and the current
+    rows are served meanwhile; until a first snapshot exists the figures
+    come from admin_stats(). The result also carries 'stats_as_of': when
+    the figures last changed (None for figures computed live).
+    """
+    rows, rebuilt_at = _snapshot_rows()
+    if rebuilt_at is None or (max_age is not None and datetime.utcnow() - rebuilt_at > timedelta(seconds=max_age)):
+        rebuild_in_background(current_app._get_current_object())
+    if rebuilt_at is None:
+        return dict(admin_stats(), stats_as_of=None)
+
+    def metric(name):
+        return {status: row for (row_metric, status), row in rows.items() if row_metric == name}
+
+    def count(name, status=None):
+        found = metric(name)
+        if status is not None:
+            return found[status].count if status in found else 0
+        return sum(row.count for row in found.values())
+
+    bills = {
+        status: {'count': row.count, 'commission': row.commission, 'amount': row.amount}
+        for status, row in metric('bill').items()
+    }
+    total_commission, pending_commission = commission_totals(bills)
+    updated = [row.updated_at for row in rows.values()]
+
+    return {
+        'total_users': count('user'),
+        'total_landlords': count('user', 'landlord'),
+        'total_tenants': count('user', 'tenant'),
+        'total_properties': count('property'),
+        'pending_verifications': count('pending_landlord'),
+        'pending_tickets': count('ticket', 'pending'),
+        'total_bookings': count('booking'),
+        'approved_bookings': count('booking', 'approved'),
+        'pending_bookings_count': count('booking', 'pending'),
+        'total_bills': count('bill'),
+        'paid_bills': count('bill', 'paid'),
+        'unpaid_bills': count('bill', 'unpaid'),
+        'total_commission': total_commission,
+        'pending_commission': pending_commission,
+        'stats_as_of': max(updated + [rebuilt_at]) if rebuilt_at else None,
+    }
+
+
+def _per_row_admin_stats():
+    """The former implementation: one COUNT per figure, bills summed in Python"""
+    paid = Billing.query.filter_by(status='paid').all()
+    unpaid = Billing.query.filter_by(status='unpaid').all()
+    return {
+        'total_users': User.query.count(),
+        'total_landlords': User.query.filter_by(role='landlord').count(),
+        'total_tenants': User.query.filter_by(role='tenant').count(),
+        'total_properties': Property.query.count(),
+        'pending_verifications': User.query.filter_by(role='landlord', is_approved_by_admin=False).count(),
+        'pending_tickets': HelpSupport.query.filter_by(status='pending').count(),
+        'total_bookings': Booking.query.count(),
+        'approved_bookings': Booking.query.filter_by(status='approved').count(),
+        'pending_bookings_count': Booking.query.filter_by(status='pending').count(),
+        'total_bills': Billing.query.count(),
+        'paid_bills': Billing.query.filter_by(status='paid').count(),
+        'unpaid_bills': Billing.query.filter_by(status='unpaid').count(),
+        'total_commission': sum(bill.admin_commission or 0 for bill in paid),
+        'pending_commission': sum(bill.amount * PENDING_COMMISSION_RATE for bill in unpaid),
+    }
+
+
+def benchmark_admin_stats(repeats=5):
+    """Mean seconds per call of the per-row and the grouped implementation.
+
+    Returns {'per_row': s, 'grouped': s, 'match': bool}. Sessions are
+    cleared between calls so no loaded rows are reused.
+    """
+    timings = {}
+    results = {}
+    for name, func in (('per_row', _per_row_admin_stats), ('grouped', admin_stats)):
+        started = time.perf_counter()
+        for _ in range(repeats):
+            results[name] = func()
+            db.session.remove()
+        timings[name] = (time.perf_counter() - started) / repeats
+    per_row, grouped = results['per_row'], results['grouped']
+    timings['match'] = all(abs(per_row[key] - grouped[key]) < 0.01 for key in grouped)
+    return timings
@@ -0,0 +1,359 @@
+"""Storage backends for uploaded files.
+
+Uploads are always spooled into UPLOAD_FOLDER first (the form parser and
+the variant builder need a local file). The configured backend then owns
+them:
+
+- LocalStorage keeps them in UPLOAD_FOLDER, served by the static route.
+- S3Storage copies them to an S3-compatible bucket (AWS S3, MinIO, R2, ...)
+  on a background thread and serves them from the bucket through a public
+  base URL or presigned GET URLs, so web workers never proxy image bytes
+  and every node sees the same files.
+
+Select with STORAGE_BACKEND=local|s3; see init_storage for the S3 settings.
+"""
+import mimetypes
+import os
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from threading import Lock, Timer
+
+from flask import current_app, url_for
+
+try:
+    import boto3
+    from botocore.exceptions import ClientError
+except ImportError:  # boto3 is only needed for the S3 backend
+    boto3 = None
+    ClientError = Exception
+
+
+# Placeholders shipped in static/uploads; never stored in or deleted from a backend
+STATIC_FILES = {'default.jpg', 'property-placeholder.jpg'}
+
+# Blob and variant names are content-addressed, so their bytes never change
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# Seconds before a failed S3 upload is retried, doubling up to the maximum
+UPLOAD_RETRY_DELAY = 5
+UPLOAD_RETRY_MAX_DELAY = 300
+
+
+def _static_url(name):
+    return url_for('static', filename='uploads/' + name)
+
+
+def _copy_outcome(source, target):
+    """Complete target with the result or exception of a finished future"""
+    error = source.exception()
+    if error is not None:
+        target.set_exception(error)
+    else:
+        target.set_result(source.result())
+
+
+def _not_found(error):
+    return getattr(error, 'response', {}).get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound')
+
+
+class LocalStorage:
+    """Uploads kept in the local uploads folder and served as static files"""
+
+    name = 'local'
+
+    def __init__(self, root):
+        self.root = root
+
+    def _path(self, name):
+        return os.path.join(self.root, name)
+
+    def exists(self, name):
+        return os.path.exists(self._path(name))
+
+    def touch(self, name):
+        """Mark a stored file as stored again now; False if it does not exist"""
+        try:
+            os.utime(self._path(name))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def modified(self, name):
+        """Modified timestamp of a stored file, or None if it does not exist"""
+        try:
+            return os.path.getmtime(self._path(name))
+        except FileNotFoundError:
+            return None
+
+    def put_file(self, name, path):
+        """Take ownership of a local file (it is moved, not copied)"""
+        target = self._path(name)
+        if os.path.abspath(path) != os.path.abspath(target):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(path, target)
+
+    def delete(self, name):
+        try:
+            os.remove(self._path(name))
+        except FileNotFoundError:
+            pass
+
+    def list_files(self):
+        """(name, modified timestamp) of every stored file, spool files excluded"""
+        for root, _, files in os.walk(self.root):
+            for filename in files:
+                if filename.startswith('.'):
+                    continue
+                path = os.path.join(root, filename)
+                name = os.path.relpath(path, self.root).replace(os.sep, '/')
+                yield name, os.path.getmtime(path)
+
+    @contextmanager
+    def local_copy(self, name):
+        """Path of a readable local copy of a stored file"""
+        yield self._path(name)
+
+    def url(self, name):
+        return _static_url(name)
+
+
+class S3Storage:
+    """Uploads kept in an S3-compatible bucket.
+
+    put_file and delete return immediately; the transfer runs on a small
+    thread pool. Until its upload finishes a file is still served from the
+    local spool copy, after which the spool copy is removed. Failed uploads
+    are retried with a growing delay until they succeed or the file is
+    deleted. delete returns a Future that raises if the deletion failed.
+    """
+
+    name = 's3'
+
+    def __init__(self, bucket, spool_dir, client=None, prefix='uploads/',
+                 public_url=None, url_expiry=3600, workers=4, **client_options):
+        if client is None:
+            if boto3 is None:
+                raise RuntimeError("STORAGE_BACKEND=s3 requires boto3 (pip install boto3)")
+            client = boto3.client('s3', **client_options)
+        self.client = client
+        self.bucket = bucket
+        self.spool_dir = spool_dir
+        self.prefix = prefix
+        self.public_url = public_url.rstrip('/') if public_url else None
+        self.url_expiry = url_expiry
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='storage')
+        self._pending = {}  # name -> Future completed once its upload succeeds
+        self._discarded = set()  # pending names deleted before their upload finished
+        self._urls = {}  # name -> (presigned url, reuse until)
+        self._lock = Lock()
+
+    def _key(self, name):
+        return self.prefix + name
+
+    def _spool_path(self, name):
+        return os.path.join(self.spool_dir, name)
+
+    def exists(self, name):
+        with self._lock:
+            if name in self._pending:
+                return True
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self._key(name))
+            return True
+        except ClientError as e:
+            if _not_found(e):
+                return False
+            raise
+
+    def touch(self, name):
+        """Mark a stored file as stored again now; False if it does not exist.
+
+        The object is copied onto itself, which resets its LastModified.
+        """
+        with self._lock:
+            if name in self._pending:
+                return True  # Its upload has not finished, so it is fresh anyway
+        try:
+            self.client.copy_object(
+                Bucket=self.bucket, Key=self._key(name),
+                CopySource={'Bucket': self.bucket, 'Key': self._key(name)},
+                MetadataDirective='REPLACE',
+                ContentType=mimetypes.guess_type(name)[0] or 'application/octet-stream',
+                CacheControl=IMMUTABLE_CACHE_CONTROL,
+            )
+            return True
+        except ClientError as e:
+            if _not_found(e):
+                return False
+            raise
+
+    def modified(self, name):
+        """Modified timestamp of a stored file, or None if it does not exist"""
+        with self._lock:
+            if name in self._pending:
+                return time.time()
+        try:
+            head = self.client.head_object(Bucket=self.bucket, Key=self._key(name))
+        except ClientError as e:
+            if _not_found(e):
+                return None
+            raise
+        return head['LastModified'].timestamp()
+
+    def put_file(self, name, path):
+        """Queue the upload of a local file, which is removed once stored"""
+        spool = self._spool_path(name)
+        if os.path.abspath(path) != os.path.abspath(spool):
+            os.makedirs(os.path.dirname(spool), exist_ok=True)
+            os.replace(path, spool)
+        with self._lock:
+            if name in self._pending:
+                return
+            self._pending[name] = Future()
+        self._executor.submit(self._upload, name, spool, UPLOAD_RETRY_DELAY)
+
+    def _upload(self, name, spool, retry_delay):
+        with self._lock:
+            discarded = name in self._discarded
+        if not discarded:
+            try:
+                content_type = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+                self.client.upload_file(spool, self.bucket, self._key(name), ExtraArgs={
+                    'ContentType': content_type,
+                    'CacheControl': IMMUTABLE_CACHE_CONTROL,
+                })
+            except Exception as e:
+                # Keep serving the spool copy and requeue the upload
+                print(f"❌ [STORAGE] Upload of {name} failed, retrying in {retry_delay}s: {e}")
+                retry = Timer(retry_delay, self._executor.submit, (
+                    self._upload, name, spool, min(retry_delay * 2, UPLOAD_RETRY_MAX_DELAY)
+                ))
+                retry.daemon = True
+                retry.start()
+                return
+            if os.path.exists(spool):
+                os.remove(spool)
+        with self._lock:
+            self._discarded.discard(name)
+            uploaded = self._pending.pop(name)
+        uploaded.set_result(None)
+
+    def delete(self, name):
+        """Queue the deletion of a stored file; returns a Future that raises if it fails"""
+        with self._lock:
+            self._urls.pop(name, None)
+            pending = self._pending.get(name)
+            if pending is not None:
+                # Stop retrying a failed upload of the file
+                self._discarded.add(name)
+        if pending is None:
+            return self._executor.submit(self._delete, name)
+        # Never let an in-flight upload resurrect the object
+        deleted = Future()
+        pending.add_done_callback(
+            lambda _: self._executor.submit(self._delete, name).add_done_callback(
+                lambda result: _copy_outcome(result, deleted)
+            )
+        )
+        return deleted
+
+    def _delete(self, name):
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(name))
+        spool = self._spool_path(name)
+        if os.path.exists(spool):
+            os.remove(spool)
+
+    def list_files(self):
+        """(name, modified timestamp) of every object under the prefix"""
+        paginator = self.client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix):
+            for obj in page.get('Contents', []):
+                yield obj['Key'][len(self.prefix):], obj['LastModified'].timestamp()
+
+    @contextmanager
+    def local_copy(self, name):
+        """Path of a private local copy: a hard link to the spool file, or a download"""
+        os.makedirs(self.spool_dir, exist_ok=True)
+        ext = os.path.splitext(name)[1]
+        path = os.path.join(self.spool_dir, f".read-{uuid.uuid4().hex}{ext}")
+        try:
+            try:
+                os.link(self._spool_path(name), path)
+            except OSError:
+                self.client.download_file(self.bucket, self._key(name), path)
+            yield path
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def url(self, name):
+        with self._lock:
+            if name in self._pending:
+                return _static_url(name)
+            if self.public_url:
+                return f"{self.public_url}/{self._key(name)}"
+            cached = self._urls.get(name)
+            if cached and cached[1] > time.time():
+                return cached[0]
+        url = self.client.generate_presigned_url(
+            'get_object',
+            Params={'Bucket': self.bucket, 'Key': self._key(name)},
+            ExpiresIn=self.url_expiry,
+        )
+        with self._lock:
+            # Reuse each signature for half its lifetime so browsers can cache the image
+            self._urls[name] = (url, time.time() + self.url_expiry / 2)
+        return url
+
+
+def init_storage(app):
+    """Create the storage backend from the environment and attach it to app"""
+    backend = os.environ.get('STORAGE_BACKEND', 'local').lower()
+    if backend == 's3':
+        client_options = {
+            'endpoint_url': os.environ.get('S3_ENDPOINT_URL') or None,
+            'region_name': os.environ.get('S3_REGION') or None,
+        }
+        storage = S3Storage(
+            os.environ['S3_BUCKET'],
+            app.config['UPLOAD_FOLDER'],
+            prefix=os.environ.get('S3_PREFIX', 'uploads/'),
+            public_url=os.environ.get('S3_PUBLIC_URL'),
+            url_expiry=int(os.environ.get('S3_URL_EXPIRY', 3600)),
+            **client_options,
+        )
+    else:
+        storage = LocalStorage(app.config['UPLOAD_FOLDER'])
+    app.extensions['upload_storage'] = storage
+    return storage
+
+
+def get_storage():
+    """The storage backend of the current app"""
+    return current_app.extensions['upload_storage']
+
+
+def upload_url(name):
+    """Browser URL of a stored upload (or of a shipped placeholder)"""
+    if name in STATIC_FILES:
+        return _static_url(name)
+    return get_storage().url(name)
+
+
+def push_local_uploads(storage, upload_folder, names):
+    """Queue every local file in names that the backend does not have yet.
+
+    Used when moving an existing deployment from local disk to S3: run
+    with STORAGE_BACKEND=s3 on the node that holds the files. Each local
+    copy is removed once its upload succeeds. Returns the files queued.
+    """
+    queued = 0
+    for name in names:
+        path = os.path.join(upload_folder, name)
+        if name in STATIC_FILES or not os.path.exists(path) or storage.exists(name):
+            continue
+        storage.put_file(name, path)
+        queued += 1
+    return queued
@@ -0,0 +1,55 @@
+"""Shared test setup: the app runs against a throwaway SQLite database"""
+import itertools
+import os
+import sys
+import tempfile
+
+import pytest
+from werkzeug.security import generate_password_hash
+
+_db_dir = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+os.environ.setdefault('SECRET_KEY', 'test')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app as flask_app  # noqa: E402
+from models import db, User, Property  # noqa: E402
+
+_ids = itertools.count(1)
+
+
+@pytest.fixture
+def app_context():
+    with flask_app.app_context():
+        yield
+        db.session.rollback()
+
+
+@pytest.fixture
+def make_user():
+    """Create and commit a user with a unique email; password is 'pw'"""
+    def make(role='tenant', **fields):
+        number = next(_ids)
+        fields.setdefault('name', f'User {number}')
+        user = User(email=f'user{number}@example.com', password_hash=generate_password_hash('pw'),
+                    role=role, is_verified=True, is_approved_by_admin=True, **fields)
+        db.session.add(user)
+        db.session.commit()
+        return user
+    return make
+
+
+@pytest.fixture
+def make_property(make_user):
+    """Create and commit a property (with a new landlord unless one is given)"""
+    def make(landlord=None, **fields):
+        landlord = landlord or make_user('landlord')
+        fields.setdefault('title', 'Room')
+        fields.setdefault('price', 3000)
+        fields.setdefault('slots', 3)
+        prop = Property(description='A room', location='Manila', property_type='dorm',
+                        landlord_id=landlord.id, **fields)
+        db.session.add(prop)
+        db.session.commit()
+        return prop
+    return make
@@ -0,0 +1,23 @@
+"""Facet counts are cached per listing stamp"""
+from datetime import date
+
+from werkzeug.datastructures import MultiDict
+
+from facets import get_facet_counts
+from listings import parse_listing_filters
+from models import db, Booking, subtract_bookings
+
+
+def test_bulk_booking_delete_refreshes_cached_availability(app_context, make_user, make_property):
+    prop = make_property(slots=1)
+    db.session.add(Booking(property_id=prop.id, tenant_id=make_user().id, status='approved',
+                           start_date=date(2026, 1, 1), end_date=date(2026, 2, 1)))
+    db.session.commit()
+    filters = parse_listing_filters(MultiDict())
+    assert get_facet_counts(filters, landlord_id=prop.landlord_id)['availability'] == {'available': 0, 'full': 1}
+
+    # Query.delete() fires no mapper events; the stamp still moves
+    subtract_bookings(Booking.property_id == prop.id)
+    Booking.query.filter_by(property_id=prop.id).delete(synchronize_session=False)
+    db.session.commit()
+    assert get_facet_counts(filters, landlord_id=prop.landlord_id)['availability'] == {'available': 1, 'full': 0}
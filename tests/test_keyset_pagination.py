@@ -0,0 +1,67 @@
+"""Keyset pagination of /api/properties"""
+import base64
+import json
+
+import pytest
+
+from app import app
+from listings import encode_cursor
+
+
+def _client(email):
+    client = app.test_client()
+    response = client.post('/login', data={'email': email, 'password': 'pw'})
+    assert response.status_code == 302
+    return client
+
+
+def _raw_cursor(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+
+
+@pytest.fixture
+def landlord(app_context, make_user):
+    return make_user('landlord')
+
+
+@pytest.mark.parametrize('sort, cursor', [
+    ('price-low', 'not a cursor'),
+    ('price-low', _raw_cursor('price-low')),
+    ('price-low', _raw_cursor(['price-low', '1000', 1])),
+    ('price-low', _raw_cursor(['price-low', True, 1])),
+    ('price-low', _raw_cursor(['price-low', 1000, '1'])),
+    ('price-low', _raw_cursor(['price-low', 1000, True])),
+    ('newest', _raw_cursor(['newest', 'yesterday', 1])),
+    ('newest', _raw_cursor(['newest', 1000, 1])),
+])
+def test_malformed_cursors_are_rejected(landlord, sort, cursor):
+    response = _client(landlord.email).get('/api/properties', query_string={'sort': sort, 'cursor': cursor})
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Malformed cursor'
+
+
+def test_cursor_from_another_sort_is_rejected(landlord):
+    cursor = encode_cursor('price-high', 1000, 1)
+    response = _client(landlord.email).get('/api/properties', query_string={'sort': 'price-low', 'cursor': cursor})
+    assert response.status_code == 400
+    assert 'sort' in response.get_json()['error']
+
+
+@pytest.mark.parametrize('sort, descending', [('price-low', False), ('price-high', True)])
+def test_pages_neither_repeat_nor_skip_rows_across_price_ties(landlord, make_property, sort, descending):
+    properties = [make_property(landlord=landlord, price=price) for price in (1000, 2000, 1000, 2000, 1000, 2000, 2000)]
+    client = _client(landlord.email)
+
+    seen, cursor = [], None
+    while True:
+        query = {'sort': sort, 'limit': 2}
+        if cursor:
+            query['cursor'] = cursor
+        page = client.get('/api/properties', query_string=query).get_json()
+        seen.extend(item['id'] for item in page['items'])
+        cursor = page['next_cursor']
+        if not cursor:
+            break
+
+    expected = sorted(properties, key=lambda prop: (prop.price, prop.id), reverse=descending)
+    assert seen == [prop.id for prop in expected]
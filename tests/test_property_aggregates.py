@@ -0,0 +1,109 @@
+"""Property aggregate columns kept by the Booking and Review mapper events"""
+from datetime import date
+
+from models import db, Booking, Property, Review, subtract_bookings
+
+
+def _aggregates(property_id):
+    prop = db.session.get(Property, property_id)
+    db.session.refresh(prop)
+    return {
+        'approved_booking_count': prop.approved_booking_count,
+        'review_count': prop.review_count,
+        'rating_sum': prop.rating_sum,
+        **{f'rating_{stars}': getattr(prop, f'rating_{stars}_count') for stars in range(1, 6)},
+    }
+
+
+def _expected(property_id):
+    """The aggregates recomputed from the booking and review tables"""
+    ratings = [rating for (rating,) in db.session.query(Review.rating).filter_by(property_id=property_id)]
+    return {
+        'approved_booking_count': Booking.query.filter_by(property_id=property_id, status='approved').count(),
+        'review_count': len(ratings),
+        'rating_sum': sum(ratings),
+        **{f'rating_{stars}': ratings.count(stars) for stars in range(1, 6)},
+    }
+
+
+def _booking(prop, tenant, status='pending'):
+    booking = Booking(property_id=prop.id, tenant_id=tenant.id, status=status,
+                      start_date=date(2026, 1, 1), end_date=date(2026, 2, 1))
+    db.session.add(booking)
+    db.session.commit()
+    return booking
+
+
+def test_booking_status_changes_on_expired_instances(app_context, make_user, make_property):
+    prop, tenant = make_property(), make_user()
+    booking = _booking(prop, tenant)
+    assert _aggregates(prop.id)['approved_booking_count'] == 0
+
+    # commit() expired the instance, so the change has no loaded old value
+    booking.status = 'approved'
+    db.session.commit()
+    assert _aggregates(prop.id)['approved_booking_count'] == 1
+
+    booking.status = 'rejected'
+    db.session.commit()
+    assert _aggregates(prop.id)['approved_booking_count'] == 0
+
+    booking.status = 'approved'
+    db.session.commit()
+    db.session.delete(booking)
+    db.session.commit()
+    assert _aggregates(prop.id) == _expected(prop.id)
+
+
+def test_booking_moved_between_properties(app_context, make_user, make_property):
+    first, second, tenant = make_property(), make_property(), make_user()
+    booking = _booking(first, tenant, status='approved')
+
+    booking.property_id = second.id
+    db.session.commit()
+    assert _aggregates(first.id)['approved_booking_count'] == 0
+    assert _aggregates(second.id)['approved_booking_count'] == 1
+
+
+def test_review_edits_on_expired_instances(app_context, make_user, make_property):
+    prop, tenant = make_property(), make_user()
+    review = Review(property_id=prop.id, tenant_id=tenant.id, rating=5, comment='Great')
+    db.session.add(review)
+    db.session.commit()
+
+    review.rating = 2
+    db.session.commit()
+    assert _aggregates(prop.id) == _expected(prop.id)
+    assert _aggregates(prop.id)['rating_2'] == 1
+
+    db.session.delete(review)
+    db.session.commit()
+    aggregates = _aggregates(prop.id)
+    assert aggregates == _expected(prop.id)
+    assert aggregates['rating_sum'] == 0 and aggregates['rating_5'] == 0
+
+
+def test_review_moved_between_properties(app_context, make_user, make_property):
+    first, second, tenant = make_property(), make_property(), make_user()
+    review = Review(property_id=first.id, tenant_id=tenant.id, rating=4, comment='Good')
+    db.session.add(review)
+    db.session.commit()
+
+    review.property_id = second.id
+    db.session.commit()
+    assert _aggregates(first.id) == _expected(first.id)
+    assert _aggregates(second.id) == _expected(second.id)
+    assert _aggregates(second.id)['rating_4'] == 1
+
+
+def test_bulk_booking_delete_is_subtracted(app_context, make_user, make_property):
+    prop, tenant = make_property(), make_user()
+    for status in ('approved', 'approved', 'pending'):
+        _booking(prop, tenant, status=status)
+    revision = db.session.get(Property, prop.id).revision
+
+    subtract_bookings(Booking.tenant_id == tenant.id)
+    Booking.query.filter_by(tenant_id=tenant.id).delete()
+    db.session.commit()
+    assert _aggregates(prop.id) == _expected(prop.id)
+    assert db.session.get(Property, prop.id).revision > revision
@@ -0,0 +1,86 @@
+"""Query budget of the property detail page.
+
+The page is built from a fixed set of queries whatever the number of
+reviews or images (see property_detail in app.py). The budgets below count
+every statement sent to the database, including the login user lookup.
+"""
+import threading
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+from werkzeug.security import generate_password_hash
+
+from app import app
+from models import db, User, Property, PropertyImage, Review, Booking
+
+# Property with owner, amenities, images, reviews
+ANONYMOUS_BUDGET = 4
+# ... plus the login user lookup
+LANDLORD_BUDGET = 5
+# ... plus the tenant's own bookings and review
+TENANT_BUDGET = 7
+
+
+@pytest.fixture(scope='module')
+def property_id():
+    with app.app_context():
+        landlord = User(name='Landlord', email='landlord@example.com', password_hash=generate_password_hash('pw'),
+                        role='landlord', is_verified=True, is_approved_by_admin=True)
+        tenant = User(name='Tenant', email='tenant@example.com', password_hash=generate_password_hash('pw'),
+                      role='tenant', is_verified=True)
+        db.session.add_all([landlord, tenant])
+        db.session.flush()
+        prop = Property(title='Room', description='A room', price=3000, location='Manila',
+                        property_type='dorm', slots=3, landlord_id=landlord.id)
+        db.session.add(prop)
+        db.session.flush()
+        for i in range(15):
+            reviewer = User(name=f'Reviewer {i}', email=f'reviewer{i}@example.com', password_hash='x', role='tenant')
+            db.session.add(reviewer)
+            db.session.flush()
+            db.session.add(Review(property_id=prop.id, tenant_id=reviewer.id, rating=4, comment='Nice'))
+            db.session.add(PropertyImage(property_id=prop.id, filename=f'image{i}.jpg'))
+        db.session.add(Booking(property_id=prop.id, tenant_id=tenant.id, status='approved',
+                               start_date=date(2026, 1, 1), end_date=date(2026, 2, 1)))
+        db.session.commit()
+        return prop.id
+
+
+def _client(email=None):
+    client = app.test_client()
+    if email:
+        response = client.post('/login', data={'email': email, 'password': 'pw'})
+        assert response.status_code == 302
+    return client
+
+
+def _count_queries(client, url):
+    """(response, statements run by this thread while serving url)"""
+    statements = []
+    thread = threading.get_ident()
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        # The view counter flushes from its own thread
+        if threading.get_ident() == thread:
+            statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', count)
+    try:
+        response = client.get(url)
+    finally:
+        event.remove(engine, 'before_cursor_execute', count)
+    return response, statements
+
+
+@pytest.mark.parametrize('email, budget', [
+    (None, ANONYMOUS_BUDGET),
+    ('landlord@example.com', LANDLORD_BUDGET),
+    ('tenant@example.com', TENANT_BUDGET),
+])
+def test_property_detail_query_budget(property_id, email, budget):
+    response, statements = _count_queries(_client(email), f'/property_detail/{property_id}')
+    assert response.status_code == 200
+    assert len(statements) <= budget, '\n'.join(statements)
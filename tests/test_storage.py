@@ -0,0 +1,188 @@
+"""S3Storage against an in-process stub of the S3 client.
+
+The stub implements the handful of client calls the backend makes, so the
+upload queue, retries, deletions and presigned URLs run without boto3 or
+network access.
+"""
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+import storage as storage_module
+from app import app
+from filegc import sweep_orphans
+from storage import ClientError, S3Storage
+
+
+def _client_error(code, operation):
+    response = {'Error': {'Code': code}}
+    error = ClientError(response, operation)
+    error.response = response
+    return error
+
+
+class StubS3Client:
+    """Objects kept in memory; uploads and deletes can be made to fail"""
+
+    def __init__(self):
+        self.objects = {}  # key -> {'body', 'LastModified', 'ContentType', 'CacheControl'}
+        self.upload_failures = 0
+        self.failing_deletes = set()
+        self.upload_gate = threading.Event()
+        self.upload_gate.set()
+        self.signatures = 0
+
+    def upload_file(self, path, bucket, key, ExtraArgs=None):
+        self.upload_gate.wait(5)
+        if self.upload_failures:
+            self.upload_failures -= 1
+            raise _client_error('500', 'PutObject')
+        with open(path, 'rb') as f:
+            self.objects[key] = {'body': f.read(), 'LastModified': datetime.now(timezone.utc), **(ExtraArgs or {})}
+
+    def head_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise _client_error('404', 'HeadObject')
+        return {'LastModified': self.objects[Key]['LastModified']}
+
+    def copy_object(self, Bucket, Key, CopySource, MetadataDirective, **metadata):
+        if CopySource['Key'] not in self.objects:
+            raise _client_error('NoSuchKey', 'CopyObject')
+        source = self.objects[CopySource['Key']]
+        self.objects[Key] = {'body': source['body'], 'LastModified': datetime.now(timezone.utc), **metadata}
+
+    def delete_object(self, Bucket, Key):
+        if Key in self.failing_deletes:
+            raise _client_error('503', 'DeleteObject')
+        self.objects.pop(Key, None)
+
+    def download_file(self, bucket, key, path):
+        with open(path, 'wb') as f:
+            f.write(self.objects[key]['body'])
+
+    def generate_presigned_url(self, operation, Params, ExpiresIn):
+        self.signatures += 1
+        return f"https://bucket.test/{Params['Key']}?signature={self.signatures}"
+
+    def get_paginator(self, operation):
+        client = self
+
+        class Paginator:
+            def paginate(self, Bucket, Prefix):
+                yield {'Contents': [{'Key': key, 'LastModified': obj['LastModified']}
+                                    for key, obj in client.objects.items() if key.startswith(Prefix)]}
+        return Paginator()
+
+
+@pytest.fixture
+def client():
+    return StubS3Client()
+
+
+@pytest.fixture
+def s3(client, tmp_path):
+    return S3Storage('bucket', str(tmp_path), client=client)
+
+
+def _spool(tmp_path, name, body=b'\xff\xd8\xffimage'):
+    path = tmp_path / f".upload-{name}.tmp"
+    path.write_bytes(body)
+    return str(path)
+
+
+def _wait_uploaded(s3, name):
+    pending = s3._pending.get(name)
+    if pending is not None:
+        pending.result(timeout=5)
+
+
+def test_put_file_uploads_and_removes_the_spool_copy(s3, client, tmp_path):
+    client.upload_gate.clear()
+    s3.put_file('a.jpg', _spool(tmp_path, 'a'))
+    with app.test_request_context():
+        # Served from the spool copy until the upload finishes
+        assert s3.exists('a.jpg')
+        assert s3.url('a.jpg') == '/static/uploads/a.jpg'
+        client.upload_gate.set()
+        _wait_uploaded(s3, 'a.jpg')
+        assert s3.url('a.jpg').startswith('https://bucket.test/uploads/a.jpg?')
+
+    stored = client.objects['uploads/a.jpg']
+    assert stored['body'] == b'\xff\xd8\xffimage'
+    assert stored['ContentType'] == 'image/jpeg'
+    assert stored['CacheControl'] == storage_module.IMMUTABLE_CACHE_CONTROL
+    assert not os.path.exists(tmp_path / 'a.jpg')
+
+
+def test_failed_uploads_are_retried(s3, client, tmp_path, monkeypatch):
+    monkeypatch.setattr(storage_module, 'UPLOAD_RETRY_DELAY', 0.01)
+    client.upload_failures = 2
+    s3.put_file('a.jpg', _spool(tmp_path, 'a'))
+    _wait_uploaded(s3, 'a.jpg')
+    assert 'uploads/a.jpg' in client.objects
+    assert client.upload_failures == 0
+
+
+def test_delete_returns_a_future_that_reports_failures(s3, client, tmp_path):
+    s3.put_file('a.jpg', _spool(tmp_path, 'a'))
+    s3.put_file('b.jpg', _spool(tmp_path, 'b'))
+    _wait_uploaded(s3, 'a.jpg')
+    _wait_uploaded(s3, 'b.jpg')
+    client.failing_deletes.add('uploads/b.jpg')
+
+    assert s3.delete('a.jpg').result(timeout=5) is None
+    assert 'uploads/a.jpg' not in client.objects
+    with pytest.raises(ClientError):
+        s3.delete('b.jpg').result(timeout=5)
+    assert 'uploads/b.jpg' in client.objects
+
+
+def test_delete_during_an_upload_waits_for_it(s3, client, tmp_path):
+    client.upload_gate.clear()
+    s3.put_file('a.jpg', _spool(tmp_path, 'a'))
+    deleted = s3.delete('a.jpg')
+    assert not deleted.done()
+    client.upload_gate.set()
+    deleted.result(timeout=5)
+    assert 'uploads/a.jpg' not in client.objects
+    assert not os.path.exists(tmp_path / 'a.jpg')
+
+
+def test_presigned_urls_are_reused_for_half_their_lifetime(client, tmp_path, monkeypatch):
+    s3 = S3Storage('bucket', str(tmp_path), client=client, url_expiry=100)
+    first = s3.url('a.jpg')
+    assert s3.url('a.jpg') == first
+
+    now = time.time()
+    monkeypatch.setattr(storage_module.time, 'time', lambda: now + 51)
+    assert s3.url('a.jpg') != first
+
+    public = S3Storage('bucket', str(tmp_path), client=client, public_url='https://cdn.test/')
+    assert public.url('a.jpg') == 'https://cdn.test/uploads/a.jpg'
+
+
+def test_touch_resets_the_modified_time(s3, client, tmp_path):
+    s3.put_file('a.jpg', _spool(tmp_path, 'a'))
+    _wait_uploaded(s3, 'a.jpg')
+    old = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    client.objects['uploads/a.jpg']['LastModified'] = old
+
+    assert s3.touch('a.jpg')
+    assert s3.modified('a.jpg') > old.timestamp()
+    assert client.objects['uploads/a.jpg']['CacheControl'] == storage_module.IMMUTABLE_CACHE_CONTROL
+    assert not s3.touch('missing.jpg')
+    assert s3.modified('missing.jpg') is None
+
+
+def test_sweep_counts_only_successful_deletions(app_context, s3, client, tmp_path, monkeypatch):
+    monkeypatch.setitem(app.extensions, 'upload_storage', s3)
+    old = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    for name in ('orphan-a.jpg', 'orphan-b.jpg'):
+        client.objects['uploads/' + name] = {'body': b'', 'LastModified': old}
+    client.failing_deletes.add('uploads/orphan-b.jpg')
+
+    assert sweep_orphans(str(tmp_path), min_age=60) == 1
+    assert set(client.objects) == {'uploads/orphan-b.jpg'}
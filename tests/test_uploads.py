@@ -0,0 +1,93 @@
+"""Streamed uploads: validation while parsing, spool cleanup and dedup"""
+import io
+import os
+
+import pytest
+from flask import request
+from werkzeug.datastructures import FileStorage
+
+from app import app
+from storage import LocalStorage
+from uploads import UploadStream, save_upload, upload_error
+
+JPEG = b'\xff\xd8\xff\xe0' + b'jpeg body' * 10
+PNG = b'\x89PNG\r\n\x1a\n' + b'png body' * 10
+
+
+@pytest.fixture
+def folder(tmp_path, monkeypatch):
+    monkeypatch.setitem(app.config, 'UPLOAD_FOLDER', str(tmp_path))
+    monkeypatch.setitem(app.config, 'MAX_UPLOAD_SIZE', 1024)
+    monkeypatch.setitem(app.extensions, 'upload_storage', LocalStorage(str(tmp_path)))
+    return tmp_path
+
+
+def _spool_files(folder):
+    return [name for name in os.listdir(folder) if name.startswith('.upload-')]
+
+
+def _upload(body, filename='photo.jpg'):
+    """Test request context with one file part parsed through UploadRequest"""
+    return app.test_request_context('/', method='POST', data={'file': (io.BytesIO(body), filename)},
+                                    content_type='multipart/form-data')
+
+
+@pytest.mark.parametrize('body, filename, error', [
+    (JPEG, 'photo.jpg', None),
+    (PNG, 'photo.png', None),
+    (JPEG + b'x' * 1024, 'photo.jpg', 'too_large'),
+    (b'GIF89a' + b'x' * 100, 'photo.jpg', 'not_an_image'),
+    (b'\xff\xd8', 'photo.jpg', 'not_an_image'),
+    (JPEG, 'photo.gif', 'type'),
+])
+def test_uploads_are_checked_while_parsing(folder, body, filename, error):
+    with _upload(body, filename):
+        file = request.files['file']
+        assert isinstance(file.stream, UploadStream)
+        assert upload_error(file) == error
+
+
+def test_rejected_uploads_leave_no_spool_files(folder):
+    with _upload(JPEG + b'x' * 4096):
+        file = request.files['file']
+        assert upload_error(file) == 'too_large'
+        # Nothing past the limit is kept on disk
+        assert os.path.getsize(file.stream.path) == 0
+        with pytest.raises(ValueError):
+            save_upload(file, str(folder))
+    assert _spool_files(folder) == []
+
+
+def test_unclaimed_uploads_are_removed_when_the_request_closes(folder):
+    with _upload(JPEG):
+        request.files['file']
+        assert len(_spool_files(folder)) == 1
+    assert _spool_files(folder) == []
+
+
+def test_identical_content_is_stored_once(folder):
+    names = []
+    for filename in ('first.jpg', 'second.JPEG'):
+        with _upload(JPEG, filename):
+            names.append(save_upload(request.files['file'], str(folder)))
+
+    assert names[0] == names[1]
+    assert names[0].endswith('.jpg')
+    assert sorted(os.listdir(folder)) == [names[0]]
+    with open(folder / names[0], 'rb') as f:
+        assert f.read() == JPEG
+
+
+def test_storing_existing_content_refreshes_the_blob(folder):
+    with _upload(JPEG):
+        name = save_upload(request.files['file'], str(folder))
+    os.utime(folder / name, (1, 1))
+    with _upload(JPEG):
+        assert save_upload(request.files['file'], str(folder)) == name
+    assert os.path.getmtime(folder / name) > 1
+
+
+def test_files_not_streamed_are_hashed_while_copied(app_context, folder):
+    name = save_upload(FileStorage(io.BytesIO(PNG), filename='legacy.png'), str(folder))
+    assert name.endswith('.png')
+    assert sorted(os.listdir(folder)) == [name]
@@ -0,0 +1,258 @@
+"""Content-addressed upload storage.
+
+Uploads are stored once per distinct content as <sha256>.<ext> in the
+uploads folder, so re-uploading the same photo writes nothing new. Blobs
+are shared: PropertyImage.filename, Property.image and the User image
+columns all reference them by name, and a blob (with its resized variants)
+is removed only when the last of those references is gone.
+
+File parts of multipart requests are streamed straight to a temporary file
+next to the blobs while the form is parsed (UploadRequest), with the size
+limit, the magic-byte check and the content hash applied chunk by chunk,
+so a request holds no more than one chunk per upload in memory.
+"""
+import hashlib
+import os
+import uuid
+
+from flask import Request, current_app
+
+from images import remove_image_files
+from storage import STATIC_FILES, get_storage
+from models import db, Property, PropertyImage, User, touch_properties
+
+
+CHUNK_SIZE = 64 * 1024
+
+# Normalized stored extension per uploaded extension
+EXTENSIONS = {'jpg': 'jpg', 'jpeg': 'jpg', 'png': 'png'}
+
+# Leading bytes of each accepted image type -> stored extension
+MAGIC_BYTES = {
+    b'\xff\xd8\xff': 'jpg',
+    b'\x89PNG\r\n\x1a\n': 'png',
+}
+MAGIC_LENGTH = max(len(magic) for magic in MAGIC_BYTES)
+
+# Shared placeholder files that are never deleted
+PROTECTED_FILES = STATIC_FILES
+
+# Every column that can reference an upload blob
+REFERENCE_COLUMNS = (
+    PropertyImage.filename,
+    Property.image,
+    User.profile_pic,
+    User.license_image,
+    User.trend_image,
+)
+
+
+def _extension(filename):
+    ext = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+    return EXTENSIONS.get(ext, ext or 'bin')
+
+
+def _sniff(head):
+    """Stored extension for content starting with head, or None"""
+    for magic, ext in MAGIC_BYTES.items():
+        if head.startswith(magic):
+            return ext
+    return None
+
+
+class UploadStream:
+    """Write target for one uploaded file while the request body is parsed.
+
+    Chunks go to a temporary file in the uploads folder and into a running
+    sha256. Once the part exceeds max_size or its first bytes are not a
+    JPEG/PNG signature, the rest of the part is discarded and `error` says
+    why. Unclaimed temporary files are removed when the request closes.
+    """
+
+    def __init__(self, upload_folder, max_size):
+        os.makedirs(upload_folder, exist_ok=True)
+        self.path = os.path.join(upload_folder, f".upload-{uuid.uuid4().hex}.tmp")
+        self.max_size = max_size
+        self.size = 0
+        self.head = b''
+        self.kind = None
+        self.error = None
+        self.digest = hashlib.sha256()
+        self._file = open(self.path, 'w+b')
+
+    def write(self, data):
+        if self.error:
+            return len(data)
+        self.size += len(data)
+        if self.size > self.max_size:
+            return self._reject('too_large', len(data))
+        if self.kind is None:
+            self.head += data[:MAGIC_LENGTH - len(self.head)]
+            if len(self.head) >= MAGIC_LENGTH:
+                self.kind = _sniff(self.head)
+                if self.kind is None:
+                    return self._reject('not_an_image', len(data))
+        self.digest.update(data)
+        return self._file.write(data)
+
+    def _reject(self, reason, length):
+        self.error = reason
+        self._file.truncate(0)
+        return length
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        # Called by the form parser once the part is complete
+        if self.kind is None and not self.error:
+            self.kind = _sniff(self.head)
+            if self.kind is None:
+                self._reject('not_an_image', 0)
+        return self._file.seek(offset, whence)
+
+    def claim(self):
+        """Hand the spooled file to the storage backend; returns its blob name"""
+        if self.error:
+            raise ValueError(f"Rejected upload cannot be stored: {self.error}")
+        self._file.close()
+        filename = f"{self.digest.hexdigest()}.{self.kind}"
+        _store(filename, self.path)
+        return filename
+
+    def close(self):
+        self._file.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def __getattr__(self, name):
+        if name == '_file':
+            raise AttributeError(name)
+        return getattr(self._file, name)
+
+
+class UploadRequest(Request):
+    """Request class that streams uploaded files through UploadStream"""
+
+    # Non-file form fields are small; refuse to buffer large ones in memory
+    max_form_memory_size = 512 * 1024
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return UploadStream(current_app.config['UPLOAD_FOLDER'], current_app.config['MAX_UPLOAD_SIZE'])
+
+
+def upload_error(file):
+    """Why an upload is unacceptable ('type', 'too_large', 'not_an_image'), or None"""
+    if not getattr(file, 'filename', None) or '.' not in file.filename:
+        return 'type'
+    if file.filename.rsplit('.', 1)[1].lower() not in EXTENSIONS:
+        return 'type'
+    stream = file.stream
+    if isinstance(stream, UploadStream):
+        return stream.error
+    # Files not parsed through UploadRequest: measure and sniff in place
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(0)
+    head = stream.read(MAGIC_LENGTH)
+    stream.seek(0)
+    if size > current_app.config['MAX_UPLOAD_SIZE']:
+        return 'too_large'
+    if _sniff(head) is None:
+        return 'not_an_image'
+    return None
+
+
+def _store(filename, path):
+    """Give a spooled file to the storage backend unless the blob exists.
+
+    An existing blob is touched instead, so the orphan sweeper's grace
+    period starts over for the row about to reference it.
+    """
+    storage = get_storage()
+    if storage.touch(filename):
+        os.remove(path)
+    else:
+        storage.put_file(filename, path)
+
+
+def save_upload(file, upload_folder):
+    """Store an uploaded file by content hash; returns the stored filename.
+
+    Streamed uploads were already hashed and spooled during parsing and are
+    handed to the storage backend as they are. Other files are first hashed
+    while they are copied to a temporary file in upload_folder. Spooled
+    files of blobs the backend already has are discarded.
+    """
+    if isinstance(file.stream, UploadStream):
+        return file.stream.claim()
+
+    os.makedirs(upload_folder, exist_ok=True)
+    digest = hashlib.sha256()
+    tmp_path = os.path.join(upload_folder, f".upload-{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp_path, 'wb') as out:
+            file.stream.seek(0)
+            while True:
+                chunk = file.stream.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                out.write(chunk)
+
+        filename = f"{digest.hexdigest()}.{_extension(file.filename or '')}"
+        _store(filename, tmp_path)
+        return filename
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def deduplicate_uploads(upload_folder):
+    """Move legacy timestamp/uuid-named uploads to content-addressed names.
+
+    Every referenced file in upload_folder is hashed and handed to the
+    storage backend under its blob name; references are repointed to the
+    blob name, duplicate copies are deleted and stale variants are dropped so
+    build-image-variants can rebuild them. Returns (files renamed,
+    duplicate files removed).
+    """
+    names = set()
+    for column in REFERENCE_COLUMNS:
+        names.update(name for (name,) in db.session.query(column).filter(column.isnot(None)).distinct())
+
+    renamed = removed = 0
+    for name in sorted(names - PROTECTED_FILES):
+        path = os.path.join(upload_folder, name)
+        if not os.path.exists(path):
+            continue
+        blob = f"{_file_digest(path)}.{_extension(name)}"
+        if blob == name:
+            continue
+
+        for column in REFERENCE_COLUMNS:
+            values = {column.key: blob}
+            if column is PropertyImage.filename:
+                values['variants'] = db.null()
+            db.session.query(column.class_).filter(column == name).update(values, synchronize_session=False)
+        touch_properties(Property.id.in_(
+            db.select(PropertyImage.property_id).where(PropertyImage.filename == blob)
+        ))
+        for user in User.query.filter(User.image_variants.isnot(None)).all():
+            kept = {col: rec for col, rec in user.image_variants.items() if getattr(user, col) != blob}
+            if kept != user.image_variants:
+                user.image_variants = kept
+        db.session.commit()
+
+        if get_storage().exists(blob):
+            removed += 1
+        else:
+            renamed += 1
+        _store(blob, path)
+        remove_image_files(name)
+    return renamed, removed
@@ -0,0 +1,251 @@
+"""Buffered property view counting and view analytics.
+
+Views are counted in process per (property, day) and written back
+periodically: one ``UPDATE property SET view_count = view_count + n`` per
+property, plus an upsert into property_view_stat for the day, week and
+month buckets the views fall in. The detail page itself never writes to
+the database. Counts still buffered when the process dies are lost, which
+is acceptable for view statistics.
+"""
+import atexit
+import threading
+from collections import Counter
+from datetime import date, timedelta
+
+from sqlalchemy import bindparam
+
+from models import db, Property, PropertyViewStat
+
+
+# Seconds between background flushes
+DEFAULT_FLUSH_INTERVAL = 30
+
+# Most (property, day) buckets written back in one flush; the rest wait
+MAX_FLUSH_BATCH = 500
+
+# Default number of points in a dashboard series, per period
+SERIES_POINTS = {'day': 30, 'week': 12, 'month': 12}
+
+
+def _stat_upsert_statement():
+    """INSERT ... ON CONFLICT adding to views, or None if the dialect lacks it"""
+    dialect = db.engine.dialect.name
+    if dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        return None
+    stmt = insert(PropertyViewStat.__table__)
+    return stmt.on_conflict_do_update(
+        index_elements=['property_id', 'period', 'period_start'],
+        set_={'views': PropertyViewStat.__table__.c.views + stmt.excluded.views},
+    )
+
+
+def add_view_stats(rows):
+    """Add views to property_view_stat rows, creating missing ones.
+
+    rows is a list of dicts with property_id, period, period_start, views.
+    """
+    if not rows:
+        return
+    upsert = _stat_upsert_statement()
+    if upsert is not None:
+        db.session.execute(upsert, rows)
+        return
+
+    # Portable fallback: update existing buckets, insert the rest
+    table = PropertyViewStat.__table__
+    for row in rows:
+        result = db.session.execute(
+            table.update().where(
+                table.c.property_id == row['property_id'],
+                table.c.period == row['period'],
+                table.c.period_start == row['period_start'],
+            ).values(views=table.c.views + row['views'])
+        )
+        if not result.rowcount:
+            db.session.execute(table.insert().values(**row))
+
+
+def stat_rows_for(day_counts):
+    """Expand {(property_id, day): views} into day/week/month stat rows"""
+    buckets = Counter()
+    for (property_id, day), views in day_counts.items():
+        for period in PropertyViewStat.PERIODS:
+            buckets[(property_id, period, PropertyViewStat.bucket_start(day, period))] += views
+    return [
+        {'property_id': property_id, 'period': period, 'period_start': start, 'views': views}
+        for (property_id, period, start), views in buckets.items()
+    ]
+
+
+class ViewCounter:
+    """Thread-safe in-process buffer of pending view increments"""
+
+    def __init__(self, max_batch=MAX_FLUSH_BATCH):
+        self.max_batch = max_batch
+        self._pending = Counter()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+    def record(self, property_id, n=1, day=None):
+        """Count n views of a property (no database access)"""
+        with self._lock:
+            self._pending[(property_id, day or date.today())] += n
+
+    def pending(self, property_id=None):
+        """Buffered views for one property, or for all of them"""
+        with self._lock:
+            return sum(
+                views for (pid, _), views in self._pending.items()
+                if property_id is None or pid == property_id
+            )
+
+    def _take_batch(self):
+        with self._lock:
+            batch = dict(self._pending.most_common(self.max_batch))
+            for key in batch:
+                del self._pending[key]
+            return batch
+
+    def _restore(self, batch):
+        with self._lock:
+            self._pending.update(batch)
+
+    def flush(self):
+        """Write up to max_batch buffered buckets back; returns views written"""
+        batch = self._take_batch()
+        if not batch:
+            return 0
+
+        totals = Counter()
+        for (property_id, _), views in batch.items():
+            totals[property_id] += views
+
+        table = Property.__table__
+        stmt = table.update().where(table.c.id == bindparam('property_id')).values(
+            view_count=table.c.view_count + bindparam('views'),
+            # Views are not listing edits, so keep updated_at as it is
+            updated_at=table.c.updated_at,
+        )
+        try:
+            db.session.execute(stmt, [
+                {'property_id': property_id, 'views': views} for property_id, views in totals.items()
+            ])
+            # Views buffered for a property deleted since are dropped
+            existing = set(db.session.scalars(
+                db.select(table.c.id).where(table.c.id.in_(list(totals)))
+            ))
+            add_view_stats(stat_rows_for({
+                key: views for key, views in batch.items() if key[0] in existing
+            }))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            self._restore(batch)
+            raise
+        return sum(totals.values())
+
+    def flush_all(self):
+        """Flush batches until the buffer is empty"""
+        written = 0
+        while True:
+            views = self.flush()
+            if not views:
+                return written
+            written += views
+
+    def start(self, app, interval=DEFAULT_FLUSH_INTERVAL):
+        """Start the background flush thread (once per process)"""
+        if self._thread is not None:
+            return
+
+        def run():
+            while not self._stop.wait(interval):
+                with app.app_context():
+                    try:
+                        self.flush()
+                    except Exception as e:
+                        print(f"⚠️ [VIEWS] Flush failed, will retry: {e}")
+
+        self._thread = threading.Thread(target=run, name='view-counter-flush', daemon=True)
+        self._thread.start()
+
+        def flush_on_exit():
+            self._stop.set()
+            with app.app_context():
+                try:
+                    self.flush_all()
+                except Exception as e:
+                    print(f"⚠️ [VIEWS] Final flush failed: {e}")
+
+        atexit.register(flush_on_exit)
+
+
+view_counter = ViewCounter()
+
+
+def rebuild_view_rollups():
+    """Recompute week and month buckets from the day buckets.
+
+    Repairs rollups after day rows were edited or imported by hand.
+    Returns the number of rollup rows written.
+    """
+    days = db.session.query(
+        PropertyViewStat.property_id, PropertyViewStat.period_start, PropertyViewStat.views
+    ).filter(PropertyViewStat.period == 'day').all()
+
+    rows = [
+        row for row in stat_rows_for({(pid, day): views for pid, day, views in days})
+        if row['period'] != 'day'
+    ]
+    PropertyViewStat.query.filter(PropertyViewStat.period.in_(('week', 'month'))).delete(synchronize_session=False)
+    if rows:
+        db.session.execute(PropertyViewStat.__table__.insert(), rows)
+    db.session.commit()
+    return len(rows)
+
+
+def series_starts(period, points, today=None):
+    """The last `points` bucket start dates for a period, oldest first"""
+    current = PropertyViewStat.bucket_start(today or date.today(), period)
+    starts = [current]
+    for _ in range(points - 1):
+        if period == 'day':
+            current -= timedelta(days=1)
+        elif period == 'week':
+            current -= timedelta(weeks=1)
+        else:
+            current = (current - timedelta(days=1)).replace(day=1)
+        starts.append(current)
+    return starts[::-1]
+
+
+def view_series(property_ids, period='week', points=None):
+    """Views-over-time for several properties from one range query.
+
+    Returns (starts, {property_id: [views per bucket]}) with zero-filled
+    buckets, aligned to starts.
+    """
+    if period not in PropertyViewStat.PERIODS:
+        period = 'week'
+    starts = series_starts(period, points or SERIES_POINTS[period])
+    series = {pid: [0] * len(starts) for pid in property_ids}
+    if not property_ids:
+        return starts, series
+
+    position = {start: i for i, start in enumerate(starts)}
+    rows = db.session.query(
+        PropertyViewStat.property_id, PropertyViewStat.period_start, PropertyViewStat.views
+    ).filter(
+        PropertyViewStat.property_id.in_(property_ids),
+        PropertyViewStat.period == period,
+        PropertyViewStat.period_start >= starts[0],
+    ).all()
+    for pid, start, views in rows:
+        if start in position:
+            series[pid][position[start]] = views
+    return starts, series